@@ -0,0 +1,92 @@
+import math;
+import random;
+import threading;
+
+import Physics;
+
+# runs the same shots on several Python threads at once and checks that
+# every thread gets exactly the tables a single thread gets; segment() drops
+# the GIL, so the main thread keeps counting while the threads simulate
+
+THREADS = 4;
+SHOTS = 8;
+
+random.seed( 2750 );
+
+def rack( xvel, yvel ):
+    table = Physics.Table();
+    gap = Physics.BALL_DIAMETER + 4.0;
+    number = 1;
+    for row in range( 5 ):
+        for k in range( row + 1 ):
+            pos = Physics.Coordinate(
+                Physics.TABLE_WIDTH / 2.0 + (k - row / 2.0) * gap,
+                Physics.TABLE_WIDTH / 2.0 - row * math.sqrt(3.0) / 2.0 * gap );
+            table += Physics.StillBall( number, pos );
+            number += 1;
+
+    speed = math.sqrt( xvel * xvel + yvel * yvel );
+    pos = Physics.Coordinate( Physics.TABLE_WIDTH / 2.0,
+                              Physics.TABLE_LENGTH - Physics.TABLE_WIDTH / 2.0 );
+    vel = Physics.Coordinate( xvel, yvel );
+    acc = Physics.Coordinate( -xvel / speed * Physics.DRAG,
+                              -yvel / speed * Physics.DRAG );
+    table += Physics.RollingBall( 0, pos, vel, acc );
+    return table;
+
+def play( table ):
+    # every segment of the shot as text
+    result = [];
+    while table is not None:
+        result.append( str( table ) );
+        table = table.segment();
+    return result;
+
+shots = [ rack( random.uniform( -300.0, 300.0 ), -1500.0 )
+          for i in range( SHOTS ) ];
+expected = [ play( table ) for table in shots ];
+
+results = [ None ] * THREADS;
+
+def worker( n ):
+    results[n] = [ play( table ) for table in shots ];
+
+threads = [ threading.Thread( target=worker, args=(n,) )
+            for n in range( THREADS ) ];
+for thread in threads:
+    thread.start();
+
+ticks = 0;
+while any( thread.is_alive() for thread in threads ):
+    ticks += 1;
+
+for thread in threads:
+    thread.join();
+
+# this should print True for every thread
+for n in range( THREADS ):
+    print( n, results[n] == expected );
+
+# the main thread should have counted a lot while the shots ran
+print( "main thread ticks:", ticks );
+
+# the batch API gives the same answer on every thread too
+velocities = [ [ random.uniform( -300.0, 300.0 ), -1500.0 ]
+               for i in range( SHOTS ) ];
+batch = shots[0].simulate_batch( velocities, workers=1 );
+batches = [ None ] * THREADS;
+
+def batch_worker( n ):
+    batches[n] = shots[0].simulate_batch( velocities, workers=1 );
+
+threads = [ threading.Thread( target=batch_worker, args=(n,) )
+            for n in range( THREADS ) ];
+for thread in threads:
+    thread.start();
+for thread in threads:
+    thread.join();
+
+# this should print True for every thread
+for n in range( THREADS ):
+    print( n, all( batches[n][key].tobytes() == batch[key].tobytes()
+                   for key in batch ) );
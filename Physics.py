@@ -3,6 +3,12 @@ import sqlite3
 import os
 import math
 import copy
+import array
+import threading
+import hashlib
+import time
+import weakref
+from collections import OrderedDict
 
 BALL_DIAMETER = phylib.PHYLIB_BALL_DIAMETER
 HOLE_RADIUS = phylib.PHYLIB_HOLE_RADIUS
@@ -13,7 +19,20 @@ VEL_EPSILON = phylib.PHYLIB_VEL_EPSILON
 DRAG = phylib.PHYLIB_DRAG
 MAX_TIME = phylib.PHYLIB_MAX_TIME
 MAX_OBJECTS = phylib.PHYLIB_MAX_OBJECTS
+SOLVER_STEP = phylib.PHYLIB_SOLVER_STEP
+SOLVER_EVENT = phylib.PHYLIB_SOLVER_EVENT
 FRAME_RATE = 0.01
+FRAME_FIELDS = phylib.PHYLIB_FRAME_FIELDS
+STORAGE_ROWS = "rows"  # a Ball row per ball, linked through BallTable to TTable
+STORAGE_PACKED = "packed"  # a Frame row per table holding a STATE blob
+STORAGE_KEYFRAME = "keyframe"  # a Segment row per segment; frames are rolled on read
+POOL_SIZE = 8  # connections a ConnectionPool hands out at once
+BUSY_TIMEOUT = 30.0  # seconds a connection waits for a lock held by another
+CACHE_SHOTS = 1024  # shots a SimulationCache keeps in memory
+CACHE_QUANTUM = 0.001  # mm (and mm/s) positions are rounded to in a SimulationCache key
+# The phylib_stats counters Table.stats reads
+STATS_FIELDS = ("segments", "steps", "narrow", "stops", "still_bounces", "rolling_bounces",
+                "hole_bounces", "hcushion_bounces", "vcushion_bounces", "allocations", "seconds")
 HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
 <!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"
 "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">
@@ -41,6 +60,13 @@ BALL_COLOURS = [
     "LIGHTGREEN",
     "SANDYBROWN",
 ]
+BALL_COLOUR = "GRAY"  # balls numbered past BALL_COLOURS
+
+def ballColour(number):
+    """
+    The fill colour of ball number.
+    """
+    return BALL_COLOURS[number] if number < len(BALL_COLOURS) else BALL_COLOUR
 
 class Coordinate(phylib.phylib_coord):
     """
@@ -72,7 +98,7 @@ class StillBall(phylib.phylib_object):
         """
         Method to generate SVG representation of the still ball.
         """
-        return """ <circle cx="%d" cy="%d" r="%d" fill="%s" />\n""" % (self.obj.still_ball.pos.x, self.obj.still_ball.pos.y, 28.5, BALL_COLOURS[self.obj.still_ball.number])
+        return """ <circle cx="%d" cy="%d" r="%d" fill="%s" />\n""" % (self.obj.still_ball.pos.x, self.obj.still_ball.pos.y, 28.5, ballColour(self.obj.still_ball.number))
 
 class RollingBall(phylib.phylib_object):
     """
@@ -97,7 +123,7 @@ class RollingBall(phylib.phylib_object):
         """
         Method to generate SVG representation of the rolling ball.
         """
-        return """ <circle cx="%d" cy="%d" r="%d" fill="%s" />\n""" % (self.obj.rolling_ball.pos.x, self.obj.rolling_ball.pos.y, 28.5, BALL_COLOURS[self.obj.rolling_ball.number])
+        return """ <circle cx="%d" cy="%d" r="%d" fill="%s" />\n""" % (self.obj.rolling_ball.pos.x, self.obj.rolling_ball.pos.y, 28.5, ballColour(self.obj.rolling_ball.number))
 
 class Hole(phylib.phylib_object):
     """
@@ -162,19 +188,28 @@ class VCushion(phylib.phylib_object):
         """
         return """ <rect width="25" height="2750" x="%d" y="-25" fill="darkgreen" />\n""" % (self.obj.vcushion.x)
 
+# The Python class of each phylib object type, for Table.__getitem__
+OBJECT_CLASSES = {
+    phylib.PHYLIB_STILL_BALL: StillBall,
+    phylib.PHYLIB_ROLLING_BALL: RollingBall,
+    phylib.PHYLIB_HOLE: Hole,
+    phylib.PHYLIB_HCUSHION: HCushion,
+    phylib.PHYLIB_VCUSHION: VCushion,
+}
+
 class Table(phylib.phylib_table):
     """
     Pool table class.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=MAX_OBJECTS):
         """
         Table constructor method.
-        This method call the phylib_table constructor and sets the current
-        object index to -1.
+        This method call the phylib_table constructor.
+        capacity is the number of object slots to start with (cushions and
+        holes included); the table grows past it as objects are added.
         """
-        phylib.phylib_table.__init__(self)
-        self.current = -1
+        phylib.phylib_table.__init__(self, capacity)
 
     def __iadd__(self, other):
         """
@@ -189,21 +224,12 @@ class Table(phylib.phylib_table):
         """
         This method adds iterator support for the table.
         This allows you to write "for object in table:" to loop over all
-        the objects in the table.
-        """
-        return self
-
-    def __next__(self):
-        """
-        This provides the next object from the table in a loop.
+        the objects in the table, None for an empty slot.  Every loop gets
+        an iterator of its own, so loops can be nested and a table can be
+        walked by several threads at once.  Table.balls is quicker when
+        only the balls are wanted.
         """
-        self.current += 1  # increment the index to the next object
-        if self.current < MAX_OBJECTS:  # check if there are no more objects
-            return self[self.current]  # return the latest object
-
-        # if we get there then we have gone through all the objects
-        self.current = -1  # reset the index counter
-        raise StopIteration  # raise StopIteration to tell for loop to stop
+        return map(self.__getitem__, range(self.capacity))
 
     def __getitem__(self, index):
         """
@@ -213,20 +239,50 @@ class Table(phylib.phylib_table):
         the object type.
         """
         result = self.get_object(index)
-        if result == None:
-            return None
-        if result.type == phylib.PHYLIB_STILL_BALL:
-            result.__class__ = StillBall
-        if result.type == phylib.PHYLIB_ROLLING_BALL:
-            result.__class__ = RollingBall
-        if result.type == phylib.PHYLIB_HOLE:
-            result.__class__ = Hole
-        if result.type == phylib.PHYLIB_HCUSHION:
-            result.__class__ = HCushion
-        if result.type == phylib.PHYLIB_VCUSHION:
-            result.__class__ = VCushion
+        if result is not None:
+            result.__class__ = OBJECT_CLASSES[result.type]
         return result
 
+    def ball(self, number):
+        """
+        The ball numbered number, or None if it is not on the table.  The
+        table keeps the slot of each ball (see phylib_find_ball), so this
+        does not look through the table.
+        """
+        ball = phylib.phylib_table.ball(self, number)
+        if ball is not None:
+            ball.__class__ = OBJECT_CLASSES[ball.type]
+        return ball
+
+    def pocketed(self):
+        """
+        The numbers of the balls that were put on this table, or on the
+        table it was simulated or copied from, and have since been sunk.
+        """
+        return phylib.phylib_table.pocketed(self)
+
+    def stats(self):
+        """
+        The profile counters (see phylib_stats) of the segments that led
+        to this table, as a dict with the keys in STATS_FIELDS, or None if
+        phylib was built without them (make PROFILE=1 keeps them).
+        """
+        stats = phylib.phylib_table.stats(self)
+        if stats is None:
+            return None
+        return {name: getattr(stats, name) for name in STATS_FIELDS}
+
+    def balls(self):
+        """
+        The StillBalls and RollingBalls on the table in slot order, from one
+        call to phylib_table.balls (see phylib.i), which skips the empty
+        slots and the cushions and holes.
+        """
+        balls = phylib.phylib_table.balls(self)
+        for ball in balls:
+            ball.__class__ = OBJECT_CLASSES[ball.type]
+        return balls
+
     def __str__(self):
         """
         Returns a string representation of the table that matches
@@ -238,24 +294,74 @@ class Table(phylib.phylib_table):
             result += "  [%02d] = %s\n" % (i, obj)  # append object description
         return result  # return the string
 
-    def segment(self):
+    def segment(self, solver=SOLVER_STEP):
         """
         Calls the segment method from phylib.i (which calls the phylib_segment
         functions in phylib.c.
+        solver picks SOLVER_STEP (the fixed SIM_RATE stepper) or SOLVER_EVENT
+        (jumps straight to the next stop or collision).
         Sets the __class__ of the returned phylib_table object to Table
         to make it a Table object.
         """
 
-        result = phylib.phylib_table.segment(self)
+        result = phylib.phylib_table.segment(self, solver)
         if result:
             result.__class__ = Table
-            result.current = -1
+        return result
+
+    def frames(self, rate, count):
+        """
+        Returns the count frames of this table rolled forward rate seconds
+        apart as a Frames object.  The rows for every frame are computed in
+        one call to phylib_frames the first time they are needed; Table
+        objects are only built for the frames that are asked for.
+        """
+        return Frames(self, rate, count)
+
+    def simulate_batch(self, velocities, solver=SOLVER_STEP, workers=None):
+        """
+        Plays every (xvel, yvel) row of velocities as a cue strike from this
+        table in one call to phylib_simulate_batch, without building Table
+        objects or touching the database.  The table itself is not changed.
+        Returns a dict of NumPy arrays, indexed by shot and then by ball
+        number:
+          "position"      (shots, balls, 2) where each ball ends up, NaN if
+                          it is not on the table
+          "pocketed"      (shots, balls) True for balls sunk by the shot
+          "first_contact" (shots,) number of the first ball the cue ball
+                          hits, -1 if it hits none
+          "time"          (shots,) sim time until every ball has stopped
+        SOLVER_EVENT is much faster than the default SOLVER_STEP.
+        The shots are split over workers native threads, one per core when
+        workers is None; the results do not depend on the worker count.
+        """
+        import numpy
+
+        velocities = numpy.ascontiguousarray(velocities, dtype=numpy.float64).reshape(-1, 2)
+        shots = len(velocities)
+        balls = 1 + max((ball.obj.still_ball.number for ball in self.balls()), default=0)
+
+        result = {
+            "position": numpy.empty((shots, balls, 2), dtype=numpy.float64),
+            "pocketed": numpy.empty((shots, balls), dtype=numpy.bool_),
+            "first_contact": numpy.empty(shots, dtype=numpy.intc),
+            "time": numpy.empty(shots, dtype=numpy.float64),
+        }
+        phylib.phylib_table.simulate_batch(self, velocities, balls,
+                                           result["position"], result["pocketed"],
+                                           result["first_contact"], result["time"],
+                                           solver, workers or 0)
         return result
 
     def svg(self):
         """
         Method to generate SVG representation of the table.
+        A table with only the cushions and holes it was made with starts
+        from TABLE_SVG and formats just its balls, read in one call to
+        phylib_frames; others are drawn object by object.
         """
+        if self.fixture_count() == FIXTURES:
+            return svgFrames(phylib.phylib_table.frames(self, 0.0, 1), 1)[0]
         svg_string = HEADER
         for obj in self:
             if obj is not None:  # Add this check to handle None objects
@@ -264,8 +370,8 @@ class Table(phylib.phylib_table):
         return svg_string
     
     def roll( self, t ):
-        new = Table();
-        for ball in self:
+        new = Table( self.capacity );
+        for ball in self.balls():
             if isinstance( ball, RollingBall ):
                 # create4 a new ball with the same number as the old ball
                 new_ball = RollingBall( ball.obj.rolling_ball.number,
@@ -290,12 +396,7 @@ class Table(phylib.phylib_table):
         """
         Method to find the cue ball (ball number 0) in the table.
         """
-        for ball in self:
-            if isinstance(ball, StillBall) and ball.obj.still_ball.number == 0:
-                return ball
-            if isinstance(ball, RollingBall) and ball.obj.rolling_ball.number == 0:
-                return ball
-        return None
+        return self.ball(0)
     
     def copy_object(dest, src):
         if src is None:
@@ -322,22 +423,291 @@ class Table(phylib.phylib_table):
     
 
 
+# The cushions and holes phylib_new_table puts in every table, drawn once
+FIXTURES = 10
+TABLE_SVG = HEADER + "".join(obj.svg() for obj in Table() if obj is not None)
+# A ball's circle by number, for every number a ball can have (an unsigned
+# char in phylib), with only its position left to fill in
+BALL_SVG = [""" <circle cx="%%d" cy="%%d" r="%d" fill="%s" />\n""" % (28.5, ballColour(number)) for number in range(256)]
+
+def svgFrames(data, count):
+    """
+    The SVG of each of count frames of packed rows (see Table.frames),
+    which split evenly between the frames.
+    """
+    rows = memoryview(data).cast("d").tolist()
+    # every frame has the same balls, so the rows split evenly
+    size = len(rows) // count if count else 0
+    if size == 0:
+        return [TABLE_SVG + FOOTER] * count
+    frames = []
+    for i in range(0, size * count, size):
+        balls = [BALL_SVG[int(rows[j + 1])] % (rows[j + 2], rows[j + 3])
+                 for j in range(i, i + size, FRAME_FIELDS)]
+        frames.append(TABLE_SVG + "".join(balls) + FOOTER)
+    return frames
+
+class Frames:
+    """
+    The frames of one segment, as returned by Table.frames.
+    data holds FRAME_FIELDS packed doubles per ball per frame: frame,
+    ball number, x, y, vx, vy, with NaN velocity for still balls.
+    """
+
+    def __init__(self, start, rate, count, data=None, end=None):
+        self.start = start
+        self.rate = rate
+        self.count = count
+        self.packed = data
+        # the table the segment ends in, when it was simulated
+        self.end = end
+
+    @property
+    def data(self):
+        if self.packed is None:
+            self.packed = phylib.phylib_table.frames(self.start, self.rate, self.count)
+        return self.packed
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """
+        Builds the Table for frame index, the same table Table.roll gives.
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("frame index out of range")
+        table = phylib.phylib_table.roll_table(self.start, index * self.rate)
+        table.__class__ = Table
+        return table
+
+    def time(self, index):
+        return self.start.time + index * self.rate
+
+    def svg(self):
+        """
+        The SVG of every frame, the same as Table.svg of each, formatted
+        straight from the packed rows.
+        """
+        if self.start.fixture_count() != FIXTURES:
+            return [self[i].svg() for i in range(self.count)]
+        return svgFrames(self.data, self.count)
+
+    def rows(self):
+        """
+        The packed rows as a memoryview of shape (rows, FRAME_FIELDS).
+        """
+        rows = len(self.data) // (8 * FRAME_FIELDS)
+        if rows == 0:
+            return memoryview(self.data).cast("d")  # no shape with a zero in it
+        return memoryview(self.data).cast("d", (rows, FRAME_FIELDS))
+
+    def compact(self):
+        """
+        The frames as plain lists for the compact frame protocol: the
+        still balls once, since they do not move during a segment, and the
+        rolling balls for every frame, each as flat ball number, x, y
+        triples cut to whole millimetres like svg().
+        """
+        data = self.packed
+        if data is None:
+            # not kept: a shot being streamed holds on to its Frames
+            data = phylib.phylib_table.frames(self.start, self.rate, self.count)
+        rows = memoryview(data).cast("d")
+        # every frame has the same balls, so the rows split evenly
+        count = len(rows) // FRAME_FIELDS // self.count if self.count else 0
+        still = []
+        frames = []
+        for i in range(self.count):
+            balls = []
+            row = rows[i * count * FRAME_FIELDS:(i + 1) * count * FRAME_FIELDS].tolist()
+            for j in range(0, len(row), FRAME_FIELDS):
+                frame, number, x, y, xvel, yvel = row[j:j + FRAME_FIELDS]
+                if xvel == xvel:
+                    balls.extend((int(number), int(x), int(y)))
+                elif i == 0:  # NaN velocity marks a still ball
+                    still.extend((int(number), int(x), int(y)))
+            frames.append(balls)
+        return {"time": self.start.time, "still": still, "frames": frames}
+
+    def array(self):
+        """
+        The packed rows as a read-only NumPy array of shape
+        (rows, FRAME_FIELDS).
+        """
+        import numpy
+        return numpy.frombuffer(self.data, dtype=numpy.float64).reshape(-1, FRAME_FIELDS)
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A connection from a ConnectionPool, which gives its place in the pool
+    back if it is closed directly instead of being released.
+    """
+    pool = None
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.discard(self)
+        sqlite3.Connection.close(self)
+
+class ConnectionPool:
+    """
+    The SQLite connections to one database file, shared by every Database
+    and Game in the process; use connectionPool to get the one for a file.
+    Every connection is set up once, with WAL journalling (readers and a
+    writer no longer lock each other out), synchronous=NORMAL, a busy
+    timeout and a statement cache, and goes back to the pool instead of
+    being closed.  A connection may be released on a different thread than
+    it was acquired on, but only one thread may use it at a time.
+    """
+
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.released = threading.Condition(self.lock)  # busy has shrunk
+        self.slots = threading.Semaphore(size)
+        self.size = size
+        self.idle = []
+        self.busy = set()
+        self.stale = set()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                               cached_statements=256, factory=PooledConnection)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.pool = self
+        return conn
+
+    def acquire(self):
+        """
+        An open connection, waiting up to BUSY_TIMEOUT seconds while size
+        of them are in use.  Raises sqlite3.OperationalError if none is
+        given back by then.
+        """
+        if not self.slots.acquire(timeout=BUSY_TIMEOUT):
+            raise sqlite3.OperationalError("all %d connections to %s are in use" % (self.size, self.path))
+        try:
+            with self.lock:
+                conn = self.idle.pop() if self.idle else None
+            if conn is None:
+                conn = self.connect()
+        except BaseException:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.busy.add(conn)
+        return conn
+
+    def release(self, conn):
+        """
+        Hands conn back, rolling back anything it left uncommitted.  Does
+        nothing if conn was released or closed already.
+        """
+        with self.lock:
+            if conn not in self.busy:
+                return
+            stale = conn in self.stale
+            self.stale.discard(conn)
+        try:
+            if stale:
+                sqlite3.Connection.close(conn)
+            else:
+                conn.rollback()
+                with self.lock:
+                    self.idle.append(conn)
+        finally:
+            self.free(conn)
+
+    def discard(self, conn):
+        """
+        Forgets conn, which its user is closing.
+        """
+        with self.lock:
+            if conn not in self.busy:
+                return  # idle, or closed by the pool itself
+            self.stale.discard(conn)
+        self.free(conn)
+
+    def free(self, conn):
+        # conn's place in the pool can be taken again
+        with self.lock:
+            self.busy.discard(conn)
+            self.released.notify_all()
+        self.slots.release()
+
+    def close(self):
+        """
+        Closes the idle connections, checkpointing the WAL into the
+        database file; connections still in use are closed when released.
+        """
+        with self.lock:
+            idle, self.idle = self.idle, []
+            self.stale.update(self.busy)
+        for conn in idle:
+            conn.close()
+
+    def reset(self):
+        """
+        Deletes the database file, and its WAL, once no connection is open:
+        waits up to BUSY_TIMEOUT seconds for the ones in use to be released
+        and raises sqlite3.OperationalError if they are not.
+        """
+        with self.lock:
+            if not self.released.wait_for(lambda: not self.busy, timeout=BUSY_TIMEOUT):
+                raise sqlite3.OperationalError("%d connections to %s are still in use" % (len(self.busy), self.path))
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass  # Ignore if the file doesn't exist
+
+
+pools = {}
+pools_lock = threading.Lock()
+
+def connectionPool(path="phylib.db"):
+    """
+    The ConnectionPool for the database file at path.
+    """
+    path = os.path.abspath(path)
+    with pools_lock:
+        if path not in pools:
+            pools[path] = ConnectionPool(path)
+        return pools[path]
+
 class Database():
 
     
-        def __init__(self, reset=False):
+        def __init__(self, reset=False, storage=STORAGE_PACKED):
+            # storage is the format new tables are written in; readTable
+            # reads either format
+            self.storage = storage
+
+            self.pool = connectionPool("phylib.db")
+
             # Check if reset is True, and if so, delete the existing database file
             if reset:
-                try:
-                    os.remove("phylib.db")
-                except FileNotFoundError:
-                    pass  # Ignore if the file doesn't exist
+                self.pool.reset()
+
+            # Borrow a conn to the SQLite database file from the pool; it
+            # goes back when this Database is closed, closed directly or
+            # garbage collected, whichever comes first
+            self.conn = self.pool.acquire()
+            self.release = weakref.finalize(self, self.pool.release, self.conn)
 
-            # Establish a conn to the SQLite database file
-            self.conn = sqlite3.connect("phylib.db")
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.close()
 
         def createDB(self):
             cursor = self.conn.cursor()
+            self.beginWrite(cursor)
 
             # Check if Ball table exists
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Ball'")
@@ -406,6 +776,35 @@ class Database():
                                 );
                             ''')
 
+            # Check if Frame table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Frame'")
+            frame_table_exists = cursor.fetchone()
+            if not frame_table_exists:
+                cursor.execute('''CREATE TABLE Frame (
+                                   TABLEID INTEGER PRIMARY KEY NOT NULL,
+                                   SHOTID INTEGER,
+                                   FRAMENO INTEGER,
+                                   TIME FLOAT NOT NULL,
+                                   STATE BLOB NOT NULL,
+                                   FOREIGN KEY (SHOTID) REFERENCES Shot
+                                );
+                            ''')
+
+            # Check if Segment table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Segment'")
+            segment_table_exists = cursor.fetchone()
+            if not segment_table_exists:
+                cursor.execute('''CREATE TABLE Segment (
+                                   FIRSTID INTEGER PRIMARY KEY NOT NULL,
+                                   SHOTID INTEGER,
+                                   NFRAMES INTEGER NOT NULL,
+                                   RATE FLOAT NOT NULL,
+                                   TIME FLOAT NOT NULL,
+                                   STATE BLOB NOT NULL,
+                                   FOREIGN KEY (SHOTID) REFERENCES Shot
+                                );
+                            ''')
+
             # Check if Player table exists
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Player'")
             player_table_exists = cursor.fetchone()
@@ -418,78 +817,254 @@ class Database():
                                 );
                             ''')
 
+            # Indexes for the lookups readTable and readTables make
+            cursor.execute("CREATE INDEX IF NOT EXISTS BallTableByTable ON BallTable (TABLEID, BALLID)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS TableShotByShot ON TableShot (SHOTID, TABLEID)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS FrameByShot ON Frame (SHOTID, FRAMENO)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS SegmentByShot ON Segment (SHOTID, FIRSTID)")
+
             self.conn.commit()
            
             cursor.close()  # Close the cursor
 
-        def readTable(self, tableID):
-            cursor = self.conn.cursor()
-
-            # Use a single SQL SELECT statement with a JOIN clause to retrieve data
-            cursor.execute("""SELECT Ball.BALLNO, Ball.XPOS, Ball.YPOS, Ball.XVEL, Ball.YVEL
-                            FROM Ball
-                            INNER JOIN BallTable ON Ball.BALLID = BallTable.BALLID
-                            WHERE BallTable.TABLEID = ?""", (tableID + 1,))  # Increment tableID by 1 to match SQL numbering
-
-            # Fetch all rows from the query result
-            rows = cursor.fetchall()
+        def makeBall(self, ballNo, xPos, yPos, xVel, yVel):
+            """
+            The StillBall (no velocity) or RollingBall, with drag, that a
+            stored ball row describes.
+            """
+            if xVel is None and yVel is None:
+                return StillBall(ballNo, Coordinate(xPos, yPos))
+
+            speed_rb = math.sqrt(xVel ** 2 + yVel ** 2)
+            if speed_rb > VEL_EPSILON:  # A very small value to handle division by zero
+                acceleration_x = -xVel / speed_rb * DRAG  # DRAG constant
+                acceleration_y = -yVel / speed_rb * DRAG  # DRAG constant
+            else:
+                acceleration_x = 0.0
+                acceleration_y = 0.0
+            return RollingBall(ballNo, Coordinate(xPos, yPos), Coordinate(xVel, yVel), Coordinate(acceleration_x, acceleration_y))
+
+        def packBalls(self, balls):
+            """
+            The STATE blob of a Frame row for balls, a sequence of (number,
+            x, y, xvel, yvel) with None or NaN velocity for still balls.
+            STATE is float32: number, x, y, xvel, yvel for a rolling ball and
+            -1 - number, x, y for a still one.
+            """
+            state = array.array("f")
+            for ballNo, xPos, yPos, xVel, yVel in balls:
+                if xVel is None or xVel != xVel:
+                    state.extend((-1 - ballNo, xPos, yPos))
+                else:
+                    state.extend((ballNo, xPos, yPos, xVel, yVel))
+            return state.tobytes()
+
+        def packTable(self, table):
+            """
+            The STATE blob for table; see packBalls.
+            """
+            balls = []
+            for obj in table.balls():
+                if isinstance(obj, StillBall):
+                    ball = obj.obj.still_ball
+                    balls.append((ball.number, ball.pos.x, ball.pos.y, None, None))
+                elif isinstance(obj, RollingBall):
+                    ball = obj.obj.rolling_ball
+                    balls.append((ball.number, ball.pos.x, ball.pos.y, ball.vel.x, ball.vel.y))
+            return self.packBalls(balls)
 
-            # If no rows are fetched, return None
-            if not rows:
-                cursor.close()
-                return None
+        def unpackTable(self, time, blob):
+            """
+            The Table a Frame row holds.
+            """
+            state = array.array("f")
+            state.frombytes(blob)
 
-            # Initialize a Table object with standard holes and cushions
             table = Table()
-
-            # Retrieve the table's time attribute from the TTable table
-            cursor.execute("SELECT TIME FROM TTable WHERE TABLEID = ?", (tableID + 1,))
-            time = cursor.fetchone()[0]  # Fetch the first column of the first row
-
-            # Iterate over the fetched rows and instantiate balls accordingly
-            for row in rows:
-                ballNo, xPos, yPos, xVel, yVel = row
-                if xVel is None and yVel is None:
-                    # Instantiate StillBall if velocity components are None
-                    ball = StillBall(ballNo, Coordinate(xPos, yPos))
+            i = 0
+            while i < len(state):
+                ballNo = int(state[i])
+                if ballNo < 0:
+                    table.add_object(self.makeBall(-1 - ballNo, state[i + 1], state[i + 2], None, None))
+                    i += 3
                 else:
-                    # Calculate acceleration with drag
-                    rb_dx = xVel
-                    rb_dy = yVel
-                    speed_rb = math.sqrt(rb_dx ** 2 + rb_dy ** 2)
-
-                    # Compute acceleration with drag
-                    if speed_rb > VEL_EPSILON:  # A very small value to handle division by zero
-                        acceleration_x = -rb_dx / speed_rb * DRAG  # DRAG constant
-                        acceleration_y = -rb_dy / speed_rb * DRAG  # DRAG constant
-                    else:
-                        acceleration_x = 0.0
-                        acceleration_y = 0.0
-                    
-                    # Instantiate RollingBall with calculated acceleration
-                    ball = RollingBall(ballNo, Coordinate(xPos, yPos), Coordinate(xVel, yVel), Coordinate(acceleration_x, acceleration_y))
+                    table.add_object(self.makeBall(ballNo, *state[i + 1:i + 5]))
+                    i += 5
+            table.time = time
+            return table
 
-                # Add the instantiated ball to the Table
-                table.add_object(ball)
+        @staticmethod
+        def packKeyframe(table):
+            """
+            The STATE blob of a Segment row for table.  STATE is float64, so
+            the frames rolled from it are the ones the shot played: number,
+            x, y, xvel, yvel, xacc, yacc for a rolling ball and -1 - number,
+            x, y for a still one.
+            """
+            state = array.array("d")
+            for obj in table.balls():
+                if isinstance(obj, StillBall):
+                    ball = obj.obj.still_ball
+                    state.extend((-1 - ball.number, ball.pos.x, ball.pos.y))
+                elif isinstance(obj, RollingBall):
+                    ball = obj.obj.rolling_ball
+                    state.extend((ball.number, ball.pos.x, ball.pos.y,
+                                  ball.vel.x, ball.vel.y, ball.acc.x, ball.acc.y))
+            return state.tobytes()
+
+        @staticmethod
+        def unpackKeyframe(time, blob):
+            """
+            The Table at the start of a Segment row.
+            """
+            state = array.array("d")
+            state.frombytes(blob)
 
-            # Set the time attribute of the table
+            table = Table()
+            i = 0
+            while i < len(state):
+                ballNo = int(state[i])
+                if ballNo < 0:
+                    table.add_object(StillBall(-1 - ballNo, Coordinate(state[i + 1], state[i + 2])))
+                    i += 3
+                else:
+                    table.add_object(RollingBall(ballNo, Coordinate(state[i + 1], state[i + 2]),
+                                                 Coordinate(state[i + 3], state[i + 4]),
+                                                 Coordinate(state[i + 5], state[i + 6])))
+                    i += 7
             table.time = time
+            return table
 
-            # Close cursor and commit changes
-            cursor.close()
-            self.conn.commit()
+        def beginWrite(self, cursor):
+            """
+            Starts the write transaction before anything is read, so that
+            connections writing at the same time wait their turn instead of
+            handing out the same IDs, or failing with "database is locked"
+            when a read snapshot cannot become a write.
+            """
+            if not self.conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
+
+        def nextTableID(self, cursor):
+            """
+            The next free TABLEID.  All storage formats share one sequence
+            so that a table ID means the same thing whichever holds it; a
+            Segment row takes the IDs of all its frames.
+            """
+            cursor.execute("""SELECT MAX((SELECT IFNULL(MAX(TABLEID), 0) FROM TTable),
+                                         (SELECT IFNULL(MAX(TABLEID), 0) FROM Frame),
+                                         (SELECT IFNULL(MAX(FIRSTID + NFRAMES - 1), 0) FROM Segment))""")
+            return cursor.fetchone()[0] + 1
 
-            return table
+        def readTable(self, tableID):
+            tables = self.readTableRange(tableID, tableID + 1)
+            if not tables:
+                return None
+            return tables[0]
+
+        def readTableRange(self, start, end):
+            """
+            The stored tables with IDs from start up to but not including
+            end, in order, numbered like readTable.  IDs with no table are
+            skipped.
+            """
+            # Increment the IDs by 1 to match SQL numbering
+            return self.collectTables("TABLEID BETWEEN ? AND ?", (start + 1, end), end - start,
+                                      ("FIRSTID BETWEEN (SELECT IFNULL(MAX(FIRSTID), 0) FROM Segment WHERE FIRSTID <= ?) AND ?",
+                                       (start + 1, end), start + 1, end))
+
+        def readTables(self, shotID):
+            """
+            Every frame of shotID, in order.
+            """
+            return self.collectTables("TABLEID IN (SELECT TABLEID + 1 FROM TableShot WHERE SHOTID = ?)", (shotID,), None,
+                                      ("SHOTID = ?", (shotID,), None, None))
+
+        def collectTables(self, where, params, expected=None, segments=None):
+            """
+            Builds the tables whose TABLEID satisfies where, in TABLEID order,
+            in a single pass over one ordered query per storage format.  The
+            row format is not queried once expected tables were found packed
+            or rolled from keyframes.
+            segments is (where, params, first, last) picking the Segment rows
+            to roll frames from, and the range of TABLEIDs to keep (None for
+            no bound).
+            """
+            cursor = self.conn.cursor()
+            tables = {}
+
+            # Tables in the packed format are a single Frame row
+            try:
+                cursor.execute("SELECT TABLEID, TIME, STATE FROM Frame WHERE " + where + " ORDER BY TABLEID", params)
+                for tableID, time, state in cursor:
+                    tables[tableID] = self.unpackTable(time, state)
+            except sqlite3.OperationalError:
+                pass  # a database from before the Frame table
+
+            # Tables in the keyframe format are rolled from their Segment row
+            if segments is not None and (expected is None or len(tables) < expected):
+                segmentWhere, segmentParams, first, last = segments
+                try:
+                    cursor.execute("SELECT FIRSTID, NFRAMES, RATE, TIME, STATE FROM Segment WHERE " +
+                                   segmentWhere + " ORDER BY FIRSTID", segmentParams)
+                    for firstID, nframes, rate, time, state in cursor:
+                        keyframe = self.unpackKeyframe(time, state)
+                        lo = 0 if first is None else max(0, first - firstID)
+                        hi = nframes if last is None else min(nframes, last + 1 - firstID)
+                        for i in range(lo, hi):
+                            if firstID + i not in tables:
+                                table = phylib.phylib_table.roll_table(keyframe, i * rate)
+                                table.__class__ = Table
+                                tables[firstID + i] = table
+                except sqlite3.OperationalError:
+                    pass  # a database from before the Segment table
+
+            if expected is None or len(tables) < expected:
+                cursor.execute("""SELECT TTable.TABLEID, TTable.TIME, Ball.BALLNO, Ball.XPOS, Ball.YPOS, Ball.XVEL, Ball.YVEL
+                                  FROM TTable
+                                  INNER JOIN BallTable ON BallTable.TABLEID = TTable.TABLEID
+                                  INNER JOIN Ball ON Ball.BALLID = BallTable.BALLID
+                                  WHERE TTable.""" + where + """
+                                  ORDER BY TTable.TABLEID, Ball.BALLID""", params)
+                table = None
+                for tableID, time, *ball in cursor:
+                    if tableID in tables and tables[tableID] is not table:
+                        continue  # packed copy wins
+                    if tableID not in tables:
+                        # Initialize a Table object with standard holes and cushions
+                        table = Table()
+                        table.time = time
+                        tables[tableID] = table
+                    table.add_object(self.makeBall(*ball))
 
+            cursor.close()
+            return [tables[tableID] for tableID in sorted(tables)]
 
         def writeTable(self, table):
             cursor = self.conn.cursor()
+            self.beginWrite(cursor)
+            new_id = self.nextTableID(cursor)
+
+            if self.storage == STORAGE_PACKED:
+                cursor.execute("INSERT INTO Frame (TABLEID, TIME, STATE) VALUES (?, ?, ?)",
+                               (new_id, table.time, self.packTable(table)))
+                self.conn.commit()
+                cursor.close()
+                return new_id - 1
+
+            if self.storage == STORAGE_KEYFRAME:
+                # a segment of one frame
+                cursor.execute("INSERT INTO Segment (FIRSTID, NFRAMES, RATE, TIME, STATE) VALUES (?, 1, 0.0, ?, ?)",
+                               (new_id, table.time, self.packKeyframe(table)))
+                self.conn.commit()
+                cursor.close()
+                return new_id - 1
 
-            cursor.execute("INSERT INTO TTable (TIME) VALUES (?)", (table.time,))
+            cursor.execute("INSERT INTO TTable (TABLEID, TIME) VALUES (?, ?)", (new_id, table.time))
             table_id = cursor.lastrowid - 1
             print(table_id)
             # Insert objects into Ball table and associate with the current table
-            for obj in table:
+            for obj in table.balls():
                 if isinstance(obj, StillBall):
                     cursor.execute("INSERT INTO Ball (BALLNO, XPOS, YPOS) VALUES (?, ?, ?)", (obj.obj.still_ball.number, obj.obj.still_ball.pos.x, obj.obj.still_ball.pos.y))
                      # Get the autoincremented BALLID value
@@ -506,34 +1081,165 @@ class Database():
                     # Associate the ball with the current table
                     cursor.execute("INSERT INTO BallTable (BALLID, TABLEID) VALUES (?, ?)", (ballID,table_id + 1))
 
-
-                    # Close cursor and commit changes  
-                    self.conn.commit()
-                    cursor.close
+            # Close cursor and commit changes once for the whole table
+            self.conn.commit()
+            cursor.close()
              # Return the auto-incremented TABLEID value minus 1
             return table_id 
+
+        def writeFrames(self, shotID, segments):
+            """
+            Writes every frame of a shot and links them to shotID in one
+            transaction.  segments is a list of Frames (see Table.frames),
+            whose packed rows are inserted with executemany; the TABLEIDs
+            (and BALLIDs for STORAGE_ROWS) are given out as one block each.
+            Returns the range of table IDs written, numbered like the value
+            writeTable returns and readTable takes.
+            STORAGE_KEYFRAME writes one Segment row per segment holding the
+            table the frames start from, instead of a row per frame; the
+            frames themselves are rolled forward from it when read.  Every
+            format links each frame to shotID in TableShot.
+            """
+            cursor = self.conn.cursor()
+            self.beginWrite(cursor)
+
+            firstID = self.nextTableID(cursor)
+            if self.storage == STORAGE_KEYFRAME:
+                keyframes = []
+                tableID = firstID
+                for frames in segments:
+                    if len(frames):
+                        keyframes.append((tableID, shotID, len(frames), frames.rate,
+                                          frames.start.time, self.packKeyframe(frames.start)))
+                    tableID += len(frames)
+                cursor.executemany("INSERT INTO Segment (FIRSTID, SHOTID, NFRAMES, RATE, TIME, STATE) VALUES (?, ?, ?, ?, ?, ?)",
+                                   keyframes)
+                # every frame is still linked to its shot, as in the other formats
+                cursor.executemany("INSERT INTO TableShot (SHOTID, TABLEID) VALUES (?, ?)",
+                                   [(shotID, i) for i in range(firstID - 1, tableID - 1)])
+                self.conn.commit()
+                cursor.close()
+                return range(firstID - 1, tableID - 1)
+
+            cursor.execute("SELECT IFNULL(MAX(BALLID), 0) FROM Ball")
+            ballID = cursor.fetchone()[0]
+
+            tables = []
+            balls = []
+            links = []
+            tableID = firstID
+            for frames in segments:
+                rows = frames.rows().tolist()
+                if self.storage == STORAGE_PACKED:
+                    # every frame has the same balls, so the rows split evenly
+                    count = len(rows) // len(frames) if len(frames) else 0
+                    for i in range(len(frames)):
+                        state = self.packBalls(row[1:] for row in rows[i * count:(i + 1) * count])
+                        tables.append((tableID + i, shotID, tableID + i - firstID, frames.time(i), state))
+                else:
+                    for i in range(len(frames)):
+                        tables.append((tableID + i, frames.time(i)))
+                    for frame, ballNo, xPos, yPos, xVel, yVel in rows:
+                        ballID += 1
+                        if xVel != xVel:  # NaN velocity marks a still ball
+                            xVel = yVel = None
+                        balls.append((ballID, int(ballNo), xPos, yPos, xVel, yVel))
+                        links.append((ballID, tableID + int(frame)))
+                tableID += len(frames)
+
+            if self.storage == STORAGE_PACKED:
+                cursor.executemany("INSERT INTO Frame (TABLEID, SHOTID, FRAMENO, TIME, STATE) VALUES (?, ?, ?, ?, ?)", tables)
+            else:
+                cursor.executemany("INSERT INTO TTable (TABLEID, TIME) VALUES (?, ?)", tables)
+                cursor.executemany("INSERT INTO Ball (BALLID, BALLNO, XPOS, YPOS, XVEL, YVEL) VALUES (?, ?, ?, ?, ?, ?)", balls)
+                cursor.executemany("INSERT INTO BallTable (BALLID, TABLEID) VALUES (?, ?)", links)
+            cursor.executemany("INSERT INTO TableShot (SHOTID, TABLEID) VALUES (?, ?)",
+                               [(shotID, row[0] - 1) for row in tables])
+
+            # One commit for the whole shot
+            self.conn.commit()
+            cursor.close()
+            return range(firstID - 1, tableID - 1)
                 
-        def close(self):
-            # Commit changes and close the database conn
+        def migrate(self):
+            """
+            Moves every table stored as Ball/BallTable/TTable rows into the
+            packed Frame table, keeping its TABLEID, and numbers the frames
+            of each shot through TableShot.  Returns the number of tables
+            moved.
+            """
+            self.createDB()
+            cursor = self.conn.cursor()
+
+            cursor.execute("SELECT TABLEID, TIME FROM TTable ORDER BY TABLEID")
+            times = cursor.fetchall()
+            cursor.execute("""SELECT BallTable.TABLEID, Ball.BALLNO, Ball.XPOS, Ball.YPOS, Ball.XVEL, Ball.YVEL
+                              FROM Ball
+                              INNER JOIN BallTable ON Ball.BALLID = BallTable.BALLID
+                              ORDER BY BallTable.TABLEID, Ball.BALLID""")
+            balls = {}
+            for tableID, *ball in cursor.fetchall():
+                balls.setdefault(tableID, []).append(ball)
+
+            # TableShot holds table IDs numbered the way writeTable returns them
+            cursor.execute("SELECT SHOTID, TABLEID FROM TableShot ORDER BY SHOTID, TABLEID")
+            shots = {}
+            counts = {}
+            for shotID, tableID in cursor.fetchall():
+                shots[tableID + 1] = (shotID, counts.get(shotID, 0))
+                counts[shotID] = counts.get(shotID, 0) + 1
+
+            cursor.executemany("INSERT INTO Frame (TABLEID, SHOTID, FRAMENO, TIME, STATE) VALUES (?, ?, ?, ?, ?)",
+                               [(tableID,) + shots.get(tableID, (None, None)) +
+                                (time, self.packBalls(balls.get(tableID, [])))
+                                for tableID, time in times])
+            cursor.execute("DELETE FROM BallTable")
+            cursor.execute("DELETE FROM Ball")
+            cursor.execute("DELETE FROM TTable")
             self.conn.commit()
-            self.conn.close()
 
-        def newShot(self, gameName, playerName):
+            # give the space of the old rows back
+            cursor.execute("VACUUM")
+            cursor.close()
+            return len(times)
+
+        def close(self):
+            # Commit changes and give the conn back to the pool
+            if self.conn is None:
+                return
+            try:
+                self.conn.commit()
+            finally:
+                self.release()
+                self.conn = None
+
+        def findPlayer(self, gameName, playerName):
+            """
+            The (GAMEID, PLAYERID) a shot by playerName in gameName is
+            stored under.  Raises ValueError if either is not in the
+            database.
+            """
             cursor = self.conn.cursor()
 
              # Get the gameID for the provided gameName
             cursor.execute("SELECT GAMEID FROM Game WHERE GAMENAME = ?", (gameName,))
             game_record = cursor.fetchone()
             if game_record is None:
+                cursor.close()
                 raise ValueError(f"No game found with name: {gameName}")
-            gameID = game_record[0]
 
             # Get the playerID for the provided playerName
             cursor.execute("SELECT PLAYERID FROM Player WHERE PLAYERNAME = ?", (playerName,))
             player_record = cursor.fetchone()
+            cursor.close()
             if player_record is None:
                 raise ValueError(f"No player found with name: {playerName}")
-            playerID = player_record[0]
+            return game_record[0], player_record[0]
+
+        def newShot(self, gameName, playerName):
+            gameID, playerID = self.findPlayer(gameName, playerName)
+            cursor = self.conn.cursor()
+            self.beginWrite(cursor)
 
             # Insert a new entry into the Shot table
             cursor.execute("INSERT INTO Shot (GAMEID, PLAYERID) VALUES (?, ?)", (gameID, playerID))
@@ -546,6 +1252,21 @@ class Database():
             return shotID
         
 
+        def getShot(self, tableID):
+            """
+            The SHOTID of the shot table tableID (numbered like readTable)
+            was played in, or None if it is not part of a shot.
+            """
+            cursor = self.conn.cursor()
+            cursor.execute("""SELECT SHOTID FROM Segment
+                              WHERE FIRSTID = (SELECT MAX(FIRSTID) FROM Segment WHERE FIRSTID <= ?) AND FIRSTID + NFRAMES > ?
+                              UNION ALL SELECT SHOTID FROM Frame WHERE TABLEID = ?
+                              UNION ALL SELECT SHOTID FROM TableShot WHERE TABLEID = ?""",
+                           (tableID + 1, tableID + 1, tableID + 1, tableID))
+            shot_record = cursor.fetchone()
+            cursor.close()
+            return shot_record[0] if shot_record else None
+
         def getGame(self, gameID):
             cursor = self.conn.cursor()
             cursor.execute("""
@@ -587,37 +1308,212 @@ class Database():
             # Commit changes and close cursor
             self.conn.commit()
             cursor.close()
+class SimulationCache:
+    """
+    The segments shots played out to, so that a shot played again from
+    the same table with the same cue ball velocity is not simulated again.
+    Shots are keyed by a hash of every object on the table, with positions
+    and velocities rounded to CACHE_QUANTUM, and the velocity; tables
+    closer than that share a result.  A shot is kept as the keyframes a
+    Segment row holds, the most recently used size shots in memory and,
+    if path is given, every shot in the Simulation table of that SQLite
+    file too, so that they outlive the process.
+    """
+
+    def __init__(self, size=CACHE_SHOTS, path=None):
+        self.size = size
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (seconds, keyframes)
+        self.pool = None
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0  # CPU seconds the hits would have simulated for
+        self.spent = 0.0  # CPU seconds the misses simulated for
+
+        if path is not None:
+            self.pool = connectionPool(path)
+            conn = self.pool.acquire()
+            try:
+                conn.execute('''CREATE TABLE IF NOT EXISTS Simulation (
+                                  KEY TEXT PRIMARY KEY NOT NULL,
+                                  SECONDS FLOAT NOT NULL,
+                                  SEGMENTS BLOB NOT NULL
+                               )''')
+                conn.commit()
+            finally:
+                self.pool.release(conn)
+
+    def key(self, table, xvel, yvel):
+        """
+        The cache key for striking the cue ball of table at (xvel, yvel).
+        """
+        def q(value):
+            return round(value / CACHE_QUANTUM)
+
+        parts = ["%r %d %d" % (FRAME_RATE, q(xvel), q(yvel)), "%d" % q(table.time)]
+        for obj in table:
+            if isinstance(obj, StillBall):
+                ball = obj.obj.still_ball
+                parts.append("s %d %d %d" % (ball.number, q(ball.pos.x), q(ball.pos.y)))
+            elif isinstance(obj, RollingBall):
+                ball = obj.obj.rolling_ball
+                parts.append("r %d %d %d %d %d %d %d" % (ball.number, q(ball.pos.x), q(ball.pos.y),
+                                                         q(ball.vel.x), q(ball.vel.y), q(ball.acc.x), q(ball.acc.y)))
+            elif isinstance(obj, Hole):
+                parts.append("h %d %d" % (q(obj.obj.hole.pos.x), q(obj.obj.hole.pos.y)))
+            elif isinstance(obj, HCushion):
+                parts.append("y %d" % q(obj.obj.hcushion.y))
+            elif isinstance(obj, VCushion):
+                parts.append("x %d" % q(obj.obj.vcushion.x))
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def get(self, key):
+        """
+        An iterator over the Frames of the cached shot, without simulating
+        anything, or None.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+        if entry is None and self.pool is not None:
+            conn = self.pool.acquire()
+            try:
+                record = conn.execute("SELECT SECONDS, SEGMENTS FROM Simulation WHERE KEY = ?", (key,)).fetchone()
+            finally:
+                self.pool.release(conn)
+            if record is not None:
+                entry = (record[0], self.unpack(record[1]))
+                self.remember(key, entry)
+
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.saved += entry[0]
+        return iter([Frames(Database.unpackKeyframe(start, state), rate, count)
+                     for count, rate, start, state in entry[1]])
+
+    def record(self, key, segments):
+        """
+        Passes the Frames of segments through, timing the simulation, and
+        caches the shot under key once the last one has been taken.
+        """
+        keyframes = []
+        seconds = 0.0
+        segments = iter(segments)
+        while True:
+            started = time.thread_time()
+            frames = next(segments, None)
+            seconds += time.thread_time() - started
+            if frames is None:
+                break
+            keyframes.append((len(frames), frames.rate, frames.start.time, Database.packKeyframe(frames.start)))
+            yield frames
+
+        with self.lock:
+            self.spent += seconds
+        self.remember(key, (seconds, keyframes))
+        if self.pool is not None:
+            conn = self.pool.acquire()
+            try:
+                conn.execute("INSERT OR REPLACE INTO Simulation (KEY, SECONDS, SEGMENTS) VALUES (?, ?, ?)",
+                             (key, seconds, self.pack(keyframes)))
+                conn.commit()
+            finally:
+                self.pool.release(conn)
+
+    def remember(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def pack(self, keyframes):
+        # frame count, rate, start time and STATE length in doubles, then
+        # STATE, for every segment
+        blob = array.array("d")
+        for count, rate, start, state in keyframes:
+            blob.extend((count, rate, start, len(state) // 8))
+            blob.frombytes(state)
+        return blob.tobytes()
+
+    def unpack(self, data):
+        blob = array.array("d")
+        blob.frombytes(data)
+        keyframes = []
+        i = 0
+        while i < len(blob):
+            count, rate, start, length = blob[i:i + 4]
+            length = int(length)
+            keyframes.append((int(count), rate, start, blob[i + 4:i + 4 + length].tobytes()))
+            i += 4 + length
+        return keyframes
+
+    def stats(self):
+        with self.lock:
+            looked_up = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / looked_up if looked_up else 0.0,
+                "saved_seconds": self.saved,
+                "simulated_seconds": self.spent,
+                "entries": len(self.entries),
+            }
+
 class Game:
     
-    def __init__(self, gameID=None, gameName=None, player1Name=None, player2Name=None):
-        self.db = Database( reset=True );
-        db = self.db
-        db.createDB();
-        self.conn = sqlite3.connect("phylib.db")
-        if gameID is not None and gameName is None and player1Name is None and player2Name is None:
-           new_game =  db.getGame(gameID)
-           self.gameName = new_game['gameName']
-           self.player1Name = new_game['player1Name']
-           self.player2Name = new_game['player2Name']
-        elif gameID is None and isinstance(gameName, str) and isinstance(player1Name, str) and isinstance(player2Name, str):
-            self.gameID = None
-            self.gameName = gameName
-            self.player1Name = player1Name
-            self.player2Name = player2Name
-            db.setGame(self.gameName,self.player1Name,self.player2Name)
+    def __init__(self, gameID=None, gameName=None, player1Name=None, player2Name=None, cache=None):
+        # a SimulationCache shots are looked up in before they are played
+        self.cache = cache
+        # shots are stored as keyframes and rolled forward when replayed;
+        # every call borrows its own connection from the pool, so one game
+        # can be shared by several threads
+        with Database( reset=True, storage=STORAGE_KEYFRAME ) as db:
+            db.createDB();
+            if gameID is not None and gameName is None and player1Name is None and player2Name is None:
+               new_game =  db.getGame(gameID)
+               self.gameName = new_game['gameName']
+               self.player1Name = new_game['player1Name']
+               self.player2Name = new_game['player2Name']
+            elif gameID is None and isinstance(gameName, str) and isinstance(player1Name, str) and isinstance(player2Name, str):
+                self.gameID = None
+                self.gameName = gameName
+                self.player1Name = player1Name
+                self.player2Name = player2Name
+                db.setGame(self.gameName,self.player1Name,self.player2Name)
             
-        else:
-            raise TypeError("Invalid combination of arguments provided to the constructor")
+            else:
+                raise TypeError("Invalid combination of arguments provided to the constructor")
 
 
     def shoot(self, gameName, playerName, table, xvel, yvel):
-        shotID = self.db.newShot(gameName, playerName)
+        segments = self.strike(table, xvel, yvel)
+        if segments is None:
+            return
+        return self.store(gameName, playerName, list(segments))
+
+    def strike(self, table, xvel, yvel):
+        """
+        Strikes the cue ball of table with velocity (xvel, yvel) and returns
+        an iterator over the Frames of each segment of the shot; every
+        segment is simulated as it is asked for, so the first frames can
+        be shown before the shot is over.  None if there is no cue ball.
+        A shot found in the game's cache is not simulated again.
+        """
         cue_ball = table.cueBall()
 
         if cue_ball is None:
             print("Error: Cue ball not found")
             return
 
+        # keyed on the table as it was before the cue ball is struck
+        key = self.cache.key(table, xvel, yvel) if self.cache is not None else None
+
         xpos, ypos = cue_ball.obj.rolling_ball.pos.x, cue_ball.obj.rolling_ball.pos.y
         cue_ball.type = phylib.PHYLIB_ROLLING_BALL
         cue_ball.obj.rolling_ball.pos.x = xpos
@@ -629,7 +1525,15 @@ class Game:
         cue_ball.obj.rolling_ball.acc.x = acceleration_x
         cue_ball.obj.rolling_ball.acc.y = acceleration_y
         cue_ball.obj.rolling_ball.number = 0
-  
+
+        if key is None:
+            return self.segments(table)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached  # phylib_segment is not called at all
+        return self.cache.record(key, self.segments(table))
+
+    def segments(self, table):
         while table is not None:
             newt_table = table
             startTime = table.time
@@ -639,16 +1543,18 @@ class Game:
                 break
 
             segment_length = round((table.time - startTime) / FRAME_RATE)
+            yield Frames(newt_table, FRAME_RATE, segment_length, end=table)  # Use newt_table, not table
 
-            for i in range(segment_length):
-                new_table = Table()
-                time_offset = i * FRAME_RATE
-                new_table = newt_table.roll(time_offset)  # Use newt_table, not table
-                new_table.time = startTime + time_offset
-                print(new_table)
-                new_table_id = self.db.writeTable(new_table)
-                self.db.conn.execute("INSERT INTO TableShot (SHOTID, TABLEID) VALUES (?, ?)", (shotID, new_table_id))
-                self.db.conn.commit()
+    def store(self, gameName, playerName, segments):
+        """
+        Stores the Frames of every segment of a shot as a new shot by
+        playerName and returns the range of its table IDs.
+        """
+        # every frame of the shot goes to the database in one transaction;
+        # the connection is only held for that, not while simulating
+        with Database( storage=STORAGE_KEYFRAME ) as db:
+            shotID = db.newShot(gameName, playerName)
+            return db.writeFrames(shotID, segments)
 
 
             # table = next_table
@@ -0,0 +1,118 @@
+/*
+ * Allocations and latency of phylib_copy_table, against a copy made the
+ * way phylib_copy_table did before tables kept their objects in one block
+ * (a table of pointers and a malloc per object), and allocations per shot.
+ *
+ * phylib.c is compiled into this harness with malloc routed through a
+ * counter, so the numbers cover every allocation the library makes (it
+ * calls neither calloc nor realloc).
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include <time.h>
+
+#define COPIES (200000)
+#define SHOTS (20)
+
+static long allocations = 0;
+
+static void *counted_malloc(size_t size)
+{
+    allocations++;
+    return malloc(size);
+}
+
+#define malloc(size) counted_malloc(size)
+#include "phylib.c"
+#undef malloc
+
+#include "rack.h"
+
+// The table as it was: a fixed array of pointers to objects of their own.
+typedef struct
+{
+    double time;
+    phylib_object *object[PHYLIB_MAX_OBJECTS];
+} object_table;
+
+static object_table *object_copy_table(const object_table *table)
+{
+    object_table *new_table = (object_table *)counted_malloc(sizeof(object_table));
+    new_table->time = table->time;
+    for (int i = 0; i < PHYLIB_MAX_OBJECTS; ++i)
+    {
+        new_table->object[i] = NULL;
+        if (table->object[i] != NULL)
+        {
+            new_table->object[i] = (phylib_object *)counted_malloc(sizeof(phylib_object));
+            memcpy(new_table->object[i], table->object[i], sizeof(phylib_object));
+        }
+    }
+    return new_table;
+}
+
+static void object_free_table(object_table *table)
+{
+    for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+    {
+        free(table->object[i]);
+    }
+    free(table);
+}
+
+int main(void)
+{
+    srand(2750);
+    phylib_table *table = rack(0.0, -1500.0);
+
+    // the same objects in a table of the old layout
+    object_table old = {table->time, {NULL}};
+    for (int i = 0; i < table->count && i < PHYLIB_MAX_OBJECTS; i++)
+    {
+        old.object[i] = table->object[i];
+    }
+    object_free_table(object_copy_table(&old)); // warm up the allocator
+
+    long before = allocations;
+    double start = now();
+    for (int k = 0; k < COPIES; k++)
+    {
+        object_free_table(object_copy_table(&old));
+    }
+    double elapsed = now() - start;
+    double old_allocations = (double)(allocations - before) / COPIES;
+    double old_ns = elapsed / COPIES * 1e9;
+
+    before = allocations;
+    start = now();
+    for (int k = 0; k < COPIES; k++)
+    {
+        phylib_free_table(phylib_copy_table(table));
+    }
+    elapsed = now() - start;
+    printf("copy + free        %8s %8s\n", "before", "after");
+    printf("  allocations/copy %8.1f %8.1f\n", old_allocations, (double)(allocations - before) / COPIES);
+    printf("  ns/copy          %8.1f %8.1f\n", old_ns, elapsed / COPIES * 1e9);
+    phylib_free_table(table);
+
+    long segments = 0;
+    before = allocations;
+    for (int s = 0; s < SHOTS; s++)
+    {
+        table = rack(75.0 * (s - SHOTS / 2), -1500.0);
+        while (table != NULL)
+        {
+            phylib_table *next = phylib_segment_event(table);
+            phylib_free_table(table);
+            table = next;
+            segments++;
+        }
+    }
+    printf("break shots: %.1f allocations/shot, %.1f allocations/segment (table setup included)\n",
+           (double)(allocations - before) / SHOTS, (double)(allocations - before) / segments);
+
+    return 0;
+}
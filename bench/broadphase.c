@@ -0,0 +1,149 @@
+/*
+ * Cost of one collision check per step: the O(N^2) check_collision_condition
+ * against the sweep-and-prune phylib_broadphase_collision.
+ *
+ * Tables are filled with rolling balls spread over the cloth so that nothing
+ * touches, which is what almost every step of a shot looks like.  Build with
+ * a larger -DPHYLIB_MAX_OBJECTS (see bench/broadphase_64 in the makefile) to
+ * measure a raised object limit.  A second pass with random overlaps checks
+ * that both report the same bounce.
+ */
+
+#include <time.h>
+#include "phylib.h"
+
+#define CHECKS (20000)
+#define TRIALS (2000)
+
+static double uniform(double lo, double hi)
+{
+    return lo + (hi - lo) * rand() / RAND_MAX;
+}
+
+static phylib_table *spread(int nobjects, int overlaps)
+{
+    phylib_table *table = phylib_new_table_capacity(nobjects);
+    double margin = PHYLIB_HOLE_RADIUS + PHYLIB_BALL_RADIUS;
+
+    for (int n = 10; n < nobjects; n++)
+    {
+        phylib_coord pos, vel, acc = {0.0, 0.0};
+        int clear;
+
+        do
+        {
+            pos.x = uniform(margin, PHYLIB_TABLE_WIDTH - margin);
+            pos.y = uniform(margin, PHYLIB_TABLE_LENGTH - margin);
+            clear = 1;
+            for (int i = 10; i < n && !overlaps; i++)
+            {
+                phylib_coord other = table->object[i]->obj.rolling_ball.pos;
+                if (phylib_length(phylib_sub(pos, other)) < PHYLIB_BALL_DIAMETER + 1.0)
+                {
+                    clear = 0;
+                }
+            }
+        } while (!clear);
+
+        vel.x = uniform(-100.0, 100.0);
+        vel.y = uniform(-100.0, 100.0);
+        phylib_add_object(table, phylib_new_rolling_ball(n - 10, &pos, &vel, &acc));
+    }
+    return table;
+}
+
+static double now(void)
+{
+    return (double)clock() / CLOCKS_PER_SEC;
+}
+
+static void time_checks(int nobjects)
+{
+    phylib_table *table = spread(nobjects, 0);
+    phylib_broadphase bp;
+    phylib_soa soa;
+    int hits = 0, a, b;
+
+    double start = now();
+    for (int k = 0; k < CHECKS; k++)
+    {
+        hits += check_collision_condition(table);
+    }
+    double naive = (now() - start) / CHECKS;
+
+    phylib_soa_init(&soa, table);
+    phylib_broadphase_init(&bp, table, &soa);
+    start = now();
+    for (int k = 0; k < CHECKS; k++)
+    {
+        hits += phylib_broadphase_collision(&bp, table, &soa, &a, &b);
+    }
+    double swept = (now() - start) / CHECKS;
+
+    phylib_broadphase_free(&bp);
+    phylib_soa_free(&soa);
+    printf("%3d objects  naive %8.3f us  broadphase %8.3f us  x%.1f%s\n",
+           nobjects, naive * 1e6, swept * 1e6, naive / swept, hits ? "  (unexpected hit)" : "");
+    phylib_free_table(table);
+}
+
+static int same_table(phylib_table *a, phylib_table *b)
+{
+    if (a->count != b->count)
+    {
+        return 0;
+    }
+    for (int i = 0; i < a->count; i++)
+    {
+        if ((a->object[i] == NULL) != (b->object[i] == NULL))
+        {
+            return 0;
+        }
+        if (a->object[i] != NULL && memcmp(a->object[i], b->object[i], sizeof(phylib_object)) != 0)
+        {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+int main(void)
+{
+    int sizes[3] = {16, PHYLIB_MAX_OBJECTS, 64};
+    int mismatches = 0;
+
+    srand(2750);
+    for (int s = 0; s < 3; s++)
+    {
+        time_checks(sizes[s]);
+    }
+
+    for (int t = 0; t < TRIALS; t++)
+    {
+        phylib_table *naive = spread(sizes[t % 3], 1);
+        phylib_table *swept = phylib_copy_table(naive);
+        phylib_broadphase bp;
+        phylib_soa soa;
+        int i, j;
+
+        phylib_soa_init(&soa, swept);
+        phylib_broadphase_init(&bp, swept, &soa);
+        int hit = check_collision_condition(naive);
+        if (phylib_broadphase_collision(&bp, swept, &soa, &i, &j))
+        {
+            phylib_bounce(&swept->object[i], &swept->object[j]);
+            hit = !hit;
+        }
+        if (hit || !same_table(naive, swept))
+        {
+            mismatches++;
+        }
+        phylib_broadphase_free(&bp);
+        phylib_soa_free(&soa);
+        phylib_free_table(naive);
+        phylib_free_table(swept);
+    }
+    printf("bounce order: %d mismatches in %d random tables\n", mismatches, TRIALS);
+
+    return mismatches != 0;
+}
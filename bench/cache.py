@@ -0,0 +1,63 @@
+"""
+Replaying a stored shot through GET /svg_info: the first request reads
+and renders every frame, later ones are served from the ShotCache, and
+requests carrying the ETag get a 304.  Reports the latency and bytes of
+each kind of request and the cache counters.
+
+Run from the top directory after make; the server runs in this process
+on a free port, with its database in a temporary directory.
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import stream  # moves to its temporary directory before importing server
+import server
+
+REQUESTS = 50
+
+
+def get(port, path, headers={}):
+    conn = http.client.HTTPConnection("localhost", port, timeout=600)
+    start = time.perf_counter()
+    conn.request("GET", path, headers=headers)
+    response = conn.getresponse()
+    payload = response.read()
+    seconds = time.perf_counter() - start
+    conn.close()
+    return response.status, response.getheader("ETag"), len(payload), seconds
+
+
+def main():
+    httpd = ThreadingHTTPServer(("localhost", 0), stream.Handler)
+    port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+
+    conn = http.client.HTTPConnection("localhost", port, timeout=600)
+    conn.request("POST", "/shoot", stream.body(), {"Content-Type": "application/json"})
+    conn.getresponse().read()
+    conn.close()
+
+    status, etag, size, miss = get(port, "/svg_info")
+    hits = [get(port, "/svg_info")[3] for i in range(REQUESTS)]
+    revalidated = [get(port, "/svg_info", {"If-None-Match": etag}) for i in range(REQUESTS)]
+    print("miss          %8.2f ms  %8.1f KB" % (miss * 1e3, size / 1024.0))
+    print("hit           %8.2f ms  %8.1f KB" % (min(hits) * 1e3, size / 1024.0))
+    print("If-None-Match %8.2f ms  %8.1f KB  status %d" %
+          (min(r[3] for r in revalidated) * 1e3, revalidated[0][2] / 1024.0, revalidated[0][0]))
+    print("stats", json.dumps(server.shot_cache.stats()))
+
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+if __name__ == "__main__":
+    main()
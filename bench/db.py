@@ -0,0 +1,151 @@
+"""
+Frames per second written to and read from the database for one break
+shot: a writeTable call, TableShot insert and commit per frame, and one
+writeFrames call for the whole shot in each storage format.  Also reports
+database sizes, random access reads of single frames, and migrates a row
+format database to the packed one.
+
+Run from the top directory after make; the database is made in a
+temporary directory.
+"""
+
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Physics
+
+
+def rack():
+    table = Physics.Table()
+    gap = Physics.BALL_DIAMETER + 4.0
+    number = 1
+    for row in range(5):
+        for k in range(row + 1):
+            pos = Physics.Coordinate(
+                Physics.TABLE_WIDTH / 2.0 + (k - row / 2.0) * gap + random.uniform(-1.5, 1.5),
+                Physics.TABLE_WIDTH / 2.0 - row * math.sqrt(3.0) / 2.0 * gap + random.uniform(-1.5, 1.5))
+            table += Physics.StillBall(number, pos)
+            number += 1
+
+    pos = Physics.Coordinate(Physics.TABLE_WIDTH / 2.0, Physics.TABLE_LENGTH - Physics.TABLE_WIDTH / 2.0)
+    vel = Physics.Coordinate(40.0, -1500.0)
+    speed = math.hypot(vel.x, vel.y)
+    acc = Physics.Coordinate(-vel.x / speed * Physics.DRAG, -vel.y / speed * Physics.DRAG)
+    table += Physics.RollingBall(0, pos, vel, acc)
+    return table
+
+
+def segments(table):
+    result = []
+    while table is not None:
+        following = table.segment()
+        if following is None:
+            break
+        result.append(table.frames(Physics.FRAME_RATE, round((following.time - table.time) / Physics.FRAME_RATE)))
+        table = following
+    return result
+
+
+def fresh(storage):
+    """
+    A new database in its own temporary directory.
+    """
+    os.chdir(tempfile.mkdtemp())
+    db = Physics.Database(reset=True, storage=storage)
+    db.createDB()
+    return db
+
+
+def size():
+    """
+    Size of the database file in KB, once the pool has checkpointed the
+    WAL into it.
+    """
+    Physics.connectionPool().close()
+    return os.path.getsize("phylib.db") / 1024.0
+
+
+def read_all(db, ids):
+    start = time.perf_counter()
+    tables = [db.readTable(i) for i in ids]
+    return time.perf_counter() - start, tables
+
+
+def max_error(a, b):
+    """
+    Largest difference in any ball coordinate between two lists of tables.
+    """
+    error = 0.0
+    for x, y in zip(a, b):
+        for p, q in zip(x, y):
+            if isinstance(p, Physics.RollingBall):
+                p, q = p.obj.rolling_ball, q.obj.rolling_ball
+                error = max(error, abs(p.vel.x - q.vel.x), abs(p.vel.y - q.vel.y))
+            elif isinstance(p, Physics.StillBall):
+                p, q = p.obj.still_ball, q.obj.still_ball
+            else:
+                continue
+            error = max(error, abs(p.pos.x - q.pos.x), abs(p.pos.y - q.pos.y))
+    return error
+
+
+def main():
+    random.seed(2750)
+    shot = segments(rack())
+    frames = sum(len(f) for f in shot)
+    print("%d frames" % frames)
+
+    db = fresh(Physics.STORAGE_ROWS)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # writeTable prints every ID
+        for f in shot:
+            for i in range(len(f)):
+                table = f[i]
+                table.time = f.time(i)
+                table_id = db.writeTable(table)
+                db.conn.execute("INSERT INTO TableShot (SHOTID, TABLEID) VALUES (?, ?)", (1, table_id))
+                db.conn.commit()
+    per_frame = time.perf_counter() - start
+    db.close()
+    print("writeTable per frame    %9.1f frames/s %8.1f us/frame" % (frames / per_frame, per_frame / frames * 1e6))
+
+    results = {}
+    for storage in (Physics.STORAGE_ROWS, Physics.STORAGE_PACKED, Physics.STORAGE_KEYFRAME):
+        db = fresh(storage)
+        start = time.perf_counter()
+        ids = db.writeFrames(1, shot)
+        bulk = time.perf_counter() - start
+        read, tables = read_all(db, ids)
+        shuffled = list(ids)
+        random.shuffle(shuffled)
+        seek, _ = read_all(db, shuffled[:200])
+        db.close()
+        results[storage] = tables
+
+        print("writeFrames %-11s %9.1f frames/s %8.1f us/frame  read %8.1f frames/s  random %8.1f us/frame  %6.1f KB" %
+              (storage, frames / bulk, bulk / frames * 1e6, frames / read, seek / 200 * 1e6,
+               size()))
+
+    for storage in (Physics.STORAGE_PACKED, Physics.STORAGE_KEYFRAME):
+        print("largest %s/rows difference: %.2g" % (storage, max_error(results[Physics.STORAGE_ROWS], results[storage])))
+
+    db = fresh(Physics.STORAGE_ROWS)
+    ids = db.writeFrames(1, shot)
+    start = time.perf_counter()
+    db.migrate()
+    migrate = time.perf_counter() - start
+    read, tables = read_all(db, ids)
+    db.close()
+    print("migrate rows to packed  %9.1f frames/s  matches packed writes: %s  %6.1f KB" %
+          (frames / migrate, max_error(tables, results[Physics.STORAGE_PACKED]) == 0.0, size()))
+
+
+if __name__ == "__main__":
+    main()
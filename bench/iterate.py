@@ -0,0 +1,110 @@
+"""
+Python-side walks of a racked table: every slot through the shared-cursor
+iterator and if-chain class patching Table used to have, every slot
+through the fresh iterator and OBJECT_CLASSES, and the balls alone from
+Table.balls; then cueBall by walking the slots and through the table's
+ball index, and the pairs a nested loop sees.
+Reports microseconds per call.
+
+Run from the top directory after make.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import phylib
+import Physics
+
+NUMBER = 20000
+
+
+class CursorTable(Physics.Table):
+    """
+    Table iteration as it was: one cursor per table, shared by every loop.
+    """
+
+    def __init__(self, capacity=Physics.MAX_OBJECTS):
+        Physics.Table.__init__(self, capacity)
+        self.current = -1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        self.current += 1
+        if self.current < self.capacity:
+            return self[self.current]
+        self.current = -1
+        raise StopIteration
+
+    def __getitem__(self, index):
+        result = self.get_object(index)
+        if result == None:
+            return None
+        if result.type == phylib.PHYLIB_STILL_BALL:
+            result.__class__ = Physics.StillBall
+        if result.type == phylib.PHYLIB_ROLLING_BALL:
+            result.__class__ = Physics.RollingBall
+        if result.type == phylib.PHYLIB_HOLE:
+            result.__class__ = Physics.Hole
+        if result.type == phylib.PHYLIB_HCUSHION:
+            result.__class__ = Physics.HCushion
+        if result.type == phylib.PHYLIB_VCUSHION:
+            result.__class__ = Physics.VCushion
+        return result
+
+    def cueBall(self):
+        for ball in self:
+            if (isinstance(ball, Physics.StillBall) and ball.obj.still_ball.number == 0 or
+                    isinstance(ball, Physics.RollingBall) and ball.obj.rolling_ball.number == 0):
+                self.current = -1
+                return ball
+        return None
+
+
+def rack(table):
+    for number in range(1, 16):
+        table += Physics.StillBall(number, Physics.Coordinate(
+            200.0 + (number % 5) * 70.0, 400.0 + (number // 5) * 70.0))
+    table += Physics.StillBall(0, Physics.Coordinate(150.0, 2550.0))
+    return table
+
+
+def pairs(table, limit=100000):
+    """
+    The pairs of slots a nested loop over table visits, or None if it is
+    still going after limit.
+    """
+    count = 0
+    for a in table:
+        for b in table:
+            count += 1
+            if count == limit:
+                return None
+    return count
+
+
+def per_call(fn):
+    return timeit.timeit(fn, number=NUMBER) / NUMBER * 1e6
+
+
+def main():
+    before = rack(CursorTable())
+    after = rack(Physics.Table())
+
+    print("walk     cursor %7.2f us  fresh %7.2f us  balls %7.2f us" %
+          (per_call(lambda: [obj for obj in before]), per_call(lambda: [obj for obj in after]),
+           per_call(after.balls)))
+    print("cueBall  cursor %7.2f us  index %7.2f us" % (per_call(before.cueBall), per_call(after.cueBall)))
+    print("ball(8)  balls  %7.2f us  index %7.2f us" %
+          (per_call(lambda: [ball for ball in after.balls() if ball.obj.still_ball.number == 8]),
+           per_call(lambda: after.ball(8))))
+    # the shared cursor is wound back by the inner loop, so the outer one
+    # starts over for ever
+    print("nested   cursor %s pairs  fresh %s pairs" % (pairs(before) or "endless", pairs(after)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Load test for server.py: CLIENTS threads each post SHOTS shots to /shoot,
+every client in its own game, while a prober keeps fetching /shoot.html.
+Reports shots per second and p50/p99 latency of the shots and of the page
+at each concurrency, for the threaded server against a plain HTTPServer
+that serves one request at a time (as server.py used to).
+
+Run from the top directory after make; the server runs in this process
+on a free port, with its database in a temporary directory.
+"""
+
+import http.client
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import HTTPServer, ThreadingHTTPServer
+
+top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, top)
+os.chdir(tempfile.mkdtemp())
+shutil.copy(os.path.join(top, "shoot.html"), ".")
+import Physics
+import server
+
+CONCURRENCY = (1, 2, 4, 8)
+SHOTS = 8
+
+
+def body(gameName):
+    """
+    A shot request: the cue ball rolling the length of the table, past a
+    rack of still balls, into the far corner pocket.
+    """
+    table = Physics.Table()
+    for number in range(1, 16):
+        table += Physics.StillBall(number, Physics.Coordinate(
+            200.0 + (number % 5) * 70.0, 400.0 + (number // 5) * 70.0))
+    table += Physics.StillBall(0, Physics.Coordinate(150.0, 2550.0))
+    # the server negates the velocity it is sent
+    return json.dumps({"svg": table.svg(), "velocityX": -120.0, "velocityY": 255.0,
+                       "gameName": gameName, "playerName": "Player1"})
+
+
+def request(port, method, path, payload=None):
+    conn = http.client.HTTPConnection("localhost", port, timeout=600)
+    start = time.perf_counter()
+    conn.request(method, path, payload, {"Content-Type": "application/json"} if payload else {})
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return response.status, time.perf_counter() - start
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return math.nan
+    return values[min(len(values) - 1, int(p / 100.0 * len(values)))]
+
+
+class Handler(server.MyHandler):
+    def log_message(self, format, *args):
+        pass  # a line per request would drown the results
+
+
+def run(server_class, clients):
+    httpd = server_class(("localhost", 0), Handler)
+    port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+
+    shots = []
+    pages = []
+    busy = [0]
+    done = threading.Event()
+
+    def client(n):
+        payload = body("Load %d" % n)
+        for i in range(SHOTS):
+            status, seconds = request(port, "POST", "/shoot", payload)
+            if status == 503:
+                busy[0] += 1
+            else:
+                shots.append(seconds)
+
+    def prober():
+        while not done.is_set():
+            pages.append(request(port, "GET", "/shoot.html")[1])
+            time.sleep(0.01)
+
+    probe = threading.Thread(target=prober)
+    probe.start()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    probe.join()
+
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+    return len(shots) / elapsed, shots, pages, busy[0]
+
+
+def main():
+    with Physics.Database() as db:
+        for n in range(max(CONCURRENCY)):
+            db.setGame("Load %d" % n, "Player1", "Player2")
+
+    print("%d shot worker(s), %d CPU(s)" % (server.SIM_WORKERS, os.cpu_count() or 1))
+    for name, server_class in (("HTTPServer", HTTPServer), ("Threading", ThreadingHTTPServer)):
+        for clients in CONCURRENCY:
+            rate, shots, pages, busy = run(server_class, clients)
+            print("%-10s %2d clients %6.1f shots/s  shot p50 %7.1f ms p99 %7.1f ms  "
+                  "page p50 %7.1f ms p99 %7.1f ms  %d turned away" %
+                  (name, clients, rate, percentile(shots, 50) * 1e3, percentile(shots, 99) * 1e3,
+                   percentile(pages, 50) * 1e3, percentile(pages, 99) * 1e3, busy))
+
+
+if __name__ == "__main__":
+    main()
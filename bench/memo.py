@@ -0,0 +1,78 @@
+"""
+A coaching session: SETUPS different table setups, each played REPEATS
+times in a shuffled order through Game.strike, without a SimulationCache,
+with one in memory, and with one persisted in SQLite and opened again by
+a fresh cache (as after a restart).  Reports the time per shot, the hit
+rate and the simulation CPU time the hits saved.
+
+Run from the top directory after make; the databases are made in a
+temporary directory.
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Physics
+
+SETUPS = 8
+REPEATS = 6
+
+
+def setup(seed):
+    """
+    A rack with some jitter and a cue strike, both picked by seed.
+    """
+    rng = random.Random(seed)
+    table = Physics.Table()
+    gap = Physics.BALL_DIAMETER + 4.0
+    number = 1
+    for row in range(5):
+        for k in range(row + 1):
+            table += Physics.StillBall(number, Physics.Coordinate(
+                Physics.TABLE_WIDTH / 2.0 + (k - row / 2.0) * gap + rng.uniform(-1.5, 1.5),
+                Physics.TABLE_WIDTH / 2.0 - row * math.sqrt(3.0) / 2.0 * gap + rng.uniform(-1.5, 1.5)))
+            number += 1
+    table += Physics.StillBall(0, Physics.Coordinate(
+        Physics.TABLE_WIDTH / 2.0 + rng.uniform(-100.0, 100.0), Physics.TABLE_LENGTH - Physics.TABLE_WIDTH / 2.0))
+    return table, rng.uniform(-60.0, 60.0), -rng.uniform(600.0, 1200.0)
+
+
+def session(game):
+    """
+    Seconds per shot for the whole session.
+    """
+    order = [seed for seed in range(SETUPS) for i in range(REPEATS)]
+    random.Random(2750).shuffle(order)
+    start = time.perf_counter()
+    for seed in order:
+        table, xvel, yvel = setup(seed)
+        for frames in game.strike(table, xvel, yvel):
+            pass
+    return (time.perf_counter() - start) / len(order)
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    game = Physics.Game(gameName="Coach", player1Name="Coach", player2Name="Student")
+
+    print("no cache          %8.1f ms/shot" % (session(game) * 1e3))
+    for name, cache in (("memory", Physics.SimulationCache()),
+                        ("sqlite", Physics.SimulationCache(path="simulations.db")),
+                        ("sqlite reopened", None)):
+        if cache is None:
+            cache = Physics.SimulationCache(path="simulations.db")
+        game.cache = cache
+        per_shot = session(game)
+        stats = cache.stats()
+        print("%-17s %8.1f ms/shot  hit rate %5.1f%%  simulated %6.2f s  saved %6.2f s" %
+              (name, per_shot * 1e3, stats["hit_rate"] * 100.0,
+               stats["simulated_seconds"], stats["saved_seconds"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+/*
+ * Shots per second from phylib_simulate_batch_parallel at 1, 2, 4 and one
+ * worker per core, checking every run against the single worker result.
+ */
+
+#include "phylib.h"
+#include "rack.h"
+
+#define SHOTS (48)
+#define NUMBERS (16)
+
+int main(void)
+{
+    static double velocity[SHOTS * 2];
+    static double position[2][SHOTS * NUMBERS * 2];
+    static unsigned char pocketed[2][SHOTS * NUMBERS];
+    static int first_contact[2][SHOTS];
+    static double time[2][SHOTS];
+    int workers[4] = {1, 2, 4, phylib_workers()};
+    int mismatches = 0;
+
+    srand(2750);
+    phylib_table *table = rack(0.0, -1500.0);
+    for (int s = 0; s < SHOTS; s++)
+    {
+        velocity[2 * s] = 25.0 * (s - SHOTS / 2);
+        velocity[2 * s + 1] = -1500.0;
+    }
+
+    printf("%d cores\n", phylib_workers());
+    for (int solver = PHYLIB_SOLVER_STEP; solver <= PHYLIB_SOLVER_EVENT; solver++)
+    {
+        for (int w = 0; w < 4; w++)
+        {
+            int out = w > 0;
+            double start = now();
+            phylib_simulate_batch_parallel(table, solver, SHOTS, velocity, NUMBERS, position[out], pocketed[out],
+                                           first_contact[out], time[out], workers[w]);
+            double elapsed = now() - start;
+
+            if (out && (memcmp(position[0], position[1], sizeof(position[0])) != 0 ||
+                        memcmp(pocketed[0], pocketed[1], sizeof(pocketed[0])) != 0 ||
+                        memcmp(first_contact[0], first_contact[1], sizeof(first_contact[0])) != 0 ||
+                        memcmp(time[0], time[1], sizeof(time[0])) != 0))
+            {
+                mismatches++;
+            }
+            printf("%-6s %2d workers %9.4f s %10.1f shots/s\n", solver == PHYLIB_SOLVER_STEP ? "step" : "event",
+                   workers[w], elapsed, SHOTS / elapsed);
+        }
+    }
+    printf("results differing from 1 worker: %d\n", mismatches);
+
+    phylib_free_table(table);
+    return mismatches != 0;
+}
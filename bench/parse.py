@@ -0,0 +1,55 @@
+"""
+The cost of reading the table out of a shot request, for a full rack:
+the page's SVG parsed as XML (as /shoot used to be sent), the same balls
+as a [number, x, y] list, and the ID of a table the server has stored.
+Reports microseconds per request and the request size.
+
+Run from the top directory after make; the database is made in a
+temporary directory.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, top)
+os.chdir(tempfile.mkdtemp())
+import Physics
+import server
+
+REQUESTS = 2000
+
+
+def rack():
+    table = Physics.Table()
+    for number in range(1, 16):
+        table += Physics.StillBall(number, Physics.Coordinate(
+            200.0 + (number % 5) * 70.0, 400.0 + (number // 5) * 70.0))
+    table += Physics.StillBall(0, Physics.Coordinate(150.0, 2550.0))
+    return table
+
+
+def main():
+    table = rack()
+    with Physics.Database() as db:
+        tableID = db.writeTable(table)
+    balls = server.stored_balls(tableID)
+
+    handler = server.MyHandler.__new__(server.MyHandler)  # parse_shot needs no connection
+    for name, request in (("svg", {"svg": table.svg()}),
+                          ("balls", {"balls": balls}),
+                          ("table", {"table": tableID})):
+        request.update(velocityX=-100.0, velocityY=400.0)
+        payload = json.dumps(request).encode("utf-8")
+        start = time.perf_counter()
+        for i in range(REQUESTS):
+            handler.parse_shot(payload)
+        seconds = (time.perf_counter() - start) / REQUESTS
+        print("%-6s %8.1f us/request  %6d bytes" % (name, seconds * 1e6, len(payload)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Concurrent readers and a writer on one database: READERS threads replay
+random shots with readTableRange while a writer stores new ones with
+writeFrames, each request opening its own Database.  Compares a fresh
+sqlite3.connect per request in the default rollback journal mode (as
+Database used to) with the ConnectionPool, and reports requests per
+second, latency and "database is locked" errors.
+
+Run from the top directory after make; the databases are made in a
+temporary directory.
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import db as bench_db
+import Physics
+
+SHOTS = 20
+READERS = 4
+DURATION = 3.0
+
+
+class Unpooled(Physics.Database):
+    """
+    Database as it was before the pool: a new connection per object.
+    """
+
+    def __init__(self, storage=Physics.STORAGE_PACKED):
+        self.storage = storage
+        self.conn = sqlite3.connect("phylib.db")
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+def segments(table):
+    result = []
+    while table is not None:
+        following = table.segment(Physics.SOLVER_EVENT)
+        if following is None:
+            break
+        result.append(table.frames(Physics.FRAME_RATE, round((following.time - table.time) / Physics.FRAME_RATE)))
+        table = following
+    return result
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(p / 100.0 * len(values)))]
+
+
+def run(database, shots):
+    """
+    Runs the readers and the writer for DURATION seconds against a fresh
+    database made with database(), and returns the stats per request type.
+    """
+    db = database()
+    db.createDB()
+    db.setGame("Bench", "Reader", "Writer")
+    ranges = [db.writeFrames(db.newShot("Bench", "Writer"), shot) for shot in shots]
+    db.close()
+
+    stop = time.perf_counter() + DURATION
+    stats = {"read": ([], [0]), "write": ([], [0])}
+    lock = threading.Lock()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        while time.perf_counter() < stop:
+            ids = rng.choice(ranges)
+            start = time.perf_counter()
+            try:
+                db = database()
+                try:
+                    db.readTableRange(ids.start, ids.stop)
+                finally:
+                    db.close()
+            except sqlite3.OperationalError:
+                with lock:
+                    stats["read"][1][0] += 1
+                continue
+            with lock:
+                stats["read"][0].append(time.perf_counter() - start)
+
+    def writer():
+        rng = random.Random(0)
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            try:
+                db = database()
+                try:
+                    db.writeFrames(db.newShot("Bench", "Writer"), rng.choice(shots))
+                finally:
+                    db.close()
+            except sqlite3.OperationalError:
+                with lock:
+                    stats["write"][1][0] += 1
+                continue
+            with lock:
+                stats["write"][0].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=reader, args=(n,)) for n in range(READERS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return stats
+
+
+def main():
+    random.seed(2750)
+    shots = [segments(bench_db.rack()) for i in range(SHOTS)]
+
+    for name, database in (("connect", lambda: Unpooled(Physics.STORAGE_PACKED)),
+                           ("pool", lambda: Physics.Database(storage=Physics.STORAGE_PACKED))):
+        os.chdir(tempfile.mkdtemp())
+        stats = run(database, shots)
+        for kind, (times, errors) in stats.items():
+            print("%-7s %-5s %7.1f requests/s  p50 %7.2f ms  p99 %7.2f ms  %d locked" %
+                  (name, kind, len(times) / DURATION, percentile(times, 50) * 1e3,
+                   percentile(times, 99) * 1e3, errors[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+/*
+ * Seeded table layouts shared by the benchmark harnesses.
+ * Include after phylib.h (or phylib.c) and seed rand() first.
+ */
+
+#include <sys/time.h>
+
+static double nudge(void)
+{
+    return 3.0 * rand() / RAND_MAX - 1.5;
+}
+
+// Fifteen racked balls and a cue ball rolling up the table.
+static phylib_table *rack(double xvel, double yvel)
+{
+    phylib_table *table = phylib_new_table();
+    double gap = PHYLIB_BALL_DIAMETER + 4.0;
+    unsigned char number = 1;
+
+    for (int row = 0; row < 5; row++)
+    {
+        for (int k = 0; k <= row; k++)
+        {
+            phylib_coord pos = {
+                PHYLIB_TABLE_WIDTH / 2.0 + (k - row / 2.0) * gap + nudge(),
+                PHYLIB_TABLE_WIDTH / 2.0 - row * sqrt(3.0) / 2.0 * gap + nudge()};
+            phylib_add_object(table, phylib_new_still_ball(number++, &pos));
+        }
+    }
+
+    double speed = sqrt(xvel * xvel + yvel * yvel);
+    phylib_coord pos = {PHYLIB_TABLE_WIDTH / 2.0 + nudge(), PHYLIB_TABLE_LENGTH - PHYLIB_TABLE_WIDTH / 2.0};
+    phylib_coord vel = {xvel, yvel};
+    phylib_coord acc = {-xvel / speed * PHYLIB_DRAG, -yvel / speed * PHYLIB_DRAG};
+    phylib_add_object(table, phylib_new_rolling_ball(0, &pos, &vel, &acc));
+
+    return table;
+}
+
+// Wall time, so that multi-threaded runs are not charged for every thread.
+static double now(void)
+{
+    struct timeval tv;
+    gettimeofday(&tv, NULL);
+    return tv.tv_sec + tv.tv_usec * 1e-6;
+}
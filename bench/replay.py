@@ -0,0 +1,96 @@
+"""
+Replaying one shot from a database holding 100 shots: readTable called
+for one table ID after another (as server.py used to) against a single
+readTables query, with and without the createDB indexes, for both
+storage formats.
+
+Run from the top directory after make; the databases are made in a
+temporary directory.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import db as bench_db
+import Physics
+
+SHOTS = 100
+REPLAYS = 5
+LOOP_FRAMES = 50
+
+
+def segments(table):
+    # the event solver keeps building 100 shots quick
+    result = []
+    while table is not None:
+        following = table.segment(Physics.SOLVER_EVENT)
+        if following is None:
+            break
+        result.append(table.frames(Physics.FRAME_RATE, round((following.time - table.time) / Physics.FRAME_RATE)))
+        table = following
+    return result
+
+
+def replay(db, shots, indexed):
+    """
+    Seconds per frame for the readTable loop and for readTables, and the
+    average frames per shot read.  Without indexes every read scans the
+    whole database, so only one shot is replayed and the loop only reads
+    its first LOOP_FRAMES frames.
+    """
+    if not indexed:
+        for index in ("BallTableByTable", "TableShotByShot", "FrameByShot"):
+            db.conn.execute("DROP INDEX IF EXISTS " + index)
+
+    picks = random.sample(sorted(shots), REPLAYS if indexed else 1)
+
+    start = time.perf_counter()
+    looped = 0
+    for shotID in picks:
+        last = shots[shotID].stop if indexed else min(shots[shotID].stop, shots[shotID].start + LOOP_FRAMES)
+        table_id = shots[shotID].start
+        table = db.readTable(table_id)
+        while table and table_id < last:
+            looped += 1
+            table_id += 1
+            table = db.readTable(table_id)
+    one_by_one = (time.perf_counter() - start) / looped
+
+    start = time.perf_counter()
+    read = 0
+    for shotID in picks:
+        read += len(db.readTables(shotID))
+    bulk = (time.perf_counter() - start) / read
+
+    return one_by_one, bulk, read / len(picks)
+
+
+def main():
+    random.seed(2750)
+    shots = []
+    for s in range(SHOTS):
+        shots.append(segments(bench_db.rack()))
+    frames = sum(len(f) for shot in shots for f in shot)
+    print("%d shots, %d frames" % (SHOTS, frames))
+
+    for storage in (Physics.STORAGE_ROWS, Physics.STORAGE_PACKED):
+        for indexed in (False, True):
+            db = bench_db.fresh(storage)
+            ids = {}
+            for shotID, shot in enumerate(shots, 1):
+                ids[shotID] = db.writeFrames(shotID, shot)
+
+            one_by_one, bulk, frames = replay(db, ids, indexed)
+            db.close()
+            print("%-6s %-10s readTable loop %8.3f ms/frame  readTables %6.3f ms/frame"
+                  " %7.1f ms/shot  x%.1f" %
+                  (storage, "indexed" if indexed else "no indexes", one_by_one * 1e3, bulk * 1e3,
+                   bulk * frames * 1e3, one_by_one / bulk))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+/*
+ * Cost of one stepper step on a full rack with every ball rolling: the
+ * object-by-object update_rolling_balls and condition checks against the
+ * phylib_soa loops phylib_segment now uses.  Rolling and the stop test are
+ * timed on their own, then with the collision check included.
+ */
+
+#include <time.h>
+#include "phylib.h"
+#include "rack.h"
+
+#define STEPS (200000)
+
+int main(void)
+{
+    srand(2750);
+    phylib_table *table = rack(150.0, -1500.0);
+
+    // Start the racked balls rolling too, slowly enough that nothing meets
+    for (int i = 10; i < table->count; i++)
+    {
+        phylib_object *object = table->object[i];
+        if (object != NULL && object->type == PHYLIB_STILL_BALL)
+        {
+            phylib_coord pos = object->obj.still_ball.pos;
+            phylib_coord vel = {20.0 * nudge(), 20.0 * nudge()};
+            phylib_coord acc = {-vel.x / phylib_length(vel) * PHYLIB_DRAG, -vel.y / phylib_length(vel) * PHYLIB_DRAG};
+            *object = (phylib_object){.type = PHYLIB_ROLLING_BALL,
+                                      .obj.rolling_ball = {object->obj.still_ball.number, pos, vel, acc}};
+        }
+    }
+
+    phylib_table *current = phylib_copy_table(table);
+    phylib_soa start, balls;
+    phylib_broadphase bp;
+    int a, b, hits = 0;
+
+    phylib_soa_init(&start, table);
+    phylib_soa_init(&balls, table);
+    phylib_broadphase_init(&bp, table, &balls);
+
+    for (int collide = 0; collide <= 1; collide++)
+    {
+        double begin = now();
+        for (int k = 0; k < STEPS; k++)
+        {
+            update_rolling_balls(current, table, (k % 10 + 1) * PHYLIB_SIM_RATE);
+            hits += check_stopped_condition(current);
+            if (collide)
+            {
+                hits += check_collision_condition(current);
+            }
+        }
+        double objects = (now() - begin) / STEPS;
+
+        begin = now();
+        for (int k = 0; k < STEPS; k++)
+        {
+            phylib_soa_roll(&balls, &start, (k % 10 + 1) * PHYLIB_SIM_RATE);
+            hits += phylib_soa_stopped(&balls) >= 0;
+            if (collide)
+            {
+                hits += phylib_broadphase_collision(&bp, current, &balls, &a, &b);
+            }
+        }
+        double arrays = (now() - begin) / STEPS;
+
+        printf("%d balls %-22s objects %7.1f ns  soa %7.1f ns  x%.1f\n", balls.n,
+               collide ? "roll+stop+collision" : "roll+stop", objects * 1e9, arrays * 1e9, objects / arrays);
+    }
+    if (hits)
+    {
+        printf("(unexpected stop or collision)\n");
+    }
+
+    phylib_broadphase_free(&bp);
+    phylib_soa_free(&balls);
+    phylib_soa_free(&start);
+    phylib_free_table(current);
+    phylib_free_table(table);
+    return 0;
+}
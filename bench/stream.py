@@ -0,0 +1,100 @@
+"""
+Time to the first frame, total time, bytes sent and peak Python memory
+for one long shot played through /shoot (every frame's SVG in one JSON
+array), /shoot/stream (a Server-Sent Event per frame as it is simulated)
+and /shoot/frames (the compact ball positions of each segment).  The
+client reads the response in 64 KB pieces and throws them away, so the
+memory is what the server holds.
+
+Run from the top directory after make; the server runs in this process
+on a free port, with its database in a temporary directory.
+"""
+
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import ThreadingHTTPServer
+
+top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, top)
+os.chdir(tempfile.mkdtemp())
+import Physics
+import server
+
+RUNS = 3
+
+
+def body():
+    """
+    A shot request: the cue ball off a few cushions and into a pocket,
+    1643 frames long.
+    """
+    table = Physics.Table()
+    for number in range(1, 16):
+        table += Physics.StillBall(number, Physics.Coordinate(
+            200.0 + (number % 5) * 70.0, 400.0 + (number // 5) * 70.0))
+    table += Physics.StillBall(0, Physics.Coordinate(150.0, 2550.0))
+    # the server negates the velocity it is sent
+    return json.dumps({"svg": table.svg(), "velocityX": -100.0, "velocityY": 400.0})
+
+
+class Handler(server.MyHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def shoot(port, path, payload):
+    """
+    Seconds to the first frame and to the end of the response, and its
+    size in bytes.
+    """
+    conn = http.client.HTTPConnection("localhost", port, timeout=600)
+    start = time.perf_counter()
+    conn.request("POST", path, payload, {"Content-Type": "application/json"})
+    response = conn.getresponse()
+    first = None
+    size = 0
+    while True:
+        piece = response.read1(65536)
+        if not piece:
+            break
+        if first is None and (path == "/shoot" or b"event: frame" in piece or b"event: segment" in piece):
+            first = time.perf_counter() - start
+        size += len(piece)
+    conn.close()
+    return first, time.perf_counter() - start, size
+
+
+def main():
+    httpd = ThreadingHTTPServer(("localhost", 0), Handler)
+    port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+    payload = body()
+
+    sent = {}
+    for path in ("/shoot", "/shoot/stream", "/shoot/frames"):
+        runs = [shoot(port, path, payload) for i in range(RUNS)]
+        tracemalloc.start()
+        shoot(port, path, payload)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        first = min(run[0] for run in runs)
+        total = min(run[1] for run in runs)
+        sent[path] = runs[0][2]
+        print("%-14s first frame %8.1f ms  whole shot %8.1f ms  %8.1f KB sent  peak %8.1f KB" %
+              (path, first * 1e3, total * 1e3, runs[0][2] / 1024.0, peak / 1024.0))
+    print("/shoot/frames sends %.1fx fewer bytes than /shoot" % (sent["/shoot"] / float(sent["/shoot/frames"])))
+
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+if __name__ == "__main__":
+    main()
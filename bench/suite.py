@@ -0,0 +1,235 @@
+"""
+The benchmark suite: four table layouts, each built from SEED so every
+run plays the same shots, timed through every layer a shot goes through.
+
+  break    a jittered rack broken from the head of the table
+  bank     one ball off a side cushion
+  long     the cue ball alone, round and round the cushions
+  crowded  fifteen balls scattered over the table
+
+For each one it measures phylib_segment (through Table.segment, with both
+solvers), Table.roll at every frame time, Table.svg of every frame,
+Database.writeTable and readTable of every frame in each storage format,
+and POST /shoot against a server in this process, with and without its
+SimulationCache.  Every rate but the writes is the best of RUNS; /shoot
+is the median of REQUESTS.  Prints the results as one JSON object, so
+two runs can be diffed.
+
+Run from the top directory after make; the databases are made in
+temporary directories and the server listens on a free port.
+"""
+
+import contextlib
+import http.client
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.chdir(tempfile.mkdtemp())
+import Physics
+import server
+
+SEED = 2750
+RUNS = 5
+REQUESTS = 10
+STORAGES = (Physics.STORAGE_ROWS, Physics.STORAGE_PACKED, Physics.STORAGE_KEYFRAME)
+POCKETS = [(x, y) for x in (0.0, Physics.TABLE_WIDTH) for y in (0.0, Physics.TABLE_LENGTH / 2.0, Physics.TABLE_LENGTH)]
+
+
+def break_shot(rng):
+    balls = []
+    gap = Physics.BALL_DIAMETER + 4.0
+    number = 1
+    for row in range(5):
+        for k in range(row + 1):
+            balls.append([number,
+                          Physics.TABLE_WIDTH / 2.0 + (k - row / 2.0) * gap + rng.uniform(-1.5, 1.5),
+                          Physics.TABLE_WIDTH / 2.0 - row * math.sqrt(3.0) / 2.0 * gap + rng.uniform(-1.5, 1.5)])
+            number += 1
+    balls.append([0, Physics.TABLE_WIDTH / 2.0 + rng.uniform(-1.5, 1.5), Physics.TABLE_LENGTH - Physics.TABLE_WIDTH / 2.0])
+    return balls, rng.uniform(-20.0, 20.0), -1500.0
+
+
+def toward(x0, y0, x1, y1, speed):
+    distance = math.hypot(x1 - x0, y1 - y0)
+    return (x1 - x0) / distance * speed, (y1 - y0) / distance * speed
+
+
+def bank_shot(rng):
+    x, y = 1000.0 + rng.uniform(-5.0, 5.0), 900.0 + rng.uniform(-5.0, 5.0)
+    # at the ball's reflection in the right cushion
+    return [[1, x, y], [0, 400.0, 2000.0]], *toward(400.0, 2000.0, 2.0 * Physics.TABLE_WIDTH - x, y, 1000.0)
+
+
+def long_shot(rng):
+    return [[0, 150.0, 2550.0]], 2400.0 + rng.uniform(-50.0, 50.0), -900.0
+
+
+def crowded_shot(rng):
+    spots = []
+    while len(spots) < 16:
+        x = rng.uniform(60.0, Physics.TABLE_WIDTH - 60.0)
+        y = rng.uniform(60.0, Physics.TABLE_LENGTH - 60.0)
+        # clear of the other balls and of the pockets
+        if all(math.hypot(x - a, y - b) > Physics.BALL_DIAMETER + 10.0 for a, b in spots) and \
+           all(math.hypot(x - a, y - b) > Physics.HOLE_RADIUS + 40.0 for a, b in POCKETS):
+            spots.append((x, y))
+    balls = [[number, x, y] for number, (x, y) in enumerate(spots)]
+    return balls, *toward(*spots[0], *spots[1], 1500.0)
+
+
+SCENARIOS = (("break", break_shot), ("bank", bank_shot), ("long", long_shot), ("crowded", crowded_shot))
+
+
+def struck(balls, xvel, yvel):
+    """
+    The table of balls with its cue ball struck as the server strikes it.
+    """
+    table = server.table_from_balls(balls)
+    server.game_instance.strike(table, xvel, yvel)  # sets the cue ball rolling, simulates nothing
+    return table
+
+
+def best(fn):
+    """
+    The fewest seconds fn took over RUNS calls, and what it returned.
+    """
+    seconds = None
+    for run in range(RUNS):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    return seconds, result
+
+
+def play(table, solver):
+    """
+    The number of segments in the shot from table.
+    """
+    count = 0
+    while table is not None:
+        table = table.segment(solver)
+        count += 1
+    return count - 1
+
+
+def fresh(storage):
+    """
+    A new database in its own temporary directory.
+    """
+    os.chdir(tempfile.mkdtemp())
+    db = Physics.Database(reset=True, storage=storage)
+    db.createDB()
+    return db
+
+
+def storage(tables, storage):
+    db = fresh(storage)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # writeTable prints its IDs in the row format
+        ids = [db.writeTable(table) for table in tables]
+    write = time.perf_counter() - start
+    read, _ = best(lambda: [db.readTable(i) for i in ids])
+    db.close()
+    Physics.connectionPool().close()
+    return {"write_per_s": len(tables) / write, "read_per_s": len(tables) / read}
+
+
+def shoot(port, payload):
+    """
+    Milliseconds for one POST /shoot, and the size of its response.
+    """
+    conn = http.client.HTTPConnection("localhost", port, timeout=600)
+    start = time.perf_counter()
+    conn.request("POST", "/shoot", payload, {"Content-Type": "application/json"})
+    response = conn.getresponse()
+    size = len(response.read())
+    elapsed = time.perf_counter() - start
+    conn.close()
+    assert response.status == 200, "POST /shoot answered %d" % response.status
+    return elapsed * 1e3, size
+
+
+def serve(port, payload, cache):
+    server.game_instance.cache = cache
+    if cache is not None:
+        shoot(port, payload)  # played once for the cache to replay
+    times = []
+    for i in range(REQUESTS):
+        ms, size = shoot(port, payload)
+        times.append(ms)
+    return statistics.median(times), size
+
+
+class Handler(server.MyHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def scenario(make, port):
+    balls, xvel, yvel = make(random.Random(SEED))
+    result = {"balls": len(balls)}
+
+    for solver, label in ((Physics.SOLVER_STEP, "step"), (Physics.SOLVER_EVENT, "event")):
+        seconds, segments = best(lambda: play(struck(balls, xvel, yvel), solver))
+        result["segment_" + label] = {"segments": segments, "segments_per_s": segments / seconds,
+                                      "shot_ms": seconds * 1e3}
+
+    # the start of each segment and its frame count, as Game.segments has them
+    server.game_instance.cache = None
+    shot = list(server.game_instance.strike(struck(balls, xvel, yvel), xvel, yvel))
+    frames = sum(len(f) for f in shot)
+    result["frames"] = frames
+
+    seconds, _ = best(lambda: [f.start.roll(i * f.rate) for f in shot for i in range(len(f))])
+    result["roll_frames_per_s"] = frames / seconds
+
+    tables = []
+    for f in shot:
+        for i in range(len(f)):
+            table = f[i]
+            table.time = f.time(i)
+            tables.append(table)
+    seconds, _ = best(lambda: [table.svg() for table in tables])
+    result["svg_frames_per_s"] = frames / seconds
+
+    home = os.getcwd()
+    result["database"] = {kind: storage(tables, kind) for kind in STORAGES}
+    os.chdir(home)  # back to the server's database
+
+    # the server negates the velocity it is sent
+    payload = json.dumps({"balls": balls, "velocityX": -xvel, "velocityY": -yvel})
+    result["shoot_ms"], result["shoot_bytes"] = serve(port, payload, None)
+    result["shoot_cached_ms"], _ = serve(port, payload, Physics.SimulationCache())
+    return result
+
+
+def main():
+    httpd = ThreadingHTTPServer(("localhost", 0), Handler)
+    port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+
+    report = {"seed": SEED, "runs": RUNS, "requests": REQUESTS,
+              "python": platform.python_version(), "machine": platform.machine(),
+              "scenarios": {name: scenario(make, port) for name, make in SCENARIOS}}
+
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+    print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Frames rendered to SVG per second for one shot, 1643 frames long: object
+by object through the table iterator (as Table.svg used to), Table.svg of
+each frame, and Frames.svg of each segment in one call.  Checks that all
+three give the same SVG.
+
+Run from the top directory after make; the game's database is made in a
+temporary directory.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Physics
+
+RUNS = 3
+
+
+def objects_svg(table):
+    """
+    Table.svg as it was: every slot through the iterator.
+    """
+    svg_string = Physics.HEADER
+    for obj in table:
+        if obj is not None:
+            svg_string += obj.svg()
+    svg_string += Physics.FOOTER
+    return svg_string
+
+
+def shot():
+    """
+    The Frames of each segment of the shot bench/stream.py plays.
+    """
+    table = Physics.Table()
+    for number in range(1, 16):
+        table += Physics.StillBall(number, Physics.Coordinate(
+            200.0 + (number % 5) * 70.0, 400.0 + (number // 5) * 70.0))
+    table += Physics.StillBall(0, Physics.Coordinate(150.0, 2550.0))
+    game = Physics.Game(gameName="Bench", player1Name="Bench", player2Name="Bench")
+    return list(game.strike(table, 100.0, -400.0))
+
+
+def timed(render):
+    best = None
+    for run in range(RUNS):
+        start = time.perf_counter()
+        frames = render()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return frames, best
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    segments = shot()
+    tables = [frames[i] for frames in segments for i in range(len(frames))]
+
+    before, before_seconds = timed(lambda: [objects_svg(table) for table in tables])
+    print("%-16s %9.0f frames/s" % ("objects", len(tables) / before_seconds))
+    for name, render in (("Table.svg", lambda: [table.svg() for table in tables]),
+                         ("Frames.svg", lambda: [svg for frames in segments for svg in frames.svg()])):
+        frames, seconds = timed(render)
+        assert frames == before, name + " draws a different table"
+        print("%-16s %9.0f frames/s  %5.1fx" % (name, len(tables) / seconds, before_seconds / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,24 @@
+#ifndef _POSIX_C_SOURCE
+#define _POSIX_C_SOURCE 200809L // sysconf
+#endif
+
+#include <pthread.h>
+#include <time.h>
+#include <unistd.h>
 #include "phylib.h"
 
+static int phylib_ball_number(const phylib_object *object);
+
+// Adds n to a phylib_stats counter of table, or one to the narrow-phase
+// tests of a phylib_broadphase, when profiling; see phylib.h
+#ifdef PHYLIB_PROFILE
+#define PHYLIB_COUNT(table, counter, n) ((table)->stats.counter += (n))
+#define PHYLIB_COUNT_NARROW(bp) ((bp)->narrow++)
+#else
+#define PHYLIB_COUNT(table, counter, n) ((void)0)
+#define PHYLIB_COUNT_NARROW(bp) ((void)0)
+#endif
+
 phylib_object *phylib_new_still_ball(unsigned char number, phylib_coord *pos)
 {
     // Allocate memory for phylib_object
@@ -91,8 +110,57 @@ phylib_object *phylib_new_vcushion(double x)
 
 phylib_table *phylib_new_table(void)
 {
+    return phylib_new_table_capacity(PHYLIB_MAX_OBJECTS);
+}
+
+// The slots a table gets each time it grows, and the object pointers for
+// its new capacity.  The pointers of the chunk before are left unused.
+struct phylib_chunk
+{
+    struct phylib_chunk *next;
+    int first; // the slot slots[0] is
+    phylib_object slots[];
+};
+
+// A table and its first slots live in one block: the header, then capacity
+// phylib_objects, then capacity pointers.  object[i] is either NULL or
+// the address of slot i, so copying a table is one malloc.
+static phylib_table *phylib_alloc_table(int capacity)
+{
+    phylib_table *table = (phylib_table *)malloc(sizeof(phylib_table) +
+                                                 capacity * (sizeof(phylib_object) + sizeof(phylib_object *)));
+
+    if (table == NULL)
+    {
+        return NULL;
+    }
+
+    table->slots = (phylib_object *)(table + 1);
+    table->object = (phylib_object **)(table->slots + capacity);
+    table->chunks = NULL;
+    table->capacity = capacity;
+    table->count = 0;
+    table->time = 0.0;
+    for (int n = 0; n < PHYLIB_INDEXED_BALLS; n++)
+    {
+        table->ball_slot[n] = -1;
+    }
+#ifdef PHYLIB_PROFILE
+    memset(&table->stats, 0, sizeof(table->stats));
+#endif
+    return table;
+}
+
+phylib_table *phylib_new_table_capacity(int capacity)
+{
+    // The cushions and holes always take the first ten slots
+    if (capacity < 10)
+    {
+        capacity = 10;
+    }
+
     // Allocate memory for the table structure
-    phylib_table *table = (phylib_table *)malloc(sizeof(phylib_table));
+    phylib_table *table = phylib_alloc_table(capacity);
 
     // Check for memory allocation failure
     if (table == NULL)
@@ -100,26 +168,26 @@ phylib_table *phylib_new_table(void)
         return NULL;
     }
 
-    table->time = 0.0;
-    table->object[0] = phylib_new_hcushion(0.0);
-    table->object[1] = phylib_new_hcushion(PHYLIB_TABLE_LENGTH);
-    table->object[2] = phylib_new_vcushion(0.0);
-    table->object[3] = phylib_new_vcushion(PHYLIB_TABLE_WIDTH);
+    phylib_object *slots = table->slots;
+    slots[0] = (phylib_object){.type = PHYLIB_HCUSHION, .obj.hcushion.y = 0.0};
+    slots[1] = (phylib_object){.type = PHYLIB_HCUSHION, .obj.hcushion.y = PHYLIB_TABLE_LENGTH};
+    slots[2] = (phylib_object){.type = PHYLIB_VCUSHION, .obj.vcushion.x = 0.0};
+    slots[3] = (phylib_object){.type = PHYLIB_VCUSHION, .obj.vcushion.x = PHYLIB_TABLE_WIDTH};
 
     // Add holes at the four corners
-    table->object[4] = phylib_new_hole(&(phylib_coord){0.0, 0.0});
-    table->object[5] = phylib_new_hole(&(phylib_coord){0.0, PHYLIB_TABLE_WIDTH});
-    table->object[6] = phylib_new_hole(&(phylib_coord){0.0, PHYLIB_TABLE_LENGTH});
-    table->object[7] = phylib_new_hole(&(phylib_coord){PHYLIB_TABLE_WIDTH, 0.0});
+    slots[4] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {0.0, 0.0}};
+    slots[5] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {0.0, PHYLIB_TABLE_WIDTH}};
+    slots[6] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {0.0, PHYLIB_TABLE_LENGTH}};
+    slots[7] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {PHYLIB_TABLE_WIDTH, 0.0}};
 
     // Add two holes midway between top and bottom holes
-    table->object[8] = phylib_new_hole(&(phylib_coord){PHYLIB_TABLE_WIDTH, PHYLIB_TABLE_WIDTH});
-    table->object[9] = phylib_new_hole(&(phylib_coord){PHYLIB_TABLE_WIDTH, PHYLIB_TABLE_LENGTH});
+    slots[8] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {PHYLIB_TABLE_WIDTH, PHYLIB_TABLE_WIDTH}};
+    slots[9] = (phylib_object){.type = PHYLIB_HOLE, .obj.hole.pos = {PHYLIB_TABLE_WIDTH, PHYLIB_TABLE_LENGTH}};
 
-    // Set remaining pointers to NULL
-    for (int i = 10; i < PHYLIB_MAX_OBJECTS; ++i)
+    table->count = 10;
+    for (int i = 0; i < capacity; ++i)
     {
-        table->object[i] = NULL;
+        table->object[i] = (i < table->count) ? &slots[i] : NULL;
     }
     return table;
 }
@@ -160,7 +228,7 @@ phylib_table *phylib_copy_table(phylib_table *table)
         return NULL;
     }
     phylib_table *new_table;
-    new_table = (phylib_table *)malloc(sizeof(phylib_table));
+    new_table = phylib_alloc_table(table->capacity);
 
     if (new_table == NULL)
     {
@@ -168,46 +236,124 @@ phylib_table *phylib_copy_table(phylib_table *table)
         return NULL;
     }
     new_table->time = table->time;
-
-    for (int i = 0; i < PHYLIB_MAX_OBJECTS; ++i)
+    new_table->count = table->count;
+    memcpy(new_table->ball_slot, table->ball_slot, sizeof(table->ball_slot));
+#ifdef PHYLIB_PROFILE
+    new_table->stats = table->stats;
+#endif
+    PHYLIB_COUNT(new_table, allocations, 1);
+
+    // The copy keeps all its slots in one block; only live ones are copied
+    for (int i = 0; i < table->capacity; ++i)
     {
-        if (table->object[i] != NULL)
-        {
-            phylib_copy_object(&(new_table->object[i]), &(table->object[i]));
-        }
-        else
+        new_table->object[i] = NULL;
+        if (i < table->count && table->object[i] != NULL)
         {
-            new_table->object[i] = NULL;
+            new_table->slots[i] = *table->object[i];
+            new_table->object[i] = &new_table->slots[i];
         }
     }
 
     return new_table;
 }
 
-void phylib_add_object(phylib_table *table, phylib_object *object)
+// Add a chunk of slots doubling the capacity.  The slots there already
+// stay where they are, so objects taken from the table before it grew
+// are still valid; only the object pointers move to the new chunk.
+static int phylib_grow_table(phylib_table *table)
+{
+    int capacity = 2 * table->capacity;
+    int added = capacity - table->capacity;
+    struct phylib_chunk *chunk = (struct phylib_chunk *)malloc(sizeof(struct phylib_chunk) +
+                                                               added * sizeof(phylib_object) +
+                                                               capacity * sizeof(phylib_object *));
+
+    if (chunk == NULL)
+    {
+        fprintf(stderr, "Memory allocation failed for phylib_table.\n");
+        return 0;
+    }
+
+    phylib_object **object = (phylib_object **)(chunk->slots + added);
+    memcpy(object, table->object, table->capacity * sizeof(phylib_object *));
+    for (int i = table->capacity; i < capacity; ++i)
+    {
+        object[i] = NULL;
+    }
+
+    chunk->first = table->capacity;
+    chunk->next = table->chunks;
+    table->chunks = chunk;
+    table->object = object;
+    table->capacity = capacity;
+    PHYLIB_COUNT(table, allocations, 1);
+    return 1;
+}
+
+// Where slot i of table is stored.
+static phylib_object *phylib_slot(phylib_table *table, int i)
 {
-    for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+    for (struct phylib_chunk *chunk = table->chunks; chunk != NULL; chunk = chunk->next)
+    {
+        if (i >= chunk->first)
+        {
+            return &chunk->slots[i - chunk->first];
+        }
+    }
+    return &table->slots[i];
+}
+
+phylib_object *phylib_add_object_copy(phylib_table *table, const phylib_object *object)
+{
+    int i;
+
+    for (i = 0; i < table->count; i++)
     {
         // Check if the current pointer is NULL
         if (table->object[i] == NULL)
         {
+            break;
+        }
+    }
 
-            table->object[i] = object;
-            return;
+    // No gaps left, so append, growing the table if it is full
+    if (i == table->count)
+    {
+        if (table->count == table->capacity && !phylib_grow_table(table))
+        {
+            return NULL;
         }
+        table->count++;
+    }
+
+    table->object[i] = phylib_slot(table, i);
+    *table->object[i] = *object;
+
+    int number = phylib_ball_number(object);
+    if (number >= 0 && number < PHYLIB_INDEXED_BALLS)
+    {
+        table->ball_slot[number] = i;
     }
+    return table->object[i];
+}
+
+void phylib_add_object(phylib_table *table, phylib_object *object)
+{
+    // The table keeps its own copy, so the object is released here
+    phylib_add_object_copy(table, object);
+    free(object);
 }
 
 void phylib_free_table(phylib_table *table)
 {
     if (table != NULL)
     {
-        for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+        struct phylib_chunk *chunk = table->chunks;
+        while (chunk != NULL)
         {
-            phylib_object *temp = table->object[i];
-            free(temp);
-
-            table->object[i] = NULL;
+            struct phylib_chunk *next = chunk->next;
+            free(chunk);
+            chunk = next;
         }
     }
     free(table);
@@ -383,8 +529,7 @@ void phylib_bounce(phylib_object **a, phylib_object **b)
         break;
 
     case PHYLIB_HOLE:
-        // Free the memory of a and set it to NULL
-        free(*a);
+        // The ball's slot belongs to the table, so just empty it
         *a = NULL;
         break;
 
@@ -454,7 +599,7 @@ unsigned char phylib_rolling(phylib_table *t)
     unsigned char rollingCount = 0;
 
     // Iterate through the objects in the table
-    for (int i = 10; i < PHYLIB_MAX_OBJECTS; ++i)
+    for (int i = 10; i < t->count; ++i)
     {
         phylib_object *currentObject = t->object[i];
 
@@ -468,8 +613,49 @@ unsigned char phylib_rolling(phylib_table *t)
     return rollingCount;
 }
 
-phylib_table *phylib_segment(phylib_table *table)
+// Counts a bounce off an object of type in table's profile.
+static void phylib_count_bounce(phylib_table *table, phylib_obj type)
+{
+#ifdef PHYLIB_PROFILE
+    switch (type)
+    {
+    case PHYLIB_STILL_BALL:
+        table->stats.still_bounces++;
+        break;
+    case PHYLIB_ROLLING_BALL:
+        table->stats.rolling_bounces++;
+        break;
+    case PHYLIB_HOLE:
+        table->stats.hole_bounces++;
+        break;
+    case PHYLIB_HCUSHION:
+        table->stats.hcushion_bounces++;
+        break;
+    case PHYLIB_VCUSHION:
+        table->stats.vcushion_bounces++;
+        break;
+    }
+#else
+    (void)table;
+    (void)type;
+#endif
+}
+
+#ifdef PHYLIB_PROFILE
+// Seconds on a monotonic clock, for phylib_stats.seconds.
+static double phylib_clock(void)
+{
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return now.tv_sec + now.tv_nsec * 1e-9;
+}
+#endif
+
+// The fixed step solver.  *slot_a and *slot_b get the slots of the two
+// objects that met, or the ball that stopped and -1, or both -1.
+static phylib_table *phylib_step_solver(phylib_table *table, int *slot_a, int *slot_b)
 {
+    *slot_a = *slot_b = -1;
     if (table == NULL)
     {
         return NULL;
@@ -479,33 +665,74 @@ phylib_table *phylib_segment(phylib_table *table)
 
     phylib_table *resultTable = phylib_copy_table(table);
     double currentTime = PHYLIB_SIM_RATE;
-    if (rollingBallsCount > 0)
+    int event = 0;
+
+    // The balls are stepped as phylib_soa arrays and only written back to
+    // resultTable once the segment ends
+    phylib_soa start, balls;
+    phylib_broadphase broadphase;
+    int ready = phylib_soa_init(&start, table);
+    ready = phylib_soa_init(&balls, table) && ready;
+    ready = phylib_broadphase_init(&broadphase, table, &balls) && ready;
+
+    if (resultTable != NULL && ready && rollingBallsCount > 0)
     {
+        PHYLIB_COUNT(resultTable, allocations, 3); // start, balls and broadphase
         while (currentTime <= PHYLIB_MAX_TIME)
         {
-            update_rolling_balls(resultTable, table, currentTime);
+            PHYLIB_COUNT(resultTable, steps, 1);
+            phylib_soa_roll(&balls, &start, currentTime);
 
-            if (check_stopped_condition(resultTable))
+            int a = phylib_soa_stopped(&balls);
+            if (a >= 0)
             {
-                return resultTable; // Stopping condition 1: Ball has stopped
+                phylib_soa_store(&balls, resultTable);
+                phylib_stopped(resultTable->object[balls.slot[a]]);
+                PHYLIB_COUNT(resultTable, stops, 1);
+                *slot_a = balls.slot[a];
+                event = 1;
+                break; // Stopping condition 1: Ball has stopped
             }
 
-            if (check_collision_condition(resultTable))
+            int b;
+            if (phylib_broadphase_collision(&broadphase, resultTable, &balls, &a, &b))
             {
-                return resultTable; // Stopping condition 2: Collision detected and bounce applied
+                phylib_soa_store(&balls, resultTable);
+                phylib_count_bounce(resultTable, resultTable->object[b]->type);
+                phylib_bounce(&resultTable->object[a], &resultTable->object[b]);
+                *slot_a = a;
+                *slot_b = b;
+                event = 1;
+                break; // Stopping condition 2: Collision detected and bounce applied
             }
 
             currentTime += PHYLIB_SIM_RATE;
             resultTable->time += PHYLIB_SIM_RATE; // Time update
         }
+        PHYLIB_COUNT(resultTable, narrow, broadphase.narrow);
     }
-    phylib_free_table(resultTable);
-    return NULL; // Max time reached
+
+    phylib_broadphase_free(&broadphase);
+    phylib_soa_free(&balls);
+    phylib_soa_free(&start);
+
+    if (!event)
+    {
+        phylib_free_table(resultTable);
+        return NULL; // Max time reached
+    }
+    return resultTable;
+}
+
+phylib_table *phylib_segment(phylib_table *table)
+{
+    int a, b;
+    return phylib_segment_contact(table, PHYLIB_SOLVER_STEP, &a, &b);
 }
 
 void update_rolling_balls(phylib_table *resultTable, const phylib_table *table, double currentTime)
 {
-    for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+    for (int i = 0; i < resultTable->count; i++)
     {
         if (resultTable->object[i] != NULL && resultTable->object[i]->type == PHYLIB_ROLLING_BALL)
         {
@@ -516,7 +743,7 @@ void update_rolling_balls(phylib_table *resultTable, const phylib_table *table,
 
 int check_stopped_condition(const phylib_table *resultTable)
 {
-    for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+    for (int i = 0; i < resultTable->count; i++)
     {
         if (resultTable->object[i] != NULL && resultTable->object[i]->type == PHYLIB_ROLLING_BALL && phylib_stopped(resultTable->object[i]))
         {
@@ -528,9 +755,9 @@ int check_stopped_condition(const phylib_table *resultTable)
 
 int check_collision_condition(const phylib_table *resultTable)
 {
-    for (int i = 0; i < PHYLIB_MAX_OBJECTS; i++)
+    for (int i = 0; i < resultTable->count; i++)
     {
-        for (int j = 0; j < PHYLIB_MAX_OBJECTS; j++)
+        for (int j = 0; j < resultTable->count; j++)
         {
             if (i != j && resultTable->object[i] != NULL && resultTable->object[i]->type == PHYLIB_ROLLING_BALL)
             {
@@ -548,52 +775,1159 @@ int check_collision_condition(const phylib_table *resultTable)
     return 0;
 }
 
-char *phylib_object_string(phylib_object *object)
+/*
+ * Structure-of-arrays ball state.
+ *
+ * phylib_segment steps the balls in this form: every ball's position,
+ * velocity and acceleration sit in contiguous arrays, so rolling and the
+ * stop test are straight loops the compiler can vectorise.  The table stays
+ * the canonical form; phylib_soa_init and phylib_soa_store convert between
+ * the two.
+ */
+
+int phylib_soa_init(phylib_soa *soa, const phylib_table *table)
 {
-    static char string[80];
-    if (object == NULL)
+    int n = 0;
+
+    for (int i = 0; i < table->count; i++)
     {
-        snprintf(string, 80, "NULL;");
-        return string;
+        phylib_object *object = table->object[i];
+        if (object != NULL && (object->type == PHYLIB_STILL_BALL || object->type == PHYLIB_ROLLING_BALL))
+        {
+            n++;
+        }
+    }
+
+    // One block: six double arrays, then the slot ints, then the type bytes
+    double *block = (double *)malloc(n * (6 * sizeof(double) + sizeof(int) + 1) + 1);
+    if (block == NULL)
+    {
+        fprintf(stderr, "Memory allocation failed for phylib_soa.\n");
+        soa->n = 0;
+        soa->px = NULL;
+        return 0;
+    }
+
+    soa->n = n;
+    soa->px = block;
+    soa->py = soa->px + n;
+    soa->vx = soa->py + n;
+    soa->vy = soa->vx + n;
+    soa->ax = soa->vy + n;
+    soa->ay = soa->ax + n;
+    soa->slot = (int *)(soa->ay + n);
+    soa->type = (unsigned char *)(soa->slot + n);
+
+    int k = 0;
+    for (int i = 0; i < table->count; i++)
+    {
+        phylib_object *object = table->object[i];
+        if (object == NULL)
+        {
+            continue;
+        }
+
+        if (object->type == PHYLIB_ROLLING_BALL)
+        {
+            phylib_rolling_ball *ball = &(object->obj.rolling_ball);
+            soa->px[k] = ball->pos.x;
+            soa->py[k] = ball->pos.y;
+            soa->vx[k] = ball->vel.x;
+            soa->vy[k] = ball->vel.y;
+            soa->ax[k] = ball->acc.x;
+            soa->ay[k] = ball->acc.y;
+        }
+        else if (object->type == PHYLIB_STILL_BALL)
+        {
+            soa->px[k] = object->obj.still_ball.pos.x;
+            soa->py[k] = object->obj.still_ball.pos.y;
+            soa->vx[k] = soa->vy[k] = 0.0;
+            soa->ax[k] = soa->ay[k] = 0.0;
+        }
+        else
+        {
+            continue;
+        }
+
+        soa->slot[k] = i;
+        soa->type[k] = (unsigned char)object->type;
+        k++;
+    }
+    return 1;
+}
+
+void phylib_soa_store(const phylib_soa *soa, phylib_table *table)
+{
+    for (int k = 0; k < soa->n; k++)
+    {
+        if (soa->type[k] == PHYLIB_ROLLING_BALL)
+        {
+            phylib_rolling_ball *ball = &(table->object[soa->slot[k]]->obj.rolling_ball);
+            ball->pos.x = soa->px[k];
+            ball->pos.y = soa->py[k];
+            ball->vel.x = soa->vx[k];
+            ball->vel.y = soa->vy[k];
+            ball->acc.x = soa->ax[k];
+            ball->acc.y = soa->ay[k];
+        }
+    }
+}
+
+// phylib_roll along one axis for n balls.  The restrict parameters tell the
+// compiler the arrays never overlap, which it needs to vectorise the loop.
+static void phylib_soa_roll_axis(double *restrict pos, double *restrict vel, double *restrict acc,
+                                 const double *restrict pos0, const double *restrict vel0,
+                                 const double *restrict acc0, int n, double time)
+{
+    for (int k = 0; k < n; k++)
+    {
+        double new_vel = vel0[k] + acc0[k] * time;
+        int turned = vel0[k] * new_vel < 0.0;
+
+        pos[k] = pos0[k] + vel0[k] * time + 0.5 * acc0[k] * time * time;
+
+        // A change in sign of the velocity stops it, as in phylib_roll
+        vel[k] = turned ? 0.0 : new_vel;
+        acc[k] = turned ? 0.0 : acc0[k];
+    }
+}
+
+// phylib_roll for every ball at once.  Still balls have zero velocity and
+// acceleration, so rolling them leaves them where they are.
+void phylib_soa_roll(phylib_soa *soa, const phylib_soa *start, double time)
+{
+    phylib_soa_roll_axis(soa->px, soa->vx, soa->ax, start->px, start->vx, start->ax, soa->n, time);
+    phylib_soa_roll_axis(soa->py, soa->vy, soa->ay, start->py, start->vy, start->ay, soa->n, time);
+}
+
+// Index of the first rolling ball slower than PHYLIB_VEL_EPSILON, or -1.
+// Squared speeds are compared, so the loop has no sqrt in it.
+int phylib_soa_stopped(const phylib_soa *soa)
+{
+    const double *restrict vx = soa->vx;
+    const double *restrict vy = soa->vy;
+    const unsigned char *restrict type = soa->type;
+    const double epsilon2 = PHYLIB_VEL_EPSILON * PHYLIB_VEL_EPSILON;
+    int n = soa->n;
+    int stopped = 0;
+
+    for (int k = 0; k < n; k++)
+    {
+        stopped |= (type[k] == PHYLIB_ROLLING_BALL) & (vx[k] * vx[k] + vy[k] * vy[k] < epsilon2);
+    }
+
+    if (stopped)
+    {
+        for (int k = 0; k < n; k++)
+        {
+            if (type[k] == PHYLIB_ROLLING_BALL && vx[k] * vx[k] + vy[k] * vy[k] < epsilon2)
+            {
+                return k;
+            }
+        }
+    }
+    return -1;
+}
+
+void phylib_soa_free(phylib_soa *soa)
+{
+    free(soa->px);
+    soa->px = NULL;
+    soa->n = 0;
+}
+
+// Same test as phylib_distance(ball k, fixed) < 0.0, on squared distances.
+static int phylib_soa_overlap(const phylib_soa *soa, int k, const phylib_object *fixed)
+{
+    double dx, dy;
+
+    switch (fixed->type)
+    {
+    case PHYLIB_HCUSHION:
+        return fabs(soa->py[k] - fixed->obj.hcushion.y) < PHYLIB_BALL_RADIUS;
+    case PHYLIB_VCUSHION:
+        return fabs(soa->px[k] - fixed->obj.vcushion.x) < PHYLIB_BALL_RADIUS;
+    case PHYLIB_HOLE:
+        dx = soa->px[k] - fixed->obj.hole.pos.x;
+        dy = soa->py[k] - fixed->obj.hole.pos.y;
+        return dx * dx + dy * dy < PHYLIB_HOLE_RADIUS * PHYLIB_HOLE_RADIUS;
+    default:
+        return 0;
+    }
+}
+
+int phylib_broadphase_init(phylib_broadphase *bp, const phylib_table *table, const phylib_soa *soa)
+{
+    bp->nballs = soa->n;
+    bp->nfixed = 0;
+#ifdef PHYLIB_PROFILE
+    bp->narrow = 0;
+#endif
+    bp->ball = (int *)malloc((2 * soa->n + table->count) * sizeof(int));
+
+    if (bp->ball == NULL)
+    {
+        fprintf(stderr, "Memory allocation failed for phylib_broadphase.\n");
+        bp->nballs = 0;
+        return 0;
+    }
+    bp->rank = bp->ball + soa->n;
+    bp->fixed = bp->rank + soa->n;
+
+    for (int k = 0; k < soa->n; k++)
+    {
+        bp->ball[k] = k;
+    }
+
+    for (int i = 0; i < table->count; i++)
+    {
+        phylib_object *object = table->object[i];
+        if (object != NULL && object->type != PHYLIB_STILL_BALL && object->type != PHYLIB_ROLLING_BALL)
+        {
+            bp->fixed[bp->nfixed++] = i;
+        }
+    }
+    return 1;
+}
+
+void phylib_broadphase_free(phylib_broadphase *bp)
+{
+    free(bp->ball);
+    bp->ball = bp->fixed = bp->rank = NULL;
+}
+
+int phylib_broadphase_collision(phylib_broadphase *bp, const phylib_table *table, const phylib_soa *soa, int *a, int *b)
+{
+    const double *px = soa->px;
+    const double *py = soa->py;
+    int n = bp->nballs;
+
+    // Restore x order.  Balls move very little in one step, so the
+    // insertion sort hardly ever swaps anything.
+    for (int k = 1; k < n; k++)
+    {
+        int ball = bp->ball[k];
+        int m = k;
+        while (m > 0 && px[bp->ball[m - 1]] > px[ball])
+        {
+            bp->ball[m] = bp->ball[m - 1];
+            m--;
+        }
+        bp->ball[m] = ball;
+    }
+
+    for (int k = 0; k < n; k++)
+    {
+        bp->rank[bp->ball[k]] = k;
+    }
+
+    // Report the same pair check_collision_condition would: the lowest
+    // rolling slot with any overlap, then the lowest slot it overlaps.
+    // Balls are loaded in slot order, so ball order is slot order.
+    for (int k = 0; k < n; k++)
+    {
+        if (soa->type[k] != PHYLIB_ROLLING_BALL)
+        {
+            continue;
+        }
+
+        int j = table->count;
+
+        for (int f = 0; f < bp->nfixed; f++)
+        {
+            PHYLIB_COUNT_NARROW(bp);
+            if (phylib_soa_overlap(soa, k, table->object[bp->fixed[f]]))
+            {
+                j = bp->fixed[f];
+                break;
+            }
+        }
+
+        for (int m = bp->rank[k] - 1; m >= 0; m--)
+        {
+            int other = bp->ball[m];
+            double dx = px[k] - px[other];
+            double dy = py[k] - py[other];
+            if (dx >= PHYLIB_BALL_DIAMETER)
+            {
+                break;
+            }
+            PHYLIB_COUNT_NARROW(bp);
+            if (soa->slot[other] < j && dx * dx + dy * dy < PHYLIB_BALL_DIAMETER * PHYLIB_BALL_DIAMETER)
+            {
+                j = soa->slot[other];
+            }
+        }
+        for (int m = bp->rank[k] + 1; m < n; m++)
+        {
+            int other = bp->ball[m];
+            double dx = px[other] - px[k];
+            double dy = py[other] - py[k];
+            if (dx >= PHYLIB_BALL_DIAMETER)
+            {
+                break;
+            }
+            PHYLIB_COUNT_NARROW(bp);
+            if (soa->slot[other] < j && dx * dx + dy * dy < PHYLIB_BALL_DIAMETER * PHYLIB_BALL_DIAMETER)
+            {
+                j = soa->slot[other];
+            }
+        }
+
+        if (j < table->count)
+        {
+            *a = soa->slot[k];
+            *b = j;
+            return 1; // Collision detected
+        }
     }
+    return 0;
+}
+
+/*
+ * Event driven solver.
+ *
+ * Between events every ball follows pos + vel*t + 0.5*acc*t^2, so the gap
+ * between two objects is a polynomial in t of degree four at most.  Instead
+ * of stepping by PHYLIB_SIM_RATE the solver finds the earliest time at which
+ * a ball stops or touches another ball, a cushion or a hole and jumps
+ * straight there.  Compared with phylib_segment, event times agree to within
+ * one PHYLIB_SIM_RATE step and positions to within |vel| * PHYLIB_SIM_RATE.
+ */
+
+static void phylib_motion(phylib_object *object, phylib_coord *pos, phylib_coord *vel, phylib_coord *acc)
+{
+    vel->x = vel->y = 0.0;
+    acc->x = acc->y = 0.0;
+    pos->x = pos->y = 0.0;
+
     switch (object->type)
     {
     case PHYLIB_STILL_BALL:
-        snprintf(string, 80,
-                 "STILL_BALL (%d,%6.1lf,%6.1lf)",
-                 object->obj.still_ball.number,
-                 object->obj.still_ball.pos.x,
-                 object->obj.still_ball.pos.y);
+        *pos = object->obj.still_ball.pos;
         break;
     case PHYLIB_ROLLING_BALL:
-        snprintf(string, 80,
-                 "ROLLING_BALL (%d,%6.1lf,%6.1lf,%6.1lf,%6.1lf,%6.1lf,%6.1lf)",
-                 object->obj.rolling_ball.number,
-                 object->obj.rolling_ball.pos.x,
-                 object->obj.rolling_ball.pos.y,
-                 object->obj.rolling_ball.vel.x,
-                 object->obj.rolling_ball.vel.y,
-                 object->obj.rolling_ball.acc.x,
-                 object->obj.rolling_ball.acc.y);
+        *pos = object->obj.rolling_ball.pos;
+        *vel = object->obj.rolling_ball.vel;
+        *acc = object->obj.rolling_ball.acc;
         break;
-
     case PHYLIB_HOLE:
-        snprintf(string, 80,
-                 "HOLE (%6.1lf,%6.1lf)",
-                 object->obj.hole.pos.x,
-                 object->obj.hole.pos.y);
+        *pos = object->obj.hole.pos;
         break;
     case PHYLIB_HCUSHION:
-        snprintf(string, 80,
-                 "HCUSHION (%6.1lf)",
-                 object->obj.hcushion.y);
+        pos->y = object->obj.hcushion.y;
         break;
     case PHYLIB_VCUSHION:
-        snprintf(string, 80,
-                 "VCUSHION (%6.1lf)",
-                 object->obj.vcushion.x);
+        pos->x = object->obj.vcushion.x;
         break;
     }
-    return string;
+}
+
+static double phylib_poly_eval(const double *c, int degree, double t)
+{
+    double value = 0.0;
+
+    for (int k = degree; k >= 0; k--)
+    {
+        value = value * t + c[k];
+    }
+    return value;
+}
+
+// Bisect [lo, hi] for the point where the sign of the polynomial changes and
+// return the end on the non-positive side.  Returns 0 if there is no change.
+static int phylib_poly_bisect(const double *c, int degree, double lo, double hi, double *root)
+{
+    int lo_positive = phylib_poly_eval(c, degree, lo) > 0.0;
+    int hi_positive = phylib_poly_eval(c, degree, hi) > 0.0;
+
+    if (lo_positive == hi_positive)
+    {
+        return 0;
+    }
+
+    for (int k = 0; k < 200; k++)
+    {
+        double mid = 0.5 * (lo + hi);
+        if (mid <= lo || mid >= hi)
+        {
+            break;
+        }
+        if ((phylib_poly_eval(c, degree, mid) > 0.0) == lo_positive)
+        {
+            lo = mid;
+        }
+        else
+        {
+            hi = mid;
+        }
+    }
+
+    *root = lo_positive ? hi : lo;
+    return 1;
+}
+
+// Find the real roots of the polynomial in [lo, hi] in ascending order.  The
+// roots of the derivative split the interval into monotonic pieces and each
+// piece holds at most one root.
+static int phylib_poly_roots(const double *c, int degree, double lo, double hi, double *roots)
+{
+    double deriv[4];
+    double bounds[6];
+    int nbounds = 0;
+    int count = 0;
+
+    while (degree > 0 && c[degree] == 0.0)
+    {
+        degree--;
+    }
+    if (degree == 0)
+    {
+        return 0;
+    }
+
+    bounds[nbounds++] = lo;
+    if (degree > 1)
+    {
+        for (int k = 0; k < degree; k++)
+        {
+            deriv[k] = (k + 1) * c[k + 1];
+        }
+        nbounds += phylib_poly_roots(deriv, degree - 1, lo, hi, &bounds[nbounds]);
+    }
+    bounds[nbounds++] = hi;
+
+    for (int i = 0; i + 1 < nbounds; i++)
+    {
+        if (phylib_poly_bisect(c, degree, bounds[i], bounds[i + 1], &roots[count]))
+        {
+            count++;
+        }
+    }
+    return count;
+}
+
+// Coefficients of |dp + dv*t + 0.5*da*t^2|^2 - radius^2, lowest power first.
+static void phylib_gap_poly(phylib_coord dp, phylib_coord dv, phylib_coord da, double radius, double *c)
+{
+    phylib_coord half = {0.5 * da.x, 0.5 * da.y};
+
+    c[0] = phylib_dot_product(dp, dp) - radius * radius;
+    c[1] = 2.0 * phylib_dot_product(dp, dv);
+    c[2] = phylib_dot_product(dv, dv) + 2.0 * phylib_dot_product(dp, half);
+    c[3] = 2.0 * phylib_dot_product(dv, half);
+    c[4] = phylib_dot_product(half, half);
+}
+
+// Earliest time in [0, horizon] at which the gap polynomial becomes
+// non-positive while closing, or -1.0 if it never does.  Pairs that start
+// out overlapping but are already separating (as right after a bounce) are
+// ignored.
+static double phylib_first_contact(const double *c, double horizon)
+{
+    double deriv[4];
+    double bounds[6];
+    double root;
+    int nbounds = 0;
+
+    for (int k = 0; k < 4; k++)
+    {
+        deriv[k] = (k + 1) * c[k + 1];
+    }
+
+    bounds[nbounds++] = 0.0;
+    nbounds += phylib_poly_roots(deriv, 3, 0.0, horizon, &bounds[nbounds]);
+    bounds[nbounds++] = horizon;
+
+    for (int i = 0; i + 1 < nbounds; i++)
+    {
+        if (phylib_poly_eval(c, 4, bounds[i]) <= 0.0)
+        {
+            if (i == 0 && phylib_poly_eval(deriv, 3, 0.0) < 0.0)
+            {
+                return 0.0;
+            }
+            continue;
+        }
+        if (phylib_poly_bisect(c, 4, bounds[i], bounds[i + 1], &root))
+        {
+            return root;
+        }
+    }
+    return -1.0;
+}
+
+// Time at which a rolling ball first drops below PHYLIB_VEL_EPSILON.
+static double phylib_stop_time(const phylib_rolling_ball *ball, double horizon)
+{
+    double c[5];
+
+    if (phylib_length(ball->vel) < PHYLIB_VEL_EPSILON)
+    {
+        return 0.0;
+    }
+
+    c[0] = phylib_dot_product(ball->vel, ball->vel) - PHYLIB_VEL_EPSILON * PHYLIB_VEL_EPSILON;
+    c[1] = 2.0 * phylib_dot_product(ball->vel, ball->acc);
+    c[2] = phylib_dot_product(ball->acc, ball->acc);
+    c[3] = 0.0;
+    c[4] = 0.0;
+
+    return phylib_first_contact(c, horizon);
+}
+
+// Roll every ball on the table forward by time, zeroing any velocity
+// component that reaches (or passes) zero as phylib_roll does.
+static void phylib_advance(phylib_table *table, double time)
+{
+    for (int i = 0; i < table->count; i++)
+    {
+        phylib_object *object = table->object[i];
+
+        if (object != NULL && object->type == PHYLIB_ROLLING_BALL)
+        {
+            phylib_object old = *object;
+            phylib_rolling_ball *ball = &(object->obj.rolling_ball);
+            phylib_rolling_ball *was = &(old.obj.rolling_ball);
+
+            phylib_roll(object, &old, time);
+
+            if (was->vel.x * was->acc.x < 0.0 && was->vel.x * ball->vel.x <= 0.0)
+            {
+                ball->vel.x = 0.0;
+                ball->acc.x = 0.0;
+            }
+            if (was->vel.y * was->acc.y < 0.0 && was->vel.y * ball->vel.y <= 0.0)
+            {
+                ball->vel.y = 0.0;
+                ball->acc.y = 0.0;
+            }
+        }
+    }
+}
+
+// The event driven solver; reports the objects involved like
+// phylib_step_solver.
+static phylib_table *phylib_event_solver(phylib_table *table, int *slot_a, int *slot_b)
+{
+    *slot_a = *slot_b = -1;
+    if (table == NULL || phylib_rolling(table) == 0)
+    {
+        return NULL;
+    }
+
+    phylib_table *resultTable = phylib_copy_table(table);
+    if (resultTable == NULL)
+    {
+        return NULL;
+    }
+
+    double elapsed = 0.0;
+
+    while (elapsed < PHYLIB_MAX_TIME)
+    {
+        PHYLIB_COUNT(resultTable, steps, 1);
+        double horizon = PHYLIB_MAX_TIME - elapsed;
+        int kink = 0;
+
+        // A velocity component reaching zero changes the equations of motion,
+        // so no event search may look past it.
+        for (int i = 0; i < resultTable->count; i++)
+        {
+            phylib_object *object = resultTable->object[i];
+            if (object == NULL || object->type != PHYLIB_ROLLING_BALL)
+            {
+                continue;
+            }
+
+            phylib_rolling_ball *ball = &(object->obj.rolling_ball);
+            if (ball->vel.x * ball->acc.x < 0.0 && -ball->vel.x / ball->acc.x < horizon)
+            {
+                horizon = -ball->vel.x / ball->acc.x;
+                kink = 1;
+            }
+            if (ball->vel.y * ball->acc.y < 0.0 && -ball->vel.y / ball->acc.y < horizon)
+            {
+                horizon = -ball->vel.y / ball->acc.y;
+                kink = 1;
+            }
+        }
+
+        // Stops are checked first so that they win ties, as in phylib_segment.
+        double when = horizon;
+        int a = -1;
+        int b = -1;
+
+        for (int i = 0; i < resultTable->count; i++)
+        {
+            phylib_object *object = resultTable->object[i];
+            if (object == NULL || object->type != PHYLIB_ROLLING_BALL)
+            {
+                continue;
+            }
+
+            double t = phylib_stop_time(&(object->obj.rolling_ball), horizon);
+            if (t >= 0.0 && (a < 0 || t < when))
+            {
+                when = t;
+                a = i;
+                b = -1;
+            }
+        }
+
+        for (int i = 0; i < resultTable->count; i++)
+        {
+            phylib_object *object = resultTable->object[i];
+            if (object == NULL || object->type != PHYLIB_ROLLING_BALL)
+            {
+                continue;
+            }
+
+            phylib_coord pos_i, vel_i, acc_i;
+            phylib_motion(object, &pos_i, &vel_i, &acc_i);
+
+            for (int j = 0; j < resultTable->count; j++)
+            {
+                phylib_object *other = resultTable->object[j];
+                if (j == i || other == NULL)
+                {
+                    continue;
+                }
+                // rolling pairs were already tried from the lower index
+                if (other->type == PHYLIB_ROLLING_BALL && j < i)
+                {
+                    continue;
+                }
+
+                phylib_coord pos_j, vel_j, acc_j;
+                phylib_motion(other, &pos_j, &vel_j, &acc_j);
+
+                phylib_coord dp = phylib_sub(pos_i, pos_j);
+                phylib_coord dv = phylib_sub(vel_i, vel_j);
+                phylib_coord da = phylib_sub(acc_i, acc_j);
+                double radius;
+                double c[5];
+
+                switch (other->type)
+                {
+                case PHYLIB_HCUSHION:
+                    dp.x = dv.x = da.x = 0.0;
+                    radius = PHYLIB_BALL_RADIUS;
+                    break;
+                case PHYLIB_VCUSHION:
+                    dp.y = dv.y = da.y = 0.0;
+                    radius = PHYLIB_BALL_RADIUS;
+                    break;
+                case PHYLIB_HOLE:
+                    radius = PHYLIB_HOLE_RADIUS;
+                    break;
+                default:
+                    radius = PHYLIB_BALL_DIAMETER;
+                    break;
+                }
+
+                phylib_gap_poly(dp, dv, da, radius, c);
+                PHYLIB_COUNT(resultTable, narrow, 1);
+                double t = phylib_first_contact(c, when);
+                if (t >= 0.0 && (a < 0 || t < when))
+                {
+                    when = t;
+                    a = i;
+                    b = j;
+                }
+            }
+        }
+
+        if (a >= 0)
+        {
+            phylib_advance(resultTable, when);
+            resultTable->time += when;
+
+            if (b < 0)
+            {
+                phylib_object *object = resultTable->object[a];
+                object->type = PHYLIB_STILL_BALL;
+                object->obj.still_ball.number = object->obj.rolling_ball.number;
+                object->obj.still_ball.pos = object->obj.rolling_ball.pos;
+                PHYLIB_COUNT(resultTable, stops, 1);
+            }
+            else
+            {
+                phylib_count_bounce(resultTable, resultTable->object[b]->type);
+                phylib_bounce(&resultTable->object[a], &resultTable->object[b]);
+            }
+            *slot_a = a;
+            *slot_b = b;
+            return resultTable;
+        }
+
+        if (!kink)
+        {
+            break; // nothing happens before PHYLIB_MAX_TIME
+        }
+
+        phylib_advance(resultTable, horizon);
+        resultTable->time += horizon;
+        elapsed += horizon;
+    }
+
+    phylib_free_table(resultTable);
+    return NULL; // Max time reached
+}
+
+phylib_table *phylib_segment_event(phylib_table *table)
+{
+    int a, b;
+    return phylib_segment_contact(table, PHYLIB_SOLVER_EVENT, &a, &b);
+}
+
+phylib_table *phylib_segment_solver(phylib_table *table, phylib_solver solver)
+{
+    int a, b;
+    return phylib_segment_contact(table, solver, &a, &b);
+}
+
+phylib_table *phylib_segment_contact(phylib_table *table, phylib_solver solver, int *a, int *b)
+{
+#ifdef PHYLIB_PROFILE
+    double start = phylib_clock();
+#endif
+    phylib_table *result = solver == PHYLIB_SOLVER_EVENT ? phylib_event_solver(table, a, b)
+                                                         : phylib_step_solver(table, a, b);
+#ifdef PHYLIB_PROFILE
+    if (result != NULL)
+    {
+        result->stats.segments++;
+        result->stats.seconds += phylib_clock() - start;
+    }
+#endif
+    return result;
+}
+
+phylib_stats *phylib_profile(phylib_table *table)
+{
+#ifdef PHYLIB_PROFILE
+    return &table->stats;
+#else
+    (void)table;
+    return NULL;
+#endif
+}
+
+/*
+ * Batched shots.
+ *
+ * Plays many candidate cue strikes from one table without going back to
+ * Python between segments.  All outputs are flat arrays indexed by shot and
+ * ball number, so a caller can hand in NumPy buffers directly.
+ */
+
+// Ball number of a still or rolling ball, -1 for anything else.
+static int phylib_ball_number(const phylib_object *object)
+{
+    if (object == NULL)
+    {
+        return -1;
+    }
+    switch (object->type)
+    {
+    case PHYLIB_STILL_BALL:
+        return object->obj.still_ball.number;
+    case PHYLIB_ROLLING_BALL:
+        return object->obj.rolling_ball.number;
+    default:
+        return -1;
+    }
+}
+
+// Set ball number 0 rolling with the given velocity and the matching drag.
+static int phylib_strike(phylib_table *table, double xvel, double yvel)
+{
+    phylib_object *object = phylib_find_ball(table, 0);
+    if (object == NULL)
+    {
+        return 0;
+    }
+
+    phylib_coord pos = object->type == PHYLIB_STILL_BALL ? object->obj.still_ball.pos : object->obj.rolling_ball.pos;
+    phylib_coord vel = {xvel, yvel};
+    phylib_coord acc = {0.0, 0.0};
+    double speed = phylib_length(vel);
+
+    if (speed > PHYLIB_VEL_EPSILON)
+    {
+        acc.x = -vel.x / speed * PHYLIB_DRAG;
+        acc.y = -vel.y / speed * PHYLIB_DRAG;
+    }
+
+    object->type = PHYLIB_ROLLING_BALL;
+    object->obj.rolling_ball.number = 0;
+    object->obj.rolling_ball.pos = pos;
+    object->obj.rolling_ball.vel = vel;
+    object->obj.rolling_ball.acc = acc;
+    return 1;
+}
+
+int phylib_simulate_batch(phylib_table *table, phylib_solver solver, int nshots, const double *velocity,
+                          int nnumbers, double *position, unsigned char *pocketed, int *first_contact, double *time)
+{
+    for (int shot = 0; shot < nshots; shot++)
+    {
+        double *pos = position + 2 * nnumbers * shot;
+        unsigned char *sunk = pocketed + nnumbers * shot;
+        phylib_table *current = phylib_copy_table(table);
+
+        if (current == NULL)
+        {
+            return 0;
+        }
+        if (!phylib_strike(current, velocity[2 * shot], velocity[2 * shot + 1]))
+        {
+            phylib_free_table(current);
+            return 0; // no cue ball
+        }
+
+        first_contact[shot] = -1;
+        for (;;)
+        {
+            int a, b;
+            phylib_table *next = phylib_segment_contact(current, solver, &a, &b);
+            if (next == NULL)
+            {
+                break;
+            }
+
+            // The slots still hold the balls as they were before the bounce
+            if (first_contact[shot] < 0 && b >= 0)
+            {
+                int na = phylib_ball_number(current->object[a]);
+                int nb = phylib_ball_number(current->object[b]);
+                if (na == 0 && nb >= 0)
+                {
+                    first_contact[shot] = nb;
+                }
+                else if (nb == 0 && na >= 0)
+                {
+                    first_contact[shot] = na;
+                }
+            }
+
+            phylib_free_table(current);
+            current = next;
+        }
+
+        for (int n = 0; n < nnumbers; n++)
+        {
+            pos[2 * n] = pos[2 * n + 1] = NAN;
+            sunk[n] = 0;
+        }
+        for (int i = 0; i < table->count; i++)
+        {
+            int n = phylib_ball_number(table->object[i]);
+            if (n >= 0 && n < nnumbers)
+            {
+                sunk[n] = 1; // cleared below if the ball is still on the table
+            }
+        }
+        for (int i = 0; i < current->count; i++)
+        {
+            phylib_object *object = current->object[i];
+            int n = phylib_ball_number(object);
+            if (n >= 0 && n < nnumbers)
+            {
+                phylib_coord at = object->type == PHYLIB_STILL_BALL ? object->obj.still_ball.pos : object->obj.rolling_ball.pos;
+                pos[2 * n] = at.x;
+                pos[2 * n + 1] = at.y;
+                sunk[n] = 0;
+            }
+        }
+
+        time[shot] = current->time - table->time;
+        phylib_free_table(current);
+    }
+    return 1;
+}
+
+// One worker's share of phylib_simulate_batch_parallel: a contiguous run of
+// shots, so each result lands where the serial call would put it.
+typedef struct
+{
+    phylib_table *table;
+    phylib_solver solver;
+    int nshots;
+    const double *velocity;
+    int nnumbers;
+    double *position;
+    unsigned char *pocketed;
+    int *first_contact;
+    double *time;
+    int ok;
+    int threaded; // 1 if the slice runs on its own thread
+} phylib_batch_slice;
+
+static void *phylib_batch_worker(void *arg)
+{
+    phylib_batch_slice *slice = (phylib_batch_slice *)arg;
+    slice->ok = phylib_simulate_batch(slice->table, slice->solver, slice->nshots, slice->velocity, slice->nnumbers,
+                                      slice->position, slice->pocketed, slice->first_contact, slice->time);
+    return NULL;
+}
+
+int phylib_workers(void)
+{
+    long cores = sysconf(_SC_NPROCESSORS_ONLN);
+    return cores > 0 ? (int)cores : 1;
+}
+
+int phylib_simulate_batch_parallel(phylib_table *table, phylib_solver solver, int nshots, const double *velocity,
+                                   int nnumbers, double *position, unsigned char *pocketed, int *first_contact,
+                                   double *time, int workers)
+{
+    if (workers <= 0)
+    {
+        workers = phylib_workers();
+    }
+    if (workers > nshots)
+    {
+        workers = nshots;
+    }
+    if (workers <= 1)
+    {
+        return phylib_simulate_batch(table, solver, nshots, velocity, nnumbers, position, pocketed, first_contact, time);
+    }
+
+    phylib_batch_slice *slices = (phylib_batch_slice *)malloc(workers * (sizeof(phylib_batch_slice) + sizeof(pthread_t)));
+    if (slices == NULL)
+    {
+        fprintf(stderr, "Memory allocation failed for phylib_batch_slice.\n");
+        return 0;
+    }
+    pthread_t *threads = (pthread_t *)(slices + workers);
+
+    int first = 0;
+    for (int w = 0; w < workers; w++)
+    {
+        int count = nshots / workers + (w < nshots % workers);
+        slices[w] = (phylib_batch_slice){table, solver, count, velocity + 2 * first, nnumbers,
+                                         position + 2 * nnumbers * first, pocketed + nnumbers * first,
+                                         first_contact + first, time + first, 0, 0};
+        first += count;
+    }
+
+    // Worker 0 runs on the calling thread; a thread that cannot be started
+    // has its slice run here too.
+    int ok = 1;
+    for (int w = 1; w < workers; w++)
+    {
+        slices[w].threaded = pthread_create(&threads[w], NULL, phylib_batch_worker, &slices[w]) == 0;
+        if (!slices[w].threaded)
+        {
+            phylib_batch_worker(&slices[w]);
+        }
+    }
+    phylib_batch_worker(&slices[0]);
+    for (int w = 0; w < workers; w++)
+    {
+        if (slices[w].threaded)
+        {
+            pthread_join(threads[w], NULL);
+        }
+        ok = ok && slices[w].ok;
+    }
+
+    free(slices);
+    return ok;
+}
+
+/*
+ * Ball index.
+ *
+ * A table remembers the slot each ball below PHYLIB_INDEXED_BALLS was added
+ * to (phylib_add_object_copy), and copies keep it (phylib_copy_table).
+ * Balls never change slots: phylib_stopped and phylib_bounce change a
+ * ball's type in place, and a pocket only empties its slot, which the
+ * lookup notices because the slot no longer holds the ball.
+ */
+
+// The ball numbered number on table, or NULL if it is not on it.
+phylib_object *phylib_find_ball(phylib_table *table, int number)
+{
+    if (number < 0)
+    {
+        return NULL; // what phylib_ball_number gives everything else
+    }
+    if (number < PHYLIB_INDEXED_BALLS)
+    {
+        int slot = table->ball_slot[number];
+        if (slot >= 0 && slot < table->count && phylib_ball_number(table->object[slot]) == number)
+        {
+            return table->object[slot];
+        }
+        if (slot < 0)
+        {
+            return NULL; // never added
+        }
+    }
+
+    // A sunk ball, a number past the index, or a ball whose slot was given
+    // to another one: look through the table.  The index is not updated,
+    // so that a lookup never writes to a table other threads may be
+    // reading (phylib_simulate_batch_parallel)
+    for (int i = 0; i < table->count; i++)
+    {
+        if (phylib_ball_number(table->object[i]) == number)
+        {
+            return table->object[i];
+        }
+    }
+    return NULL;
+}
+
+// Fills numbers, which has room for PHYLIB_INDEXED_BALLS, with the balls
+// added to table (or to the table it was copied from) that are no longer
+// on it, in order, and returns how many there are.
+int phylib_pocketed(phylib_table *table, int *numbers)
+{
+    int count = 0;
+    for (int n = 0; n < PHYLIB_INDEXED_BALLS; n++)
+    {
+        if (table->ball_slot[n] >= 0 && phylib_find_ball(table, n) == NULL)
+        {
+            numbers[count++] = n;
+        }
+    }
+    return count;
+}
+
+/*
+ * Frames.
+ *
+ * Game.shoot records a segment as frames FRAME_RATE apart.  These roll the
+ * segment's start table natively, either to one frame or to every frame at
+ * once as packed rows, instead of rebuilding the table in Python.
+ */
+
+int phylib_ball_count(phylib_table *table)
+{
+    int count = 0;
+    for (int i = 0; i < table->count; i++)
+    {
+        count += phylib_ball_number(table->object[i]) >= 0;
+    }
+    return count;
+}
+
+phylib_table *phylib_roll_table(phylib_table *table, double time)
+{
+    phylib_table *result = phylib_copy_table(table);
+    if (result == NULL)
+    {
+        return NULL;
+    }
+
+    for (int i = 0; i < table->count; i++)
+    {
+        if (table->object[i] != NULL && table->object[i]->type == PHYLIB_ROLLING_BALL)
+        {
+            phylib_roll(result->object[i], table->object[i], time);
+        }
+    }
+    result->time = table->time + time;
+    return result;
+}
+
+int phylib_frames(phylib_table *table, double rate, int nframes, double *frames)
+{
+    double *row = frames;
+
+    for (int frame = 0; frame < nframes; frame++)
+    {
+        for (int i = 0; i < table->count; i++)
+        {
+            phylib_object *object = table->object[i];
+            if (phylib_ball_number(object) < 0)
+            {
+                continue;
+            }
+
+            row[0] = frame;
+            if (object->type == PHYLIB_ROLLING_BALL)
+            {
+                phylib_object rolled = *object;
+                phylib_roll(&rolled, object, frame * rate);
+                row[1] = rolled.obj.rolling_ball.number;
+                row[2] = rolled.obj.rolling_ball.pos.x;
+                row[3] = rolled.obj.rolling_ball.pos.y;
+                row[4] = rolled.obj.rolling_ball.vel.x;
+                row[5] = rolled.obj.rolling_ball.vel.y;
+            }
+            else
+            {
+                row[1] = object->obj.still_ball.number;
+                row[2] = object->obj.still_ball.pos.x;
+                row[3] = object->obj.still_ball.pos.y;
+                row[4] = row[5] = NAN;
+            }
+            row += PHYLIB_FRAME_FIELDS;
+        }
+    }
+    return (int)((row - frames) / PHYLIB_FRAME_FIELDS);
+}
+
+// Formats object into string, which holds size bytes, and returns string.
+char *phylib_object_string_r(phylib_object *object, char *string, size_t size)
+{
+    if (object == NULL)
+    {
+        snprintf(string, size, "NULL;");
+        return string;
+    }
+    switch (object->type)
+    {
+    case PHYLIB_STILL_BALL:
+        snprintf(string, size,
+                 "STILL_BALL (%d,%6.1lf,%6.1lf)",
+                 object->obj.still_ball.number,
+                 object->obj.still_ball.pos.x,
+                 object->obj.still_ball.pos.y);
+        break;
+    case PHYLIB_ROLLING_BALL:
+        snprintf(string, size,
+                 "ROLLING_BALL (%d,%6.1lf,%6.1lf,%6.1lf,%6.1lf,%6.1lf,%6.1lf)",
+                 object->obj.rolling_ball.number,
+                 object->obj.rolling_ball.pos.x,
+                 object->obj.rolling_ball.pos.y,
+                 object->obj.rolling_ball.vel.x,
+                 object->obj.rolling_ball.vel.y,
+                 object->obj.rolling_ball.acc.x,
+                 object->obj.rolling_ball.acc.y);
+        break;
+
+    case PHYLIB_HOLE:
+        snprintf(string, size,
+                 "HOLE (%6.1lf,%6.1lf)",
+                 object->obj.hole.pos.x,
+                 object->obj.hole.pos.y);
+        break;
+    case PHYLIB_HCUSHION:
+        snprintf(string, size,
+                 "HCUSHION (%6.1lf)",
+                 object->obj.hcushion.y);
+        break;
+    case PHYLIB_VCUSHION:
+        snprintf(string, size,
+                 "VCUSHION (%6.1lf)",
+                 object->obj.vcushion.x);
+        break;
+    }
+    return string;
+}
+
+// Not reentrant: the result lives in a static buffer shared by all callers.
+// Threaded code should use phylib_object_string_r.
+char *phylib_object_string(phylib_object *object)
+{
+    static char string[80];
+    return phylib_object_string_r(object, string, sizeof(string));
 }
 
@@ -19,8 +19,10 @@ EMAIL; shreehar@uoguelph.ca
 #define PHYLIB_VEL_EPSILON (0.01) // mm/s
 #define PHYLIB_DRAG (150.0) // mm/s^2
 #define PHYLIB_MAX_TIME (600) // s
-#define PHYLIB_MAX_OBJECTS (26)
+#define PHYLIB_MAX_OBJECTS (26) // default table capacity
+#define PHYLIB_INDEXED_BALLS (256) // ball numbers a table keeps the slot of: all of them
 #define FRAME_RATE (0.01)
+#define PHYLIB_FRAME_FIELDS (6) // frame, number, x, y, vx, vy
 
 
 //All required Structs
@@ -33,6 +35,11 @@ PHYLIB_HCUSHION = 3,
 PHYLIB_VCUSHION = 4,
 } phylib_obj;
 
+typedef enum {
+PHYLIB_SOLVER_STEP = 0,
+PHYLIB_SOLVER_EVENT = 1,
+} phylib_solver;
+
 typedef struct {
 double x;
 double y;
@@ -75,11 +82,75 @@ phylib_obj type;
 phylib_untyped obj;
 } phylib_object;
 
+// Profile counters, kept only when phylib is built with -DPHYLIB_PROFILE
+// (make PROFILE=1).  A table starts at zero and every table made from it
+// (a segment, a copy, a rolled frame) carries its totals on, so the table
+// a shot ends in holds the counts for the whole shot.
+typedef struct {
+long segments; // segments simulated
+long steps; // PHYLIB_SIM_RATE steps, or event searches for PHYLIB_SOLVER_EVENT
+long narrow; // narrow-phase tests of a ball against another object
+long stops; // balls that came to rest
+long still_bounces; // phylib_bounce calls by the type of the object hit
+long rolling_bounces;
+long hole_bounces;
+long hcushion_bounces;
+long vcushion_bounces;
+long allocations; // malloc calls for tables and solver state
+double seconds; // wall time spent in the solvers
+} phylib_stats;
+
+// object has room for capacity slots and grows when it fills up; only the
+// first count slots (one past the highest slot ever used) can be non-NULL.
+// The objects themselves are stored by value, owned by the table: the
+// slots the table was made with in slots, and those added as it grew in
+// chunks.  Slots never move, so an object keeps its address for as long
+// as the table lives.
+// ball_slot[n] is the slot ball n was added to, or -1 if it never was, for
+// n below PHYLIB_INDEXED_BALLS; a pocket empties the slot but leaves it
+// here, which is how phylib_pocketed tells sunk balls from missing ones.
+struct phylib_chunk;
+
 typedef struct {
 double time;
-phylib_object *object[PHYLIB_MAX_OBJECTS];
+phylib_object **object;
+int capacity;
+int count;
+phylib_object *slots;
+struct phylib_chunk *chunks; // newest first
+int ball_slot[PHYLIB_INDEXED_BALLS];
+#ifdef PHYLIB_PROFILE
+phylib_stats stats;
+#endif
 } phylib_table;
 
+// Ball state as parallel arrays; ball k came from table slot slot[k] and
+// type[k] is PHYLIB_STILL_BALL or PHYLIB_ROLLING_BALL.
+typedef struct {
+int n;
+int *slot;
+unsigned char *type;
+double *px;
+double *py;
+double *vx;
+double *vy;
+double *ax;
+double *ay;
+} phylib_soa;
+
+// Sweep-and-prune state for the stepper: balls sorted on x, kept from one
+// step to the next so the re-sort is nearly free.
+typedef struct {
+int nballs;
+int nfixed;
+int *ball;
+int *fixed;
+int *rank;
+#ifdef PHYLIB_PROFILE
+long narrow; // narrow-phase tests so far
+#endif
+} phylib_broadphase;
+
 //Function Prototypes...
 
 //Part 1.....
@@ -89,12 +160,14 @@ phylib_object *phylib_new_hole( phylib_coord *pos );
 phylib_object *phylib_new_hcushion( double y );
 phylib_object *phylib_new_vcushion( double x );
 phylib_table *phylib_new_table( void );
+phylib_table *phylib_new_table_capacity( int capacity );
 
 
 //Part 2.....
 void phylib_copy_object( phylib_object **dest, phylib_object **src );
 phylib_table *phylib_copy_table( phylib_table *table );
 void phylib_add_object( phylib_table *table, phylib_object *object );
+phylib_object *phylib_add_object_copy( phylib_table *table, const phylib_object *object );
 void phylib_free_table( phylib_table *table );
 phylib_coord phylib_sub( phylib_coord c1, phylib_coord c2 );
 double phylib_length( phylib_coord c );
@@ -113,5 +186,43 @@ void update_rolling_balls(phylib_table* resultTable, const phylib_table* table,
 int check_stopped_condition(const phylib_table* resultTable);
 int check_collision_condition(const phylib_table* resultTable);
 
+//Structure of arrays
+int phylib_soa_init( phylib_soa *soa, const phylib_table *table );
+void phylib_soa_store( const phylib_soa *soa, phylib_table *table );
+void phylib_soa_roll( phylib_soa *soa, const phylib_soa *start, double time );
+int phylib_soa_stopped( const phylib_soa *soa );
+void phylib_soa_free( phylib_soa *soa );
+
+//Broad phase
+int phylib_broadphase_init( phylib_broadphase *bp, const phylib_table *table, const phylib_soa *soa );
+void phylib_broadphase_free( phylib_broadphase *bp );
+int phylib_broadphase_collision( phylib_broadphase *bp, const phylib_table *table, const phylib_soa *soa, int *a, int *b );
+
+//Event driven solver
+phylib_table *phylib_segment_event( phylib_table *table );
+phylib_table *phylib_segment_solver( phylib_table *table, phylib_solver solver );
+phylib_table *phylib_segment_contact( phylib_table *table, phylib_solver solver, int *a, int *b );
+
+//Profiling
+phylib_stats *phylib_profile( phylib_table *table );
+
+//Batched shots
+int phylib_simulate_batch( phylib_table *table, phylib_solver solver, int nshots, const double *velocity,
+                           int nnumbers, double *position, unsigned char *pocketed, int *first_contact, double *time );
+int phylib_simulate_batch_parallel( phylib_table *table, phylib_solver solver, int nshots, const double *velocity,
+                                    int nnumbers, double *position, unsigned char *pocketed, int *first_contact,
+                                    double *time, int workers );
+int phylib_workers( void );
+
+//Ball index
+phylib_object *phylib_find_ball( phylib_table *table, int number );
+int phylib_pocketed( phylib_table *table, int *numbers );
+
+//Frames
+int phylib_ball_count( phylib_table *table );
+phylib_table *phylib_roll_table( phylib_table *table, double time );
+int phylib_frames( phylib_table *table, double rate, int nframes, double *frames );
+
 //Expansion
 char *phylib_object_string(phylib_object *object);
+char *phylib_object_string_r(phylib_object *object, char *string, size_t size);
@@ -7,13 +7,30 @@
 /******************************************************************************/
 
 /* based on phylib.c and phylib.h */
-%module phylib
+%module(threads="1") phylib
 %{
   #include "phylib.h"
 %}
 
+/* only the long running calls drop the GIL; phylib.c keeps no shared
+   mutable state apart from the static buffer of phylib_object_string, which
+   is left holding the GIL */
+%nothread;
+%thread phylib_roll;
+%thread phylib_segment;
+%thread phylib_segment_event;
+%thread phylib_segment_solver;
+%thread phylib_table::segment;
+
 /******************************************************************************/
 
+/* the table manages its own slot array */
+%immutable object;
+%immutable capacity;
+%immutable count;
+%immutable slots;
+%immutable chunks;
+
 %include "phylib.h"
 
 /******************************************************************************/
@@ -90,7 +107,8 @@
   /* __str__ method */
   PyObject* __str__()
   {
-    char *str = phylib_object_string( $self );
+    char str[80];
+    phylib_object_string_r( $self, str, sizeof( str ) );
     return PyString_FromString( str );
   }
 
@@ -110,9 +128,9 @@
   /****************************************************************************/
 
   /* constructor methods that calls new array */
-  phylib_table()
+  phylib_table( int capacity=PHYLIB_MAX_OBJECTS )
   {
-    return phylib_new_table();
+    return phylib_new_table_capacity( capacity );
   }
 
   /****************************************************************************/
@@ -130,18 +148,207 @@
 
   /****************************************************************************/
 
-  phylib_table *segment()
+  phylib_table *segment( phylib_solver solver=PHYLIB_SOLVER_STEP )
   {
-    return phylib_segment( $self );
+    return phylib_segment_solver( $self, solver );
   }
 
   /****************************************************************************/
 
-  phylib_object *get_object( unsigned char i )
+  /* plays one cue strike per (xvel, yvel) pair in velocity and fills the
+     output buffers in place, spread over workers threads (0 for one per
+     core); see Table.simulate_batch in Physics.py */
+  PyObject *simulate_batch( PyObject *velocity, int nnumbers,
+                            PyObject *position, PyObject *pocketed,
+                            PyObject *first_contact, PyObject *time,
+                            phylib_solver solver=PHYLIB_SOLVER_STEP,
+                            int workers=1 )
+  {
+    PyObject *args[5] = { velocity, position, pocketed, first_contact, time };
+    Py_buffer view[5];
+    int got = 0;
+    int ok = 0;
+
+    for (got = 0; got < 5; got++)
+    {
+      int flags = got ? PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE : PyBUF_C_CONTIGUOUS;
+      if (PyObject_GetBuffer( args[got], &view[got], flags ) < 0)
+      {
+        break;
+      }
+    }
+
+    if (got == 5)
+    {
+      Py_ssize_t nshots = view[0].len / (2 * sizeof( double ));
+      if (nnumbers < 0 ||
+          view[1].len < nshots * nnumbers * 2 * (Py_ssize_t)sizeof( double ) ||
+          view[2].len < nshots * nnumbers ||
+          view[3].len < nshots * (Py_ssize_t)sizeof( int ) ||
+          view[4].len < nshots * (Py_ssize_t)sizeof( double ))
+      {
+        PyErr_SetString( PyExc_ValueError, "output buffers too small" );
+      }
+      else
+      {
+        /* the buffers stay exported, so they cannot move while unlocked */
+        Py_BEGIN_ALLOW_THREADS
+        ok = phylib_simulate_batch_parallel( $self, solver, (int)nshots,
+                                             view[0].buf, nnumbers,
+                                             view[1].buf, view[2].buf,
+                                             view[3].buf, view[4].buf,
+                                             workers );
+        Py_END_ALLOW_THREADS
+        if (!ok)
+        {
+          PyErr_SetString( PyExc_ValueError, "no cue ball or malloc error" );
+        }
+      }
+    }
+
+    while (got > 0)
+    {
+      PyBuffer_Release( &view[--got] );
+    }
+
+    if (!ok)
+    {
+      return NULL;
+    }
+    Py_RETURN_NONE;
+  }
+
+  /****************************************************************************/
+
+  /* this table rolled forward by time; see phylib_roll_table */
+  phylib_table *roll_table( double time )
+  {
+    phylib_table *ptr = phylib_roll_table( $self, time );
+    if (!ptr)
+    {
+      PyErr_SetString( PyExc_ValueError, "malloc error" );
+      return NULL;
+    }
+    return ptr;
+  }
+
+  /****************************************************************************/
+
+  /* nframes frames rate apart as packed doubles, PHYLIB_FRAME_FIELDS per
+     ball per frame; see phylib_frames */
+  PyObject *frames( double rate, int nframes )
+  {
+    Py_ssize_t rows;
+    PyObject *result;
+
+    if (nframes < 0)
+    {
+      nframes = 0;
+    }
+    rows = (Py_ssize_t)nframes * phylib_ball_count( $self );
+    result = PyBytes_FromStringAndSize( NULL, rows * PHYLIB_FRAME_FIELDS * sizeof( double ) );
+    if (result)
+    {
+      double *frames = (double *)PyBytes_AS_STRING( result );
+      Py_BEGIN_ALLOW_THREADS
+      phylib_frames( $self, rate, nframes, frames );
+      Py_END_ALLOW_THREADS
+    }
+    return result;
+  }
+
+  /****************************************************************************/
+
+  /* the objects that are not balls: the ten cushions and holes every table
+     starts with, unless more were added; see Table.svg in Physics.py */
+  int fixture_count()
+  {
+    int count = 0;
+    for (int i = 0; i < $self->count; i++)
+    {
+      phylib_object *object = $self->object[i];
+      count += object != NULL &&
+               object->type != PHYLIB_STILL_BALL &&
+               object->type != PHYLIB_ROLLING_BALL;
+    }
+    return count;
+  }
+
+  /****************************************************************************/
+
+  /* every ball on the table, still or rolling, in slot order, as a list of
+     phylib_objects that point into the table like get_object's; the empty
+     slots and the cushions and holes are skipped; see Table.balls */
+  PyObject *balls()
+  {
+    PyObject *result = PyList_New( 0 );
+
+    for (int i = 0; result && i < $self->count; i++)
+    {
+      phylib_object *object = $self->object[i];
+      if (object != NULL &&
+          (object->type == PHYLIB_STILL_BALL || object->type == PHYLIB_ROLLING_BALL))
+      {
+        PyObject *ball = SWIG_NewPointerObj( SWIG_as_voidptr( object ), SWIGTYPE_p_phylib_object, 0 );
+        if (!ball || PyList_Append( result, ball ) < 0)
+        {
+          Py_XDECREF( ball );
+          Py_CLEAR( result );
+          break;
+        }
+        Py_DECREF( ball );
+      }
+    }
+    return result;
+  }
+
+  /****************************************************************************/
+
+  /* ball number on the table, found through the table's ball index, or
+     NULL; see phylib_find_ball and Table.ball */
+  phylib_object *ball( int number )
+  {
+    return phylib_find_ball( $self, number );
+  }
+
+  /****************************************************************************/
+
+  /* the numbers of the balls that have been sunk; see phylib_pocketed */
+  PyObject *pocketed()
+  {
+    int numbers[PHYLIB_INDEXED_BALLS];
+    int count = phylib_pocketed( $self, numbers );
+    PyObject *result = PyList_New( count );
+
+    for (int i = 0; result && i < count; i++)
+    {
+      PyObject *number = PyLong_FromLong( numbers[i] );
+      if (!number)
+      {
+        Py_CLEAR( result );
+        break;
+      }
+      PyList_SET_ITEM( result, i, number );
+    }
+    return result;
+  }
+
+  /****************************************************************************/
+
+  /* the profile counters of this table, which point into it, or NULL if
+     phylib was built without PHYLIB_PROFILE; see phylib_profile */
+  phylib_stats *stats()
+  {
+    return phylib_profile( $self );
+  }
+
+  /****************************************************************************/
+
+  phylib_object *get_object( int i )
   {
     // added if statement to make this not generate segmentation fault when
     // invalid indices are provided
-    if ( (i>=0) && (i<PHYLIB_MAX_OBJECTS))
+    if ( (i>=0) && (i<$self->count))
     {
       return $self->object[i];
     }
@@ -152,10 +359,7 @@
 
   void add_object( phylib_object *object1 )
   {
-    phylib_object *ptr;
-
-    phylib_copy_object( &ptr, &object1 );
-    phylib_add_object( self, ptr );
+    phylib_add_object_copy( $self, object1 );
   }
 
   /****************************************************************************/
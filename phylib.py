@@ -68,12 +68,16 @@ PHYLIB_VEL_EPSILON = _phylib.PHYLIB_VEL_EPSILON
 PHYLIB_DRAG = _phylib.PHYLIB_DRAG
 PHYLIB_MAX_TIME = _phylib.PHYLIB_MAX_TIME
 PHYLIB_MAX_OBJECTS = _phylib.PHYLIB_MAX_OBJECTS
+PHYLIB_INDEXED_BALLS = _phylib.PHYLIB_INDEXED_BALLS
 FRAME_RATE = _phylib.FRAME_RATE
+PHYLIB_FRAME_FIELDS = _phylib.PHYLIB_FRAME_FIELDS
 PHYLIB_STILL_BALL = _phylib.PHYLIB_STILL_BALL
 PHYLIB_ROLLING_BALL = _phylib.PHYLIB_ROLLING_BALL
 PHYLIB_HOLE = _phylib.PHYLIB_HOLE
 PHYLIB_HCUSHION = _phylib.PHYLIB_HCUSHION
 PHYLIB_VCUSHION = _phylib.PHYLIB_VCUSHION
+PHYLIB_SOLVER_STEP = _phylib.PHYLIB_SOLVER_STEP
+PHYLIB_SOLVER_EVENT = _phylib.PHYLIB_SOLVER_EVENT
 class phylib_coord(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
@@ -175,20 +179,70 @@ class phylib_object(object):
 
 # Register phylib_object in _phylib:
 _phylib.phylib_object_swigregister(phylib_object)
+class phylib_stats(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    segments = property(_phylib.phylib_stats_segments_get, _phylib.phylib_stats_segments_set)
+    steps = property(_phylib.phylib_stats_steps_get, _phylib.phylib_stats_steps_set)
+    narrow = property(_phylib.phylib_stats_narrow_get, _phylib.phylib_stats_narrow_set)
+    stops = property(_phylib.phylib_stats_stops_get, _phylib.phylib_stats_stops_set)
+    still_bounces = property(_phylib.phylib_stats_still_bounces_get, _phylib.phylib_stats_still_bounces_set)
+    rolling_bounces = property(_phylib.phylib_stats_rolling_bounces_get, _phylib.phylib_stats_rolling_bounces_set)
+    hole_bounces = property(_phylib.phylib_stats_hole_bounces_get, _phylib.phylib_stats_hole_bounces_set)
+    hcushion_bounces = property(_phylib.phylib_stats_hcushion_bounces_get, _phylib.phylib_stats_hcushion_bounces_set)
+    vcushion_bounces = property(_phylib.phylib_stats_vcushion_bounces_get, _phylib.phylib_stats_vcushion_bounces_set)
+    allocations = property(_phylib.phylib_stats_allocations_get, _phylib.phylib_stats_allocations_set)
+    seconds = property(_phylib.phylib_stats_seconds_get, _phylib.phylib_stats_seconds_set)
+
+    def __init__(self):
+        _phylib.phylib_stats_swiginit(self, _phylib.new_phylib_stats())
+    __swig_destroy__ = _phylib.delete_phylib_stats
+
+# Register phylib_stats in _phylib:
+_phylib.phylib_stats_swigregister(phylib_stats)
 class phylib_table(object):
     thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
     __repr__ = _swig_repr
     time = property(_phylib.phylib_table_time_get, _phylib.phylib_table_time_set)
-    object = property(_phylib.phylib_table_object_get, _phylib.phylib_table_object_set)
+    object = property(_phylib.phylib_table_object_get)
+    capacity = property(_phylib.phylib_table_capacity_get)
+    count = property(_phylib.phylib_table_count_get)
+    slots = property(_phylib.phylib_table_slots_get)
+    chunks = property(_phylib.phylib_table_chunks_get)
+    ball_slot = property(_phylib.phylib_table_ball_slot_get, _phylib.phylib_table_ball_slot_set)
 
-    def __init__(self):
-        _phylib.phylib_table_swiginit(self, _phylib.new_phylib_table())
+    def __init__(self, *args):
+        _phylib.phylib_table_swiginit(self, _phylib.new_phylib_table(*args))
 
     def copy(self):
         return _phylib.phylib_table_copy(self)
 
-    def segment(self):
-        return _phylib.phylib_table_segment(self)
+    def segment(self, solver=PHYLIB_SOLVER_STEP):
+        return _phylib.phylib_table_segment(self, solver)
+
+    def simulate_batch(self, velocity, nnumbers, position, pocketed, first_contact, time, solver=PHYLIB_SOLVER_STEP, workers=1):
+        return _phylib.phylib_table_simulate_batch(self, velocity, nnumbers, position, pocketed, first_contact, time, solver, workers)
+
+    def roll_table(self, time):
+        return _phylib.phylib_table_roll_table(self, time)
+
+    def frames(self, rate, nframes):
+        return _phylib.phylib_table_frames(self, rate, nframes)
+
+    def fixture_count(self):
+        return _phylib.phylib_table_fixture_count(self)
+
+    def balls(self):
+        return _phylib.phylib_table_balls(self)
+
+    def ball(self, number):
+        return _phylib.phylib_table_ball(self, number)
+
+    def pocketed(self):
+        return _phylib.phylib_table_pocketed(self)
+
+    def stats(self):
+        return _phylib.phylib_table_stats(self)
 
     def get_object(self, i):
         return _phylib.phylib_table_get_object(self, i)
@@ -199,6 +253,40 @@ class phylib_table(object):
 
 # Register phylib_table in _phylib:
 _phylib.phylib_table_swigregister(phylib_table)
+class phylib_soa(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    n = property(_phylib.phylib_soa_n_get, _phylib.phylib_soa_n_set)
+    slot = property(_phylib.phylib_soa_slot_get, _phylib.phylib_soa_slot_set)
+    type = property(_phylib.phylib_soa_type_get, _phylib.phylib_soa_type_set)
+    px = property(_phylib.phylib_soa_px_get, _phylib.phylib_soa_px_set)
+    py = property(_phylib.phylib_soa_py_get, _phylib.phylib_soa_py_set)
+    vx = property(_phylib.phylib_soa_vx_get, _phylib.phylib_soa_vx_set)
+    vy = property(_phylib.phylib_soa_vy_get, _phylib.phylib_soa_vy_set)
+    ax = property(_phylib.phylib_soa_ax_get, _phylib.phylib_soa_ax_set)
+    ay = property(_phylib.phylib_soa_ay_get, _phylib.phylib_soa_ay_set)
+
+    def __init__(self):
+        _phylib.phylib_soa_swiginit(self, _phylib.new_phylib_soa())
+    __swig_destroy__ = _phylib.delete_phylib_soa
+
+# Register phylib_soa in _phylib:
+_phylib.phylib_soa_swigregister(phylib_soa)
+class phylib_broadphase(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    nballs = property(_phylib.phylib_broadphase_nballs_get, _phylib.phylib_broadphase_nballs_set)
+    nfixed = property(_phylib.phylib_broadphase_nfixed_get, _phylib.phylib_broadphase_nfixed_set)
+    ball = property(_phylib.phylib_broadphase_ball_get, _phylib.phylib_broadphase_ball_set)
+    fixed = property(_phylib.phylib_broadphase_fixed_get, _phylib.phylib_broadphase_fixed_set)
+    rank = property(_phylib.phylib_broadphase_rank_get, _phylib.phylib_broadphase_rank_set)
+
+    def __init__(self):
+        _phylib.phylib_broadphase_swiginit(self, _phylib.new_phylib_broadphase())
+    __swig_destroy__ = _phylib.delete_phylib_broadphase
+
+# Register phylib_broadphase in _phylib:
+_phylib.phylib_broadphase_swigregister(phylib_broadphase)
 
 def phylib_new_still_ball(number, pos):
     return _phylib.phylib_new_still_ball(number, pos)
@@ -218,6 +306,9 @@ def phylib_new_vcushion(x):
 def phylib_new_table():
     return _phylib.phylib_new_table()
 
+def phylib_new_table_capacity(capacity):
+    return _phylib.phylib_new_table_capacity(capacity)
+
 def phylib_copy_object(dest, src):
     return _phylib.phylib_copy_object(dest, src)
 
@@ -227,6 +318,9 @@ def phylib_copy_table(table):
 def phylib_add_object(table, object):
     return _phylib.phylib_add_object(table, object)
 
+def phylib_add_object_copy(table, object):
+    return _phylib.phylib_add_object_copy(table, object)
+
 def phylib_free_table(table):
     return _phylib.phylib_free_table(table)
 
@@ -266,6 +360,69 @@ def check_stopped_condition(resultTable):
 def check_collision_condition(resultTable):
     return _phylib.check_collision_condition(resultTable)
 
+def phylib_soa_init(soa, table):
+    return _phylib.phylib_soa_init(soa, table)
+
+def phylib_soa_store(soa, table):
+    return _phylib.phylib_soa_store(soa, table)
+
+def phylib_soa_roll(soa, start, time):
+    return _phylib.phylib_soa_roll(soa, start, time)
+
+def phylib_soa_stopped(soa):
+    return _phylib.phylib_soa_stopped(soa)
+
+def phylib_soa_free(soa):
+    return _phylib.phylib_soa_free(soa)
+
+def phylib_broadphase_init(bp, table, soa):
+    return _phylib.phylib_broadphase_init(bp, table, soa)
+
+def phylib_broadphase_free(bp):
+    return _phylib.phylib_broadphase_free(bp)
+
+def phylib_broadphase_collision(bp, table, soa, a, b):
+    return _phylib.phylib_broadphase_collision(bp, table, soa, a, b)
+
+def phylib_segment_event(table):
+    return _phylib.phylib_segment_event(table)
+
+def phylib_segment_solver(table, solver):
+    return _phylib.phylib_segment_solver(table, solver)
+
+def phylib_segment_contact(table, solver, a, b):
+    return _phylib.phylib_segment_contact(table, solver, a, b)
+
+def phylib_profile(table):
+    return _phylib.phylib_profile(table)
+
+def phylib_simulate_batch(table, solver, nshots, velocity, nnumbers, position, pocketed, first_contact, time):
+    return _phylib.phylib_simulate_batch(table, solver, nshots, velocity, nnumbers, position, pocketed, first_contact, time)
+
+def phylib_simulate_batch_parallel(table, solver, nshots, velocity, nnumbers, position, pocketed, first_contact, time, workers):
+    return _phylib.phylib_simulate_batch_parallel(table, solver, nshots, velocity, nnumbers, position, pocketed, first_contact, time, workers)
+
+def phylib_workers():
+    return _phylib.phylib_workers()
+
+def phylib_find_ball(table, number):
+    return _phylib.phylib_find_ball(table, number)
+
+def phylib_pocketed(table, numbers):
+    return _phylib.phylib_pocketed(table, numbers)
+
+def phylib_ball_count(table):
+    return _phylib.phylib_ball_count(table)
+
+def phylib_roll_table(table, time):
+    return _phylib.phylib_roll_table(table, time)
+
+def phylib_frames(table, rate, nframes, frames):
+    return _phylib.phylib_frames(table, rate, nframes, frames)
+
 def phylib_object_string(object):
     return _phylib.phylib_object_string(object)
 
+def phylib_object_string_r(object, string, size):
+    return _phylib.phylib_object_string_r(object, string, size)
+
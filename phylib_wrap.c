@@ -9,6 +9,7 @@
 
 #define SWIG_VERSION 0x040100
 #define SWIGPYTHON
+#define SWIG_PYTHON_THREADS
 #define SWIG_PYTHON_DIRECTOR_NO_VTABLE
 
 /* -----------------------------------------------------------------------------
@@ -2979,19 +2980,27 @@ SWIG_Python_NonDynamicSetAttr(PyObject *obj, PyObject *name, PyObject *value) {
 /* -------- TYPES TABLE (BEGIN) -------- */
 
 #define SWIGTYPE_p_char swig_types[0]
-#define SWIGTYPE_p_p_phylib_object swig_types[1]
-#define SWIGTYPE_p_phylib_coord swig_types[2]
-#define SWIGTYPE_p_phylib_hcushion swig_types[3]
-#define SWIGTYPE_p_phylib_hole swig_types[4]
-#define SWIGTYPE_p_phylib_obj swig_types[5]
-#define SWIGTYPE_p_phylib_object swig_types[6]
-#define SWIGTYPE_p_phylib_rolling_ball swig_types[7]
-#define SWIGTYPE_p_phylib_still_ball swig_types[8]
-#define SWIGTYPE_p_phylib_table swig_types[9]
-#define SWIGTYPE_p_phylib_untyped swig_types[10]
-#define SWIGTYPE_p_phylib_vcushion swig_types[11]
-static swig_type_info *swig_types[13];
-static swig_module_info swig_module = {swig_types, 12, 0, 0, 0, 0};
+#define SWIGTYPE_p_double swig_types[1]
+#define SWIGTYPE_p_int swig_types[2]
+#define SWIGTYPE_p_p_phylib_object swig_types[3]
+#define SWIGTYPE_p_phylib_broadphase swig_types[4]
+#define SWIGTYPE_p_phylib_chunk swig_types[5]
+#define SWIGTYPE_p_phylib_coord swig_types[6]
+#define SWIGTYPE_p_phylib_hcushion swig_types[7]
+#define SWIGTYPE_p_phylib_hole swig_types[8]
+#define SWIGTYPE_p_phylib_obj swig_types[9]
+#define SWIGTYPE_p_phylib_object swig_types[10]
+#define SWIGTYPE_p_phylib_rolling_ball swig_types[11]
+#define SWIGTYPE_p_phylib_soa swig_types[12]
+#define SWIGTYPE_p_phylib_solver swig_types[13]
+#define SWIGTYPE_p_phylib_stats swig_types[14]
+#define SWIGTYPE_p_phylib_still_ball swig_types[15]
+#define SWIGTYPE_p_phylib_table swig_types[16]
+#define SWIGTYPE_p_phylib_untyped swig_types[17]
+#define SWIGTYPE_p_phylib_vcushion swig_types[18]
+#define SWIGTYPE_p_unsigned_char swig_types[19]
+static swig_type_info *swig_types[21];
+static swig_module_info swig_module = {swig_types, 20, 0, 0, 0, 0};
 #define SWIG_TypeQuery(name) SWIG_TypeQueryModule(&swig_module, &swig_module, name)
 #define SWIG_MangledTypeQuery(name) SWIG_MangledTypeQueryModule(&swig_module, &swig_module, name)
 
@@ -3307,14 +3316,15 @@ SWIGINTERN phylib_object *new_phylib_object(phylib_obj type,unsigned char num,ph
 
   }
 SWIGINTERN PyObject *phylib_object___str__(phylib_object *self){
-    char *str = phylib_object_string( self );
+    char str[80];
+    phylib_object_string_r( self, str, sizeof( str ) );
     return PyString_FromString( str );
   }
 SWIGINTERN void delete_phylib_object(phylib_object *self){
     free( self );
   }
-SWIGINTERN phylib_table *new_phylib_table(void){
-    return phylib_new_table();
+SWIGINTERN phylib_table *new_phylib_table(int capacity){
+    return phylib_new_table_capacity( capacity );
   }
 SWIGINTERN phylib_table *phylib_table_copy(phylib_table *self){
     phylib_table *ptr = phylib_copy_table( self );
@@ -3325,23 +3335,157 @@ SWIGINTERN phylib_table *phylib_table_copy(phylib_table *self){
     }
     return ptr;
   }
-SWIGINTERN phylib_table *phylib_table_segment(phylib_table *self){
-    return phylib_segment( self );
+SWIGINTERN phylib_table *phylib_table_segment(phylib_table *self,phylib_solver solver){
+    return phylib_segment_solver( self, solver );
   }
-SWIGINTERN phylib_object *phylib_table_get_object(phylib_table *self,unsigned char i){
+SWIGINTERN PyObject *phylib_table_simulate_batch(phylib_table *self,PyObject *velocity,int nnumbers,PyObject *position,PyObject *pocketed,PyObject *first_contact,PyObject *time,phylib_solver solver,int workers){
+    PyObject *args[5] = { velocity, position, pocketed, first_contact, time };
+    Py_buffer view[5];
+    int got = 0;
+    int ok = 0;
+
+    for (got = 0; got < 5; got++)
+    {
+      int flags = got ? PyBUF_C_CONTIGUOUS | PyBUF_WRITABLE : PyBUF_C_CONTIGUOUS;
+      if (PyObject_GetBuffer( args[got], &view[got], flags ) < 0)
+      {
+        break;
+      }
+    }
+
+    if (got == 5)
+    {
+      Py_ssize_t nshots = view[0].len / (2 * sizeof( double ));
+      if (nnumbers < 0 ||
+          view[1].len < nshots * nnumbers * 2 * (Py_ssize_t)sizeof( double ) ||
+          view[2].len < nshots * nnumbers ||
+          view[3].len < nshots * (Py_ssize_t)sizeof( int ) ||
+          view[4].len < nshots * (Py_ssize_t)sizeof( double ))
+      {
+        PyErr_SetString( PyExc_ValueError, "output buffers too small" );
+      }
+      else
+      {
+        /* the buffers stay exported, so they cannot move while unlocked */
+        Py_BEGIN_ALLOW_THREADS
+        ok = phylib_simulate_batch_parallel( self, solver, (int)nshots,
+                                             view[0].buf, nnumbers,
+                                             view[1].buf, view[2].buf,
+                                             view[3].buf, view[4].buf,
+                                             workers );
+        Py_END_ALLOW_THREADS
+        if (!ok)
+        {
+          PyErr_SetString( PyExc_ValueError, "no cue ball or malloc error" );
+        }
+      }
+    }
+
+    while (got > 0)
+    {
+      PyBuffer_Release( &view[--got] );
+    }
+
+    if (!ok)
+    {
+      return NULL;
+    }
+    Py_RETURN_NONE;
+  }
+SWIGINTERN phylib_table *phylib_table_roll_table(phylib_table *self,double time){
+    phylib_table *ptr = phylib_roll_table( self, time );
+    if (!ptr)
+    {
+      PyErr_SetString( PyExc_ValueError, "malloc error" );
+      return NULL;
+    }
+    return ptr;
+  }
+SWIGINTERN PyObject *phylib_table_frames(phylib_table *self,double rate,int nframes){
+    Py_ssize_t rows;
+    PyObject *result;
+
+    if (nframes < 0)
+    {
+      nframes = 0;
+    }
+    rows = (Py_ssize_t)nframes * phylib_ball_count( self );
+    result = PyBytes_FromStringAndSize( NULL, rows * (6) * sizeof( double ) );
+    if (result)
+    {
+      double *frames = (double *)PyBytes_AS_STRING( result );
+      Py_BEGIN_ALLOW_THREADS
+      phylib_frames( self, rate, nframes, frames );
+      Py_END_ALLOW_THREADS
+    }
+    return result;
+  }
+SWIGINTERN int phylib_table_fixture_count(phylib_table *self){
+    int count = 0;
+    for (int i = 0; i < self->count; i++)
+    {
+      phylib_object *object = self->object[i];
+      count += object != NULL &&
+               object->type != PHYLIB_STILL_BALL &&
+               object->type != PHYLIB_ROLLING_BALL;
+    }
+    return count;
+  }
+SWIGINTERN PyObject *phylib_table_balls(phylib_table *self){
+    PyObject *result = PyList_New( 0 );
+
+    for (int i = 0; result && i < self->count; i++)
+    {
+      phylib_object *object = self->object[i];
+      if (object != NULL &&
+          (object->type == PHYLIB_STILL_BALL || object->type == PHYLIB_ROLLING_BALL))
+      {
+        PyObject *ball = SWIG_NewPointerObj( SWIG_as_voidptr( object ), SWIGTYPE_p_phylib_object, 0 );
+        if (!ball || PyList_Append( result, ball ) < 0)
+        {
+          Py_XDECREF( ball );
+          Py_CLEAR( result );
+          break;
+        }
+        Py_DECREF( ball );
+      }
+    }
+    return result;
+  }
+SWIGINTERN phylib_object *phylib_table_ball(phylib_table *self,int number){
+    return phylib_find_ball( self, number );
+  }
+SWIGINTERN PyObject *phylib_table_pocketed(phylib_table *self){
+    int numbers[(256)];
+    int count = phylib_pocketed( self, numbers );
+    PyObject *result = PyList_New( count );
+
+    for (int i = 0; result && i < count; i++)
+    {
+      PyObject *number = PyLong_FromLong( numbers[i] );
+      if (!number)
+      {
+        Py_CLEAR( result );
+        break;
+      }
+      PyList_SET_ITEM( result, i, number );
+    }
+    return result;
+  }
+SWIGINTERN phylib_stats *phylib_table_stats(phylib_table *self){
+    return phylib_profile( self );
+  }
+SWIGINTERN phylib_object *phylib_table_get_object(phylib_table *self,int i){
     // added if statement to make this not generate segmentation fault when
     // invalid indices are provided
-    if ( (i>=0) && (i<(26)))
+    if ( (i>=0) && (i<self->count))
     {
       return self->object[i];
     }
     return NULL;
   }
 SWIGINTERN void phylib_table_add_object(phylib_table *self,phylib_object *object1){
-    phylib_object *ptr;
-
-    phylib_copy_object( &ptr, &object1 );
-    phylib_add_object( self, ptr );
+    phylib_add_object_copy( self, object1 );
   }
 SWIGINTERN void delete_phylib_table(phylib_table *self){
     phylib_free_table( self );
@@ -3391,6 +3535,185 @@ SWIG_FromCharPtr(const char *cptr)
   return SWIG_FromCharPtrAndSize(cptr, (cptr ? strlen(cptr) : 0));
 }
 
+
+SWIGINTERN int
+SWIG_AsCharPtrAndSize(PyObject *obj, char** cptr, size_t* psize, int *alloc)
+{
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+  if (PyBytes_Check(obj))
+#else
+  if (PyUnicode_Check(obj))
+#endif
+#else  
+  if (PyString_Check(obj))
+#endif
+  {
+    char *cstr; Py_ssize_t len;
+    int ret = SWIG_OK;
+#if PY_VERSION_HEX>=0x03000000
+#if !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+    if (!alloc && cptr) {
+        /* We can't allow converting without allocation, since the internal
+           representation of string in Python 3 is UCS-2/UCS-4 but we require
+           a UTF-8 representation.
+           TODO(bhy) More detailed explanation */
+        return SWIG_RuntimeError;
+    }
+    obj = PyUnicode_AsUTF8String(obj);
+    if (!obj)
+      return SWIG_TypeError;
+    if (alloc)
+      *alloc = SWIG_NEWOBJ;
+#endif
+    if (PyBytes_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
+#else
+    if (PyString_AsStringAndSize(obj, &cstr, &len) == -1)
+      return SWIG_TypeError;
+#endif
+    if (cptr) {
+      if (alloc) {
+	if (*alloc == SWIG_NEWOBJ) {
+	  *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+	  *alloc = SWIG_NEWOBJ;
+	} else {
+	  *cptr = cstr;
+	  *alloc = SWIG_OLDOBJ;
+	}
+      } else {
+#if PY_VERSION_HEX>=0x03000000
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+	*cptr = PyBytes_AsString(obj);
+#else
+	assert(0); /* Should never reach here with Unicode strings in Python 3 */
+#endif
+#else
+	*cptr = SWIG_Python_str_AsChar(obj);
+        if (!*cptr)
+          ret = SWIG_TypeError;
+#endif
+      }
+    }
+    if (psize) *psize = len + 1;
+#if PY_VERSION_HEX>=0x03000000 && !defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+    Py_XDECREF(obj);
+#endif
+    return ret;
+  } else {
+#if defined(SWIG_PYTHON_2_UNICODE)
+#if defined(SWIG_PYTHON_STRICT_BYTE_CHAR)
+#error "Cannot use both SWIG_PYTHON_2_UNICODE and SWIG_PYTHON_STRICT_BYTE_CHAR at once"
+#endif
+#if PY_VERSION_HEX<0x03000000
+    if (PyUnicode_Check(obj)) {
+      char *cstr; Py_ssize_t len;
+      if (!alloc && cptr) {
+        return SWIG_RuntimeError;
+      }
+      obj = PyUnicode_AsUTF8String(obj);
+      if (!obj)
+        return SWIG_TypeError;
+      if (PyString_AsStringAndSize(obj, &cstr, &len) != -1) {
+        if (cptr) {
+          if (alloc) *alloc = SWIG_NEWOBJ;
+          *cptr = (char *)memcpy(malloc((len + 1)*sizeof(char)), cstr, sizeof(char)*(len + 1));
+        }
+        if (psize) *psize = len + 1;
+
+        Py_XDECREF(obj);
+        return SWIG_OK;
+      } else {
+        Py_XDECREF(obj);
+      }
+    }
+#endif
+#endif
+
+    swig_type_info* pchar_descriptor = SWIG_pchar_descriptor();
+    if (pchar_descriptor) {
+      void* vptr = 0;
+      if (SWIG_ConvertPtr(obj, &vptr, pchar_descriptor, 0) == SWIG_OK) {
+	if (cptr) *cptr = (char *) vptr;
+	if (psize) *psize = vptr ? (strlen((char *)vptr) + 1) : 0;
+	if (alloc) *alloc = SWIG_OLDOBJ;
+	return SWIG_OK;
+      }
+    }
+  }
+  return SWIG_TypeError;
+}
+
+
+
+
+
+#if defined(LLONG_MAX) && !defined(SWIG_LONG_LONG_AVAILABLE)
+#  define SWIG_LONG_LONG_AVAILABLE
+#endif
+
+
+#ifdef SWIG_LONG_LONG_AVAILABLE
+SWIGINTERN int
+SWIG_AsVal_unsigned_SS_long_SS_long (PyObject *obj, unsigned long long *val)
+{
+  int res = SWIG_TypeError;
+  if (PyLong_Check(obj)) {
+    unsigned long long v = PyLong_AsUnsignedLongLong(obj);
+    if (!PyErr_Occurred()) {
+      if (val) *val = v;
+      return SWIG_OK;
+    } else {
+      PyErr_Clear();
+      res = SWIG_OverflowError;
+    }
+  } else {
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj,&v);
+    if (SWIG_IsOK(res)) {
+      if (val) *val = v;
+      return res;
+    }
+  }
+#ifdef SWIG_PYTHON_CAST_MODE
+  {
+    const double mant_max = 1LL << DBL_MANT_DIG;
+    double d;
+    res = SWIG_AsVal_double (obj,&d);
+    if (SWIG_IsOK(res) && !SWIG_CanCastAsInteger(&d, 0, mant_max))
+      return SWIG_OverflowError;
+    if (SWIG_IsOK(res) && SWIG_CanCastAsInteger(&d, 0, mant_max)) {
+      if (val) *val = (unsigned long long)(d);
+      return SWIG_AddCast(res);
+    }
+    res = SWIG_TypeError;
+  }
+#endif
+  return res;
+}
+#endif
+
+
+SWIGINTERNINLINE int
+SWIG_AsVal_size_t (PyObject * obj, size_t *val)
+{
+  int res = SWIG_TypeError;
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  if (sizeof(size_t) <= sizeof(unsigned long)) {
+#endif
+    unsigned long v;
+    res = SWIG_AsVal_unsigned_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+#ifdef SWIG_LONG_LONG_AVAILABLE
+  } else if (sizeof(size_t) <= sizeof(unsigned long long)) {
+    unsigned long long v;
+    res = SWIG_AsVal_unsigned_SS_long_SS_long (obj, val ? &v : 0);
+    if (SWIG_IsOK(res) && val) *val = (size_t)(v);
+  }
+#endif
+  return res;
+}
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -4795,28 +5118,28 @@ SWIGINTERN PyObject *phylib_object_swiginit(PyObject *SWIGUNUSEDPARM(self), PyOb
   return SWIG_Python_InitShadowInstance(args);
 }
 
-SWIGINTERN PyObject *_wrap_phylib_table_time_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_segments_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
-  double arg2 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  double val2 ;
+  long val2 ;
   int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_table_time_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_segments_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_time_set" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_segments_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
   if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_time_set" "', argument " "2"" of type '" "double""'");
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_segments_set" "', argument " "2"" of type '" "long""'");
   } 
-  arg2 = (double)(val2);
-  if (arg1) (arg1)->time = arg2;
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->segments = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4824,58 +5147,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_time_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_segments_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  double result;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_time_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_segments_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  result = (double) ((arg1)->time);
-  resultobj = SWIG_From_double((double)(result));
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->segments);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_object_set(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_steps_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
-  phylib_object **arg2 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_table_object_set", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_steps_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_object_set" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_steps_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_table_object_set" "', argument " "2"" of type '" "phylib_object *[(26)]""'"); 
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_steps_set" "', argument " "2"" of type '" "long""'");
   } 
-  arg2 = (phylib_object **)(argp2);
-  {
-    if (arg2) {
-      size_t ii = 0;
-      for (; ii < (size_t)(26); ++ii) *(phylib_object * *)&arg1->object[ii] = *((phylib_object * *)arg2 + ii);
-    } else {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""object""' of type '""phylib_object *[(26)]""'");
-    }
-  }
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->steps = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -4883,140 +5199,155 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_object_get(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_steps_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  phylib_object **result = 0 ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_object_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_steps_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  result = (phylib_object **)(phylib_object **) ((arg1)->object);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->steps);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_new_phylib_table(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_narrow_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *result = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "new_phylib_table", 0, 0, 0)) SWIG_fail;
-  result = (phylib_table *)new_phylib_table();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, SWIG_POINTER_NEW |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_narrow_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_narrow_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
+  }
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_narrow_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->narrow = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_copy(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_narrow_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  phylib_table *result = 0 ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_copy" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_narrow_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  result = (phylib_table *)phylib_table_copy(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->narrow);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_segment(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_stops_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  phylib_table *result = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_stops_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_segment" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_stops_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  result = (phylib_table *)phylib_table_segment(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_stops_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->stops = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_get_object(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_stops_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
-  unsigned char arg2 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  unsigned char val2 ;
-  int ecode2 = 0 ;
-  PyObject *swig_obj[2] ;
-  phylib_object *result = 0 ;
+  PyObject *swig_obj[1] ;
+  long result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_table_get_object", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_get_object" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_stops_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  ecode2 = SWIG_AsVal_unsigned_SS_char(swig_obj[1], &val2);
-  if (!SWIG_IsOK(ecode2)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_get_object" "', argument " "2"" of type '" "unsigned char""'");
-  } 
-  arg2 = (unsigned char)(val2);
-  result = (phylib_object *)phylib_table_get_object(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->stops);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_table_add_object(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_still_bounces_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
-  phylib_object *arg2 = (phylib_object *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_table_add_object", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_still_bounces_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_add_object" "', argument " "1"" of type '" "phylib_table *""'"); 
-  }
-  arg1 = (phylib_table *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_table_add_object" "', argument " "2"" of type '" "phylib_object *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_still_bounces_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg2 = (phylib_object *)(argp2);
-  phylib_table_add_object(arg1,arg2);
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_still_bounces_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->still_bounces = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5024,219 +5355,207 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_delete_phylib_table(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_still_bounces_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, SWIG_POINTER_DISOWN |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_phylib_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_still_bounces_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  delete_phylib_table(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->still_bounces);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *phylib_table_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  PyObject *obj;
-  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
-  SWIG_TypeNewClientData(SWIGTYPE_p_phylib_table, SWIG_NewClientData(obj));
-  return SWIG_Py_Void();
-}
-
-SWIGINTERN PyObject *phylib_table_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
-  return SWIG_Python_InitShadowInstance(args);
-}
-
-SWIGINTERN PyObject *_wrap_phylib_new_still_ball(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_rolling_bounces_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  unsigned char arg1 ;
-  phylib_coord *arg2 = (phylib_coord *) 0 ;
-  unsigned char val1 ;
-  int ecode1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  phylib_object *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_new_still_ball", 2, 2, swig_obj)) SWIG_fail;
-  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_still_ball" "', argument " "1"" of type '" "unsigned char""'");
-  } 
-  arg1 = (unsigned char)(val1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_coord, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_new_still_ball" "', argument " "2"" of type '" "phylib_coord *""'"); 
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_rolling_bounces_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_rolling_bounces_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg2 = (phylib_coord *)(argp2);
-  result = (phylib_object *)phylib_new_still_ball(arg1,arg2);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_rolling_bounces_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->rolling_bounces = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_new_rolling_ball(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_rolling_bounces_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  unsigned char arg1 ;
-  phylib_coord *arg2 = (phylib_coord *) 0 ;
-  phylib_coord *arg3 = (phylib_coord *) 0 ;
-  phylib_coord *arg4 = (phylib_coord *) 0 ;
-  unsigned char val1 ;
-  int ecode1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  void *argp3 = 0 ;
-  int res3 = 0 ;
-  void *argp4 = 0 ;
-  int res4 = 0 ;
-  PyObject *swig_obj[4] ;
-  phylib_object *result = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  long result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_new_rolling_ball", 4, 4, swig_obj)) SWIG_fail;
-  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_rolling_ball" "', argument " "1"" of type '" "unsigned char""'");
-  } 
-  arg1 = (unsigned char)(val1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_coord, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_new_rolling_ball" "', argument " "2"" of type '" "phylib_coord *""'"); 
-  }
-  arg2 = (phylib_coord *)(argp2);
-  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_phylib_coord, 0 |  0 );
-  if (!SWIG_IsOK(res3)) {
-    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "phylib_new_rolling_ball" "', argument " "3"" of type '" "phylib_coord *""'"); 
-  }
-  arg3 = (phylib_coord *)(argp3);
-  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_phylib_coord, 0 |  0 );
-  if (!SWIG_IsOK(res4)) {
-    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_new_rolling_ball" "', argument " "4"" of type '" "phylib_coord *""'"); 
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_rolling_bounces_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg4 = (phylib_coord *)(argp4);
-  result = (phylib_object *)phylib_new_rolling_ball(arg1,arg2,arg3,arg4);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->rolling_bounces);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_new_hole(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_hole_bounces_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_coord *arg1 = (phylib_coord *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  phylib_object *result = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_hole_bounces_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_new_hole" "', argument " "1"" of type '" "phylib_coord *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_hole_bounces_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_coord *)(argp1);
-  result = (phylib_object *)phylib_new_hole(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_hole_bounces_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->hole_bounces = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_new_hcushion(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_hole_bounces_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double arg1 ;
-  double val1 ;
-  int ecode1 = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  phylib_object *result = 0 ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_hcushion" "', argument " "1"" of type '" "double""'");
-  } 
-  arg1 = (double)(val1);
-  result = (phylib_object *)phylib_new_hcushion(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_hole_bounces_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
+  }
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->hole_bounces);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_new_vcushion(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_hcushion_bounces_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  double arg1 ;
-  double val1 ;
-  int ecode1 = 0 ;
-  PyObject *swig_obj[1] ;
-  phylib_object *result = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
-  ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
-  if (!SWIG_IsOK(ecode1)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_vcushion" "', argument " "1"" of type '" "double""'");
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_hcushion_bounces_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_hcushion_bounces_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
+  }
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_hcushion_bounces_set" "', argument " "2"" of type '" "long""'");
   } 
-  arg1 = (double)(val1);
-  result = (phylib_object *)phylib_new_vcushion(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->hcushion_bounces = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_new_table(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_hcushion_bounces_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *result = 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  long result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_new_table", 0, 0, 0)) SWIG_fail;
-  result = (phylib_table *)phylib_new_table();
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_hcushion_bounces_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
+  }
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->hcushion_bounces);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_copy_object(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_vcushion_bounces_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_object **arg1 = (phylib_object **) 0 ;
-  phylib_object **arg2 = (phylib_object **) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_copy_object", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_vcushion_bounces_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_copy_object" "', argument " "1"" of type '" "phylib_object **""'"); 
-  }
-  arg1 = (phylib_object **)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_copy_object" "', argument " "2"" of type '" "phylib_object **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_vcushion_bounces_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg2 = (phylib_object **)(argp2);
-  phylib_copy_object(arg1,arg2);
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_vcushion_bounces_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->vcushion_bounces = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5244,51 +5563,51 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_copy_table(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_vcushion_bounces_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  phylib_table *result = 0 ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_copy_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_vcushion_bounces_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  result = (phylib_table *)phylib_copy_table(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->vcushion_bounces);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_add_object(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_allocations_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
-  phylib_object *arg2 = (phylib_object *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  long arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  long val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_add_object", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_allocations_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_add_object" "', argument " "1"" of type '" "phylib_table *""'"); 
-  }
-  arg1 = (phylib_table *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_add_object" "', argument " "2"" of type '" "phylib_object *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_allocations_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg2 = (phylib_object *)(argp2);
-  phylib_add_object(arg1,arg2);
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_long(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_allocations_set" "', argument " "2"" of type '" "long""'");
+  } 
+  arg2 = (long)(val2);
+  if (arg1) (arg1)->allocations = arg2;
   resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
@@ -5296,92 +5615,74 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_free_table(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_allocations_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
+  long result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_free_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_allocations_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  arg1 = (phylib_table *)(argp1);
-  phylib_free_table(arg1);
-  resultobj = SWIG_Py_Void();
+  arg1 = (phylib_stats *)(argp1);
+  result = (long) ((arg1)->allocations);
+  resultobj = SWIG_From_long((long)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_sub(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_seconds_set(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_coord arg1 ;
-  phylib_coord arg2 ;
-  void *argp1 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  phylib_coord result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_sub", 2, 2, swig_obj)) SWIG_fail;
-  {
-    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
-    if (!SWIG_IsOK(res1)) {
-      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_sub" "', argument " "1"" of type '" "phylib_coord""'"); 
-    }  
-    if (!argp1) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_sub" "', argument " "1"" of type '" "phylib_coord""'");
-    } else {
-      arg1 = *((phylib_coord *)(argp1));
-    }
-  }
-  {
-    res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_phylib_coord,  0 );
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_sub" "', argument " "2"" of type '" "phylib_coord""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_sub" "', argument " "2"" of type '" "phylib_coord""'");
-    } else {
-      arg2 = *((phylib_coord *)(argp2));
-    }
+  if (!SWIG_Python_UnpackTuple(args, "phylib_stats_seconds_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_seconds_set" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  result = phylib_sub(arg1,arg2);
-  resultobj = SWIG_NewPointerObj((phylib_coord *)memcpy((phylib_coord *)calloc(1,sizeof(phylib_coord)),&result,sizeof(phylib_coord)), SWIGTYPE_p_phylib_coord, SWIG_POINTER_OWN |  0 );
+  arg1 = (phylib_stats *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_stats_seconds_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->seconds = arg2;
+  resultobj = SWIG_Py_Void();
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_length(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_stats_seconds_get(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_coord arg1 ;
-  void *argp1 ;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
   double result;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  {
-    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
-    if (!SWIG_IsOK(res1)) {
-      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_length" "', argument " "1"" of type '" "phylib_coord""'"); 
-    }  
-    if (!argp1) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_length" "', argument " "1"" of type '" "phylib_coord""'");
-    } else {
-      arg1 = *((phylib_coord *)(argp1));
-    }
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stats_seconds_get" "', argument " "1"" of type '" "phylib_stats *""'"); 
   }
-  result = (double)phylib_length(arg1);
+  arg1 = (phylib_stats *)(argp1);
+  result = (double) ((arg1)->seconds);
   resultobj = SWIG_From_double((double)(result));
   return resultobj;
 fail:
@@ -5389,251 +5690,2845 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_dot_product(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_new_phylib_stats(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_coord arg1 ;
-  phylib_coord arg2 ;
-  void *argp1 ;
+  phylib_stats *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_phylib_stats", 0, 0, 0)) SWIG_fail;
+  result = (phylib_stats *)calloc(1, sizeof(phylib_stats));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_stats, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_phylib_stats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_stats *arg1 = (phylib_stats *) 0 ;
+  void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 ;
-  int res2 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_stats, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_phylib_stats" "', argument " "1"" of type '" "phylib_stats *""'"); 
+  }
+  arg1 = (phylib_stats *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *phylib_stats_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_phylib_stats, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *phylib_stats_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_phylib_table_time_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_time_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_time_set" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_time_set" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  if (arg1) (arg1)->time = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_time_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
   double result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_dot_product", 2, 2, swig_obj)) SWIG_fail;
-  {
-    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
-    if (!SWIG_IsOK(res1)) {
-      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_dot_product" "', argument " "1"" of type '" "phylib_coord""'"); 
-    }  
-    if (!argp1) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_dot_product" "', argument " "1"" of type '" "phylib_coord""'");
-    } else {
-      arg1 = *((phylib_coord *)(argp1));
-    }
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_time_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (double) ((arg1)->time);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_object_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_object **result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_object_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_object **) ((arg1)->object);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_capacity_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_capacity_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int) ((arg1)->capacity);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_count_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_count_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int) ((arg1)->count);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_slots_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_object *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_slots_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_object *) ((arg1)->slots);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_chunks_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  struct phylib_chunk *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_chunks_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (struct phylib_chunk *) ((arg1)->chunks);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_chunk, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_ball_slot_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  int *arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_ball_slot_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_ball_slot_set" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
+  arg1 = (phylib_table *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_table_ball_slot_set" "', argument " "2"" of type '" "int [(256)]""'"); 
+  } 
+  arg2 = (int *)(argp2);
   {
-    res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_phylib_coord,  0 );
-    if (!SWIG_IsOK(res2)) {
-      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_dot_product" "', argument " "2"" of type '" "phylib_coord""'"); 
-    }  
-    if (!argp2) {
-      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_dot_product" "', argument " "2"" of type '" "phylib_coord""'");
+    if (arg2) {
+      size_t ii = 0;
+      for (; ii < (size_t)(256); ++ii) *(int *)&arg1->ball_slot[ii] = *((int *)arg2 + ii);
     } else {
-      arg2 = *((phylib_coord *)(argp2));
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in variable '""ball_slot""' of type '""int [(256)]""'");
     }
   }
-  result = (double)phylib_dot_product(arg1,arg2);
-  resultobj = SWIG_From_double((double)(result));
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_ball_slot_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_ball_slot_get" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int *)(int *) ((arg1)->ball_slot);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_phylib_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 = (int) (26) ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_phylib_table", 0, 1, swig_obj)) SWIG_fail;
+  if (swig_obj[0]) {
+    ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+    if (!SWIG_IsOK(ecode1)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "new_phylib_table" "', argument " "1"" of type '" "int""'");
+    } 
+    arg1 = (int)(val1);
+  }
+  result = (phylib_table *)new_phylib_table(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_copy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_copy" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_table *)phylib_table_copy(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_segment(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_solver arg2 = (phylib_solver) PHYLIB_SOLVER_STEP ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_table *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_segment", 1, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_segment" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  if (swig_obj[1]) {
+    ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+    if (!SWIG_IsOK(ecode2)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_segment" "', argument " "2"" of type '" "phylib_solver""'");
+    } 
+    arg2 = (phylib_solver)(val2);
+  }
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (phylib_table *)phylib_table_segment(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_simulate_batch(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  PyObject *arg2 = (PyObject *) 0 ;
+  int arg3 ;
+  PyObject *arg4 = (PyObject *) 0 ;
+  PyObject *arg5 = (PyObject *) 0 ;
+  PyObject *arg6 = (PyObject *) 0 ;
+  PyObject *arg7 = (PyObject *) 0 ;
+  phylib_solver arg8 = (phylib_solver) PHYLIB_SOLVER_STEP ;
+  int arg9 = (int) 1 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  int val8 ;
+  int ecode8 = 0 ;
+  int val9 ;
+  int ecode9 = 0 ;
+  PyObject *swig_obj[9] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_simulate_batch", 7, 9, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_simulate_batch" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  arg2 = swig_obj[1];
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_table_simulate_batch" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  arg4 = swig_obj[3];
+  arg5 = swig_obj[4];
+  arg6 = swig_obj[5];
+  arg7 = swig_obj[6];
+  if (swig_obj[7]) {
+    ecode8 = SWIG_AsVal_int(swig_obj[7], &val8);
+    if (!SWIG_IsOK(ecode8)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode8), "in method '" "phylib_table_simulate_batch" "', argument " "8"" of type '" "phylib_solver""'");
+    } 
+    arg8 = (phylib_solver)(val8);
+  }
+  if (swig_obj[8]) {
+    ecode9 = SWIG_AsVal_int(swig_obj[8], &val9);
+    if (!SWIG_IsOK(ecode9)) {
+      SWIG_exception_fail(SWIG_ArgError(ecode9), "in method '" "phylib_table_simulate_batch" "', argument " "9"" of type '" "int""'");
+    } 
+    arg9 = (int)(val9);
+  }
+  result = (PyObject *)phylib_table_simulate_batch(arg1,arg2,arg3,arg4,arg5,arg6,arg7,arg8,arg9);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_roll_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  double arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_table *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_roll_table", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_roll_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_roll_table" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (phylib_table *)phylib_table_roll_table(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_frames(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  double arg2 ;
+  int arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  PyObject *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_frames", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_frames" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_frames" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_table_frames" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  result = (PyObject *)phylib_table_frames(arg1,arg2,arg3);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_fixture_count(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_fixture_count" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int)phylib_table_fixture_count(arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_balls(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_balls" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (PyObject *)phylib_table_balls(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_ball(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_object *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_ball", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_ball" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_ball" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (phylib_object *)phylib_table_ball(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_pocketed(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  PyObject *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_pocketed" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (PyObject *)phylib_table_pocketed(arg1);
+  resultobj = result;
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_stats(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_stats *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_stats" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_stats *)phylib_table_stats(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_stats, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_get_object(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_object *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_get_object", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_get_object" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_table_get_object" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (phylib_object *)phylib_table_get_object(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_table_add_object(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_object *arg2 = (phylib_object *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_table_add_object", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_table_add_object" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_table_add_object" "', argument " "2"" of type '" "phylib_object *""'"); 
+  }
+  arg2 = (phylib_object *)(argp2);
+  phylib_table_add_object(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_phylib_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_phylib_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  delete_phylib_table(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *phylib_table_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_phylib_table, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *phylib_table_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_phylib_soa_n_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_n_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_n_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_soa_n_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->n = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_n_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_n_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (int) ((arg1)->n);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_slot_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  int *arg2 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_slot_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_slot_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_slot_set" "', argument " "2"" of type '" "int *""'"); 
+  }
+  arg2 = (int *)(argp2);
+  if (arg1) (arg1)->slot = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_slot_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_slot_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (int *) ((arg1)->slot);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_type_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  unsigned char *arg2 = (unsigned char *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_type_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_type_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_unsigned_char, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_type_set" "', argument " "2"" of type '" "unsigned char *""'"); 
+  }
+  arg2 = (unsigned char *)(argp2);
+  if (arg1) (arg1)->type = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_type_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned char *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_type_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (unsigned char *) ((arg1)->type);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_unsigned_char, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_px_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_px_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_px_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_px_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->px = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_px_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_px_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->px);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_py_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_py_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_py_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_py_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->py = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_py_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_py_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->py);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_vx_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_vx_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_vx_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_vx_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->vx = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_vx_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_vx_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->vx);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_vy_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_vy_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_vy_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_vy_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->vy = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_vy_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_vy_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->vy);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_ax_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_ax_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_ax_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_ax_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->ax = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_ax_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_ax_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->ax);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_ay_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  double *arg2 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_ay_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_ay_set" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_double, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_ay_set" "', argument " "2"" of type '" "double *""'"); 
+  }
+  arg2 = (double *)(argp2);
+  if (arg1) (arg1)->ay = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_ay_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_ay_get" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (double *) ((arg1)->ay);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_double, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_phylib_soa(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_phylib_soa", 0, 0, 0)) SWIG_fail;
+  result = (phylib_soa *)calloc(1, sizeof(phylib_soa));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_soa, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_phylib_soa(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_phylib_soa" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *phylib_soa_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_phylib_soa, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *phylib_soa_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_nballs_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_nballs_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_nballs_set" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_broadphase_nballs_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->nballs = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_nballs_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_nballs_get" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  result = (int) ((arg1)->nballs);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_nfixed_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  int arg2 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_nfixed_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_nfixed_set" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_broadphase_nfixed_set" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  if (arg1) (arg1)->nfixed = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_nfixed_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_nfixed_get" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  result = (int) ((arg1)->nfixed);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_ball_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  int *arg2 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_ball_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_ball_set" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_broadphase_ball_set" "', argument " "2"" of type '" "int *""'"); 
+  }
+  arg2 = (int *)(argp2);
+  if (arg1) (arg1)->ball = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_ball_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_ball_get" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  result = (int *) ((arg1)->ball);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_fixed_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  int *arg2 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_fixed_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_fixed_set" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_broadphase_fixed_set" "', argument " "2"" of type '" "int *""'"); 
+  }
+  arg2 = (int *)(argp2);
+  if (arg1) (arg1)->fixed = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_fixed_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_fixed_get" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  result = (int *) ((arg1)->fixed);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_rank_set(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  int *arg2 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_rank_set", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_rank_set" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_broadphase_rank_set" "', argument " "2"" of type '" "int *""'"); 
+  }
+  arg2 = (int *)(argp2);
+  if (arg1) (arg1)->rank = arg2;
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_rank_get(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_rank_get" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  result = (int *) ((arg1)->rank);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_int, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_new_phylib_broadphase(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "new_phylib_broadphase", 0, 0, 0)) SWIG_fail;
+  result = (phylib_broadphase *)calloc(1, sizeof(phylib_broadphase));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_broadphase, SWIG_POINTER_NEW |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_delete_phylib_broadphase(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, SWIG_POINTER_DISOWN |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "delete_phylib_broadphase" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  free((char *) arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *phylib_broadphase_swigregister(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  PyObject *obj;
+  if (!SWIG_Python_UnpackTuple(args, "swigregister", 1, 1, &obj)) return NULL;
+  SWIG_TypeNewClientData(SWIGTYPE_p_phylib_broadphase, SWIG_NewClientData(obj));
+  return SWIG_Py_Void();
+}
+
+SWIGINTERN PyObject *phylib_broadphase_swiginit(PyObject *SWIGUNUSEDPARM(self), PyObject *args) {
+  return SWIG_Python_InitShadowInstance(args);
+}
+
+SWIGINTERN PyObject *_wrap_phylib_new_still_ball(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned char arg1 ;
+  phylib_coord *arg2 = (phylib_coord *) 0 ;
+  unsigned char val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_object *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_new_still_ball", 2, 2, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_still_ball" "', argument " "1"" of type '" "unsigned char""'");
+  } 
+  arg1 = (unsigned char)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_new_still_ball" "', argument " "2"" of type '" "phylib_coord *""'"); 
+  }
+  arg2 = (phylib_coord *)(argp2);
+  result = (phylib_object *)phylib_new_still_ball(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_rolling_ball(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  unsigned char arg1 ;
+  phylib_coord *arg2 = (phylib_coord *) 0 ;
+  phylib_coord *arg3 = (phylib_coord *) 0 ;
+  phylib_coord *arg4 = (phylib_coord *) 0 ;
+  unsigned char val1 ;
+  int ecode1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  phylib_object *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_new_rolling_ball", 4, 4, swig_obj)) SWIG_fail;
+  ecode1 = SWIG_AsVal_unsigned_SS_char(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_rolling_ball" "', argument " "1"" of type '" "unsigned char""'");
+  } 
+  arg1 = (unsigned char)(val1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_new_rolling_ball" "', argument " "2"" of type '" "phylib_coord *""'"); 
+  }
+  arg2 = (phylib_coord *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "phylib_new_rolling_ball" "', argument " "3"" of type '" "phylib_coord *""'"); 
+  }
+  arg3 = (phylib_coord *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_new_rolling_ball" "', argument " "4"" of type '" "phylib_coord *""'"); 
+  }
+  arg4 = (phylib_coord *)(argp4);
+  result = (phylib_object *)phylib_new_rolling_ball(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_hole(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_coord *arg1 = (phylib_coord *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_object *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_coord, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_new_hole" "', argument " "1"" of type '" "phylib_coord *""'"); 
+  }
+  arg1 = (phylib_coord *)(argp1);
+  result = (phylib_object *)phylib_new_hole(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_hcushion(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double arg1 ;
+  double val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_object *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_hcushion" "', argument " "1"" of type '" "double""'");
+  } 
+  arg1 = (double)(val1);
+  result = (phylib_object *)phylib_new_hcushion(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_vcushion(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  double arg1 ;
+  double val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_object *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_double(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_vcushion" "', argument " "1"" of type '" "double""'");
+  } 
+  arg1 = (double)(val1);
+  result = (phylib_object *)phylib_new_vcushion(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_new_table", 0, 0, 0)) SWIG_fail;
+  result = (phylib_table *)phylib_new_table();
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_new_table_capacity(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int arg1 ;
+  int val1 ;
+  int ecode1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  ecode1 = SWIG_AsVal_int(swig_obj[0], &val1);
+  if (!SWIG_IsOK(ecode1)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode1), "in method '" "phylib_new_table_capacity" "', argument " "1"" of type '" "int""'");
+  } 
+  arg1 = (int)(val1);
+  result = (phylib_table *)phylib_new_table_capacity(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_copy_object(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object **arg1 = (phylib_object **) 0 ;
+  phylib_object **arg2 = (phylib_object **) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_copy_object", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_copy_object" "', argument " "1"" of type '" "phylib_object **""'"); 
+  }
+  arg1 = (phylib_object **)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_copy_object" "', argument " "2"" of type '" "phylib_object **""'"); 
+  }
+  arg2 = (phylib_object **)(argp2);
+  phylib_copy_object(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_copy_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_copy_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_table *)phylib_copy_table(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_add_object(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_object *arg2 = (phylib_object *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_add_object", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_add_object" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_add_object" "', argument " "2"" of type '" "phylib_object *""'"); 
+  }
+  arg2 = (phylib_object *)(argp2);
+  phylib_add_object(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_add_object_copy(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_object *arg2 = (phylib_object *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_object *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_add_object_copy", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_add_object_copy" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_add_object_copy" "', argument " "2"" of type '" "phylib_object const *""'"); 
+  }
+  arg2 = (phylib_object *)(argp2);
+  result = (phylib_object *)phylib_add_object_copy(arg1,(phylib_object const *)arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_free_table(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_free_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  phylib_free_table(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_sub(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_coord arg1 ;
+  phylib_coord arg2 ;
+  void *argp1 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_coord result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_sub", 2, 2, swig_obj)) SWIG_fail;
+  {
+    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_sub" "', argument " "1"" of type '" "phylib_coord""'"); 
+    }  
+    if (!argp1) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_sub" "', argument " "1"" of type '" "phylib_coord""'");
+    } else {
+      arg1 = *((phylib_coord *)(argp1));
+    }
+  }
+  {
+    res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_phylib_coord,  0 );
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_sub" "', argument " "2"" of type '" "phylib_coord""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_sub" "', argument " "2"" of type '" "phylib_coord""'");
+    } else {
+      arg2 = *((phylib_coord *)(argp2));
+    }
+  }
+  result = phylib_sub(arg1,arg2);
+  resultobj = SWIG_NewPointerObj((phylib_coord *)memcpy((phylib_coord *)calloc(1,sizeof(phylib_coord)),&result,sizeof(phylib_coord)), SWIGTYPE_p_phylib_coord, SWIG_POINTER_OWN |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_length(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_coord arg1 ;
+  void *argp1 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  double result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  {
+    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_length" "', argument " "1"" of type '" "phylib_coord""'"); 
+    }  
+    if (!argp1) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_length" "', argument " "1"" of type '" "phylib_coord""'");
+    } else {
+      arg1 = *((phylib_coord *)(argp1));
+    }
+  }
+  result = (double)phylib_length(arg1);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_dot_product(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_coord arg1 ;
+  phylib_coord arg2 ;
+  void *argp1 ;
+  int res1 = 0 ;
+  void *argp2 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_dot_product", 2, 2, swig_obj)) SWIG_fail;
+  {
+    res1 = SWIG_ConvertPtr(swig_obj[0], &argp1, SWIGTYPE_p_phylib_coord,  0 );
+    if (!SWIG_IsOK(res1)) {
+      SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_dot_product" "', argument " "1"" of type '" "phylib_coord""'"); 
+    }  
+    if (!argp1) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_dot_product" "', argument " "1"" of type '" "phylib_coord""'");
+    } else {
+      arg1 = *((phylib_coord *)(argp1));
+    }
+  }
+  {
+    res2 = SWIG_ConvertPtr(swig_obj[1], &argp2, SWIGTYPE_p_phylib_coord,  0 );
+    if (!SWIG_IsOK(res2)) {
+      SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_dot_product" "', argument " "2"" of type '" "phylib_coord""'"); 
+    }  
+    if (!argp2) {
+      SWIG_exception_fail(SWIG_ValueError, "invalid null reference " "in method '" "phylib_dot_product" "', argument " "2"" of type '" "phylib_coord""'");
+    } else {
+      arg2 = *((phylib_coord *)(argp2));
+    }
+  }
+  result = (double)phylib_dot_product(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_distance(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object *arg1 = (phylib_object *) 0 ;
+  phylib_object *arg2 = (phylib_object *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  double result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_distance", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_distance" "', argument " "1"" of type '" "phylib_object *""'"); 
+  }
+  arg1 = (phylib_object *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_distance" "', argument " "2"" of type '" "phylib_object *""'"); 
+  }
+  arg2 = (phylib_object *)(argp2);
+  result = (double)phylib_distance(arg1,arg2);
+  resultobj = SWIG_From_double((double)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_roll(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object *arg1 = (phylib_object *) 0 ;
+  phylib_object *arg2 = (phylib_object *) 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_roll", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_roll" "', argument " "1"" of type '" "phylib_object *""'"); 
+  }
+  arg1 = (phylib_object *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_roll" "', argument " "2"" of type '" "phylib_object *""'"); 
+  }
+  arg2 = (phylib_object *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_roll" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    phylib_roll(arg1,arg2,arg3);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_stopped(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object *arg1 = (phylib_object *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned char result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stopped" "', argument " "1"" of type '" "phylib_object *""'"); 
+  }
+  arg1 = (phylib_object *)(argp1);
+  result = (unsigned char)phylib_stopped(arg1);
+  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_bounce(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object **arg1 = (phylib_object **) 0 ;
+  phylib_object **arg2 = (phylib_object **) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_bounce", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_bounce" "', argument " "1"" of type '" "phylib_object **""'"); 
+  }
+  arg1 = (phylib_object **)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_bounce" "', argument " "2"" of type '" "phylib_object **""'"); 
+  }
+  arg2 = (phylib_object **)(argp2);
+  phylib_bounce(arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_rolling(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  unsigned char result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_rolling" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (unsigned char)phylib_rolling(arg1);
+  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_segment(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_segment" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (phylib_table *)phylib_segment(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_update_rolling_balls(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_table *arg2 = (phylib_table *) 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "update_rolling_balls", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "update_rolling_balls" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "update_rolling_balls" "', argument " "2"" of type '" "phylib_table const *""'"); 
+  }
+  arg2 = (phylib_table *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "update_rolling_balls" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  update_rolling_balls(arg1,(phylib_table const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_check_stopped_condition(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "check_stopped_condition" "', argument " "1"" of type '" "phylib_table const *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int)check_stopped_condition((phylib_table const *)arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_check_collision_condition(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "check_collision_condition" "', argument " "1"" of type '" "phylib_table const *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  result = (int)check_collision_condition((phylib_table const *)arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_init(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  phylib_table *arg2 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_init", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_init" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_init" "', argument " "2"" of type '" "phylib_table const *""'"); 
+  }
+  arg2 = (phylib_table *)(argp2);
+  result = (int)phylib_soa_init(arg1,(phylib_table const *)arg2);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_store(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  phylib_table *arg2 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  PyObject *swig_obj[2] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_store", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_store" "', argument " "1"" of type '" "phylib_soa const *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_store" "', argument " "2"" of type '" "phylib_table *""'"); 
+  }
+  arg2 = (phylib_table *)(argp2);
+  phylib_soa_store((phylib_soa const *)arg1,arg2);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_roll(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  phylib_soa *arg2 = (phylib_soa *) 0 ;
+  double arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  double val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_soa_roll", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_roll" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_soa_roll" "', argument " "2"" of type '" "phylib_soa const *""'"); 
+  }
+  arg2 = (phylib_soa *)(argp2);
+  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_soa_roll" "', argument " "3"" of type '" "double""'");
+  } 
+  arg3 = (double)(val3);
+  phylib_soa_roll(arg1,(phylib_soa const *)arg2,arg3);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_stopped(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  int result;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_stopped" "', argument " "1"" of type '" "phylib_soa const *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  result = (int)phylib_soa_stopped((phylib_soa const *)arg1);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_soa_free(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_soa *arg1 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_soa_free" "', argument " "1"" of type '" "phylib_soa *""'"); 
+  }
+  arg1 = (phylib_soa *)(argp1);
+  phylib_soa_free(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_init(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  phylib_table *arg2 = (phylib_table *) 0 ;
+  phylib_soa *arg3 = (phylib_soa *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  PyObject *swig_obj[3] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_init", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_init" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_broadphase_init" "', argument " "2"" of type '" "phylib_table const *""'"); 
+  }
+  arg2 = (phylib_table *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "phylib_broadphase_init" "', argument " "3"" of type '" "phylib_soa const *""'"); 
+  }
+  arg3 = (phylib_soa *)(argp3);
+  result = (int)phylib_broadphase_init(arg1,(phylib_table const *)arg2,(phylib_soa const *)arg3);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_free(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_free" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  phylib_broadphase_free(arg1);
+  resultobj = SWIG_Py_Void();
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_broadphase_collision(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_broadphase *arg1 = (phylib_broadphase *) 0 ;
+  phylib_table *arg2 = (phylib_table *) 0 ;
+  phylib_soa *arg3 = (phylib_soa *) 0 ;
+  int *arg4 = (int *) 0 ;
+  int *arg5 = (int *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  void *argp2 = 0 ;
+  int res2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  void *argp5 = 0 ;
+  int res5 = 0 ;
+  PyObject *swig_obj[5] ;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_broadphase_collision", 5, 5, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_broadphase, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_broadphase_collision" "', argument " "1"" of type '" "phylib_broadphase *""'"); 
+  }
+  arg1 = (phylib_broadphase *)(argp1);
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_broadphase_collision" "', argument " "2"" of type '" "phylib_table const *""'"); 
+  }
+  arg2 = (phylib_table *)(argp2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_phylib_soa, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "phylib_broadphase_collision" "', argument " "3"" of type '" "phylib_soa const *""'"); 
+  }
+  arg3 = (phylib_soa *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_broadphase_collision" "', argument " "4"" of type '" "int *""'"); 
+  }
+  arg4 = (int *)(argp4);
+  res5 = SWIG_ConvertPtr(swig_obj[4], &argp5,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res5)) {
+    SWIG_exception_fail(SWIG_ArgError(res5), "in method '" "phylib_broadphase_collision" "', argument " "5"" of type '" "int *""'"); 
+  }
+  arg5 = (int *)(argp5);
+  result = (int)phylib_broadphase_collision(arg1,(phylib_table const *)arg2,(phylib_soa const *)arg3,arg4,arg5);
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_segment_event(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  PyObject *swig_obj[1] ;
+  phylib_table *result = 0 ;
+  
+  if (!args) SWIG_fail;
+  swig_obj[0] = args;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_segment_event" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (phylib_table *)phylib_segment_event(arg1);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+  }
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_distance(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_segment_solver(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_object *arg1 = (phylib_object *) 0 ;
-  phylib_object *arg2 = (phylib_object *) 0 ;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_solver arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
   PyObject *swig_obj[2] ;
-  double result;
+  phylib_table *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_distance", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_segment_solver", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_distance" "', argument " "1"" of type '" "phylib_object *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_segment_solver" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
-  arg1 = (phylib_object *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_distance" "', argument " "2"" of type '" "phylib_object *""'"); 
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_segment_solver" "', argument " "2"" of type '" "phylib_solver""'");
+  } 
+  arg2 = (phylib_solver)(val2);
+  {
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    result = (phylib_table *)phylib_segment_solver(arg1,arg2);
+    SWIG_PYTHON_THREAD_END_ALLOW;
   }
-  arg2 = (phylib_object *)(argp2);
-  result = (double)phylib_distance(arg1,arg2);
-  resultobj = SWIG_From_double((double)(result));
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_roll(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_segment_contact(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_object *arg1 = (phylib_object *) 0 ;
-  phylib_object *arg2 = (phylib_object *) 0 ;
-  double arg3 ;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_solver arg2 ;
+  int *arg3 = (int *) 0 ;
+  int *arg4 = (int *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  PyObject *swig_obj[3] ;
+  int val2 ;
+  int ecode2 = 0 ;
+  void *argp3 = 0 ;
+  int res3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
+  phylib_table *result = 0 ;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_roll", 3, 3, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_segment_contact", 4, 4, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_roll" "', argument " "1"" of type '" "phylib_object *""'"); 
-  }
-  arg1 = (phylib_object *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_roll" "', argument " "2"" of type '" "phylib_object *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_segment_contact" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
-  arg2 = (phylib_object *)(argp2);
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_roll" "', argument " "3"" of type '" "double""'");
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_segment_contact" "', argument " "2"" of type '" "phylib_solver""'");
   } 
-  arg3 = (double)(val3);
-  phylib_roll(arg1,arg2,arg3);
-  resultobj = SWIG_Py_Void();
+  arg2 = (phylib_solver)(val2);
+  res3 = SWIG_ConvertPtr(swig_obj[2], &argp3,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res3)) {
+    SWIG_exception_fail(SWIG_ArgError(res3), "in method '" "phylib_segment_contact" "', argument " "3"" of type '" "int *""'"); 
+  }
+  arg3 = (int *)(argp3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_segment_contact" "', argument " "4"" of type '" "int *""'"); 
+  }
+  arg4 = (int *)(argp4);
+  result = (phylib_table *)phylib_segment_contact(arg1,arg2,arg3,arg4);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_stopped(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_profile(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_object *arg1 = (phylib_object *) 0 ;
+  phylib_table *arg1 = (phylib_table *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   PyObject *swig_obj[1] ;
-  unsigned char result;
+  phylib_stats *result = 0 ;
   
   if (!args) SWIG_fail;
   swig_obj[0] = args;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_stopped" "', argument " "1"" of type '" "phylib_object *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_profile" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
-  arg1 = (phylib_object *)(argp1);
-  result = (unsigned char)phylib_stopped(arg1);
-  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  arg1 = (phylib_table *)(argp1);
+  result = (phylib_stats *)phylib_profile(arg1);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_stats, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_bounce(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_simulate_batch(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
-  phylib_object **arg1 = (phylib_object **) 0 ;
-  phylib_object **arg2 = (phylib_object **) 0 ;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_solver arg2 ;
+  int arg3 ;
+  double *arg4 = (double *) 0 ;
+  int arg5 ;
+  double *arg6 = (double *) 0 ;
+  unsigned char *arg7 = (unsigned char *) 0 ;
+  int *arg8 = (int *) 0 ;
+  double *arg9 = (double *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  void *argp2 = 0 ;
-  int res2 = 0 ;
-  PyObject *swig_obj[2] ;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  PyObject *swig_obj[9] ;
+  int result;
   
-  if (!SWIG_Python_UnpackTuple(args, "phylib_bounce", 2, 2, swig_obj)) SWIG_fail;
-  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_p_phylib_object, 0 |  0 );
+  if (!SWIG_Python_UnpackTuple(args, "phylib_simulate_batch", 9, 9, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_bounce" "', argument " "1"" of type '" "phylib_object **""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_simulate_batch" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
-  arg1 = (phylib_object **)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_p_phylib_object, 0 |  0 );
-  if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_bounce" "', argument " "2"" of type '" "phylib_object **""'"); 
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_simulate_batch" "', argument " "2"" of type '" "phylib_solver""'");
+  } 
+  arg2 = (phylib_solver)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_simulate_batch" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_simulate_batch" "', argument " "4"" of type '" "double const *""'"); 
   }
-  arg2 = (phylib_object **)(argp2);
-  phylib_bounce(arg1,arg2);
-  resultobj = SWIG_Py_Void();
+  arg4 = (double *)(argp4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "phylib_simulate_batch" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "phylib_simulate_batch" "', argument " "6"" of type '" "double *""'"); 
+  }
+  arg6 = (double *)(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_unsigned_char, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "phylib_simulate_batch" "', argument " "7"" of type '" "unsigned char *""'"); 
+  }
+  arg7 = (unsigned char *)(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "phylib_simulate_batch" "', argument " "8"" of type '" "int *""'"); 
+  }
+  arg8 = (int *)(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "phylib_simulate_batch" "', argument " "9"" of type '" "double *""'"); 
+  }
+  arg9 = (double *)(argp9);
+  result = (int)phylib_simulate_batch(arg1,arg2,arg3,(double const *)arg4,arg5,arg6,arg7,arg8,arg9);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_rolling(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_simulate_batch_parallel(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   phylib_table *arg1 = (phylib_table *) 0 ;
+  phylib_solver arg2 ;
+  int arg3 ;
+  double *arg4 = (double *) 0 ;
+  int arg5 ;
+  double *arg6 = (double *) 0 ;
+  unsigned char *arg7 = (unsigned char *) 0 ;
+  int *arg8 = (int *) 0 ;
+  double *arg9 = (double *) 0 ;
+  int arg10 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  unsigned char result;
+  int val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  int val5 ;
+  int ecode5 = 0 ;
+  void *argp6 = 0 ;
+  int res6 = 0 ;
+  void *argp7 = 0 ;
+  int res7 = 0 ;
+  void *argp8 = 0 ;
+  int res8 = 0 ;
+  void *argp9 = 0 ;
+  int res9 = 0 ;
+  int val10 ;
+  int ecode10 = 0 ;
+  PyObject *swig_obj[10] ;
+  int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "phylib_simulate_batch_parallel", 10, 10, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_rolling" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_simulate_batch_parallel" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
   arg1 = (phylib_table *)(argp1);
-  result = (unsigned char)phylib_rolling(arg1);
-  resultobj = SWIG_From_unsigned_SS_char((unsigned char)(result));
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_simulate_batch_parallel" "', argument " "2"" of type '" "phylib_solver""'");
+  } 
+  arg2 = (phylib_solver)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_simulate_batch_parallel" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_simulate_batch_parallel" "', argument " "4"" of type '" "double const *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  ecode5 = SWIG_AsVal_int(swig_obj[4], &val5);
+  if (!SWIG_IsOK(ecode5)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode5), "in method '" "phylib_simulate_batch_parallel" "', argument " "5"" of type '" "int""'");
+  } 
+  arg5 = (int)(val5);
+  res6 = SWIG_ConvertPtr(swig_obj[5], &argp6,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res6)) {
+    SWIG_exception_fail(SWIG_ArgError(res6), "in method '" "phylib_simulate_batch_parallel" "', argument " "6"" of type '" "double *""'"); 
+  }
+  arg6 = (double *)(argp6);
+  res7 = SWIG_ConvertPtr(swig_obj[6], &argp7,SWIGTYPE_p_unsigned_char, 0 |  0 );
+  if (!SWIG_IsOK(res7)) {
+    SWIG_exception_fail(SWIG_ArgError(res7), "in method '" "phylib_simulate_batch_parallel" "', argument " "7"" of type '" "unsigned char *""'"); 
+  }
+  arg7 = (unsigned char *)(argp7);
+  res8 = SWIG_ConvertPtr(swig_obj[7], &argp8,SWIGTYPE_p_int, 0 |  0 );
+  if (!SWIG_IsOK(res8)) {
+    SWIG_exception_fail(SWIG_ArgError(res8), "in method '" "phylib_simulate_batch_parallel" "', argument " "8"" of type '" "int *""'"); 
+  }
+  arg8 = (int *)(argp8);
+  res9 = SWIG_ConvertPtr(swig_obj[8], &argp9,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res9)) {
+    SWIG_exception_fail(SWIG_ArgError(res9), "in method '" "phylib_simulate_batch_parallel" "', argument " "9"" of type '" "double *""'"); 
+  }
+  arg9 = (double *)(argp9);
+  ecode10 = SWIG_AsVal_int(swig_obj[9], &val10);
+  if (!SWIG_IsOK(ecode10)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode10), "in method '" "phylib_simulate_batch_parallel" "', argument " "10"" of type '" "int""'");
+  } 
+  arg10 = (int)(val10);
+  result = (int)phylib_simulate_batch_parallel(arg1,arg2,arg3,(double const *)arg4,arg5,arg6,arg7,arg8,arg9,arg10);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_phylib_segment(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_workers(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  int result;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_workers", 0, 0, 0)) SWIG_fail;
+  result = (int)phylib_workers();
+  resultobj = SWIG_From_int((int)(result));
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_find_ball(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   phylib_table *arg1 = (phylib_table *) 0 ;
+  int arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
-  phylib_table *result = 0 ;
+  int val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_object *result = 0 ;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "phylib_find_ball", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_segment" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_find_ball" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
   arg1 = (phylib_table *)(argp1);
-  result = (phylib_table *)phylib_segment(arg1);
-  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  ecode2 = SWIG_AsVal_int(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_find_ball" "', argument " "2"" of type '" "int""'");
+  } 
+  arg2 = (int)(val2);
+  result = (phylib_object *)phylib_find_ball(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_object, 0 |  0 );
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_update_rolling_balls(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_pocketed(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   phylib_table *arg1 = (phylib_table *) 0 ;
-  phylib_table *arg2 = (phylib_table *) 0 ;
-  double arg3 ;
+  int *arg2 = (int *) 0 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
   void *argp2 = 0 ;
   int res2 = 0 ;
-  double val3 ;
-  int ecode3 = 0 ;
-  PyObject *swig_obj[3] ;
+  PyObject *swig_obj[2] ;
+  int result;
   
-  if (!SWIG_Python_UnpackTuple(args, "update_rolling_balls", 3, 3, swig_obj)) SWIG_fail;
+  if (!SWIG_Python_UnpackTuple(args, "phylib_pocketed", 2, 2, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "update_rolling_balls" "', argument " "1"" of type '" "phylib_table *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_pocketed" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
   arg1 = (phylib_table *)(argp1);
-  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_phylib_table, 0 |  0 );
+  res2 = SWIG_ConvertPtr(swig_obj[1], &argp2,SWIGTYPE_p_int, 0 |  0 );
   if (!SWIG_IsOK(res2)) {
-    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "update_rolling_balls" "', argument " "2"" of type '" "phylib_table const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_pocketed" "', argument " "2"" of type '" "int *""'"); 
   }
-  arg2 = (phylib_table *)(argp2);
-  ecode3 = SWIG_AsVal_double(swig_obj[2], &val3);
-  if (!SWIG_IsOK(ecode3)) {
-    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "update_rolling_balls" "', argument " "3"" of type '" "double""'");
-  } 
-  arg3 = (double)(val3);
-  update_rolling_balls(arg1,(phylib_table const *)arg2,arg3);
-  resultobj = SWIG_Py_Void();
+  arg2 = (int *)(argp2);
+  result = (int)phylib_pocketed(arg1,arg2);
+  resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
   return NULL;
 }
 
 
-SWIGINTERN PyObject *_wrap_check_stopped_condition(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_ball_count(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   phylib_table *arg1 = (phylib_table *) 0 ;
   void *argp1 = 0 ;
@@ -5645,10 +8540,10 @@ SWIGINTERN PyObject *_wrap_check_stopped_condition(PyObject *self, PyObject *arg
   swig_obj[0] = args;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "check_stopped_condition" "', argument " "1"" of type '" "phylib_table const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_ball_count" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
   arg1 = (phylib_table *)(argp1);
-  result = (int)check_stopped_condition((phylib_table const *)arg1);
+  result = (int)phylib_ball_count(arg1);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -5656,22 +8551,75 @@ fail:
 }
 
 
-SWIGINTERN PyObject *_wrap_check_collision_condition(PyObject *self, PyObject *args) {
+SWIGINTERN PyObject *_wrap_phylib_roll_table(PyObject *self, PyObject *args) {
   PyObject *resultobj = 0;
   phylib_table *arg1 = (phylib_table *) 0 ;
+  double arg2 ;
   void *argp1 = 0 ;
   int res1 = 0 ;
-  PyObject *swig_obj[1] ;
+  double val2 ;
+  int ecode2 = 0 ;
+  PyObject *swig_obj[2] ;
+  phylib_table *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_roll_table", 2, 2, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_roll_table" "', argument " "1"" of type '" "phylib_table *""'"); 
+  }
+  arg1 = (phylib_table *)(argp1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_roll_table" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  result = (phylib_table *)phylib_roll_table(arg1,arg2);
+  resultobj = SWIG_NewPointerObj(SWIG_as_voidptr(result), SWIGTYPE_p_phylib_table, 0 |  0 );
+  return resultobj;
+fail:
+  return NULL;
+}
+
+
+SWIGINTERN PyObject *_wrap_phylib_frames(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_table *arg1 = (phylib_table *) 0 ;
+  double arg2 ;
+  int arg3 ;
+  double *arg4 = (double *) 0 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  double val2 ;
+  int ecode2 = 0 ;
+  int val3 ;
+  int ecode3 = 0 ;
+  void *argp4 = 0 ;
+  int res4 = 0 ;
+  PyObject *swig_obj[4] ;
   int result;
   
-  if (!args) SWIG_fail;
-  swig_obj[0] = args;
+  if (!SWIG_Python_UnpackTuple(args, "phylib_frames", 4, 4, swig_obj)) SWIG_fail;
   res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_table, 0 |  0 );
   if (!SWIG_IsOK(res1)) {
-    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "check_collision_condition" "', argument " "1"" of type '" "phylib_table const *""'"); 
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_frames" "', argument " "1"" of type '" "phylib_table *""'"); 
   }
   arg1 = (phylib_table *)(argp1);
-  result = (int)check_collision_condition((phylib_table const *)arg1);
+  ecode2 = SWIG_AsVal_double(swig_obj[1], &val2);
+  if (!SWIG_IsOK(ecode2)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode2), "in method '" "phylib_frames" "', argument " "2"" of type '" "double""'");
+  } 
+  arg2 = (double)(val2);
+  ecode3 = SWIG_AsVal_int(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_frames" "', argument " "3"" of type '" "int""'");
+  } 
+  arg3 = (int)(val3);
+  res4 = SWIG_ConvertPtr(swig_obj[3], &argp4,SWIGTYPE_p_double, 0 |  0 );
+  if (!SWIG_IsOK(res4)) {
+    SWIG_exception_fail(SWIG_ArgError(res4), "in method '" "phylib_frames" "', argument " "4"" of type '" "double *""'"); 
+  }
+  arg4 = (double *)(argp4);
+  result = (int)phylib_frames(arg1,arg2,arg3,arg4);
   resultobj = SWIG_From_int((int)(result));
   return resultobj;
 fail:
@@ -5702,6 +8650,47 @@ fail:
 }
 
 
+SWIGINTERN PyObject *_wrap_phylib_object_string_r(PyObject *self, PyObject *args) {
+  PyObject *resultobj = 0;
+  phylib_object *arg1 = (phylib_object *) 0 ;
+  char *arg2 = (char *) 0 ;
+  size_t arg3 ;
+  void *argp1 = 0 ;
+  int res1 = 0 ;
+  int res2 ;
+  char *buf2 = 0 ;
+  int alloc2 = 0 ;
+  size_t val3 ;
+  int ecode3 = 0 ;
+  PyObject *swig_obj[3] ;
+  char *result = 0 ;
+  
+  if (!SWIG_Python_UnpackTuple(args, "phylib_object_string_r", 3, 3, swig_obj)) SWIG_fail;
+  res1 = SWIG_ConvertPtr(swig_obj[0], &argp1,SWIGTYPE_p_phylib_object, 0 |  0 );
+  if (!SWIG_IsOK(res1)) {
+    SWIG_exception_fail(SWIG_ArgError(res1), "in method '" "phylib_object_string_r" "', argument " "1"" of type '" "phylib_object *""'"); 
+  }
+  arg1 = (phylib_object *)(argp1);
+  res2 = SWIG_AsCharPtrAndSize(swig_obj[1], &buf2, NULL, &alloc2);
+  if (!SWIG_IsOK(res2)) {
+    SWIG_exception_fail(SWIG_ArgError(res2), "in method '" "phylib_object_string_r" "', argument " "2"" of type '" "char *""'");
+  }
+  arg2 = (char *)(buf2);
+  ecode3 = SWIG_AsVal_size_t(swig_obj[2], &val3);
+  if (!SWIG_IsOK(ecode3)) {
+    SWIG_exception_fail(SWIG_ArgError(ecode3), "in method '" "phylib_object_string_r" "', argument " "3"" of type '" "size_t""'");
+  } 
+  arg3 = (size_t)(val3);
+  result = (char *)phylib_object_string_r(arg1,arg2,arg3);
+  resultobj = SWIG_FromCharPtr((const char *)result);
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return resultobj;
+fail:
+  if (alloc2 == SWIG_NEWOBJ) free((char*)buf2);
+  return NULL;
+}
+
+
 static PyMethodDef SwigMethods[] = {
 	 { "phylib_coord_x_set", _wrap_phylib_coord_x_set, METH_VARARGS, NULL},
 	 { "phylib_coord_x_get", _wrap_phylib_coord_x_get, METH_O, NULL},
@@ -5772,27 +8761,104 @@ static PyMethodDef SwigMethods[] = {
 	 { "delete_phylib_object", _wrap_delete_phylib_object, METH_O, NULL},
 	 { "phylib_object_swigregister", phylib_object_swigregister, METH_O, NULL},
 	 { "phylib_object_swiginit", phylib_object_swiginit, METH_VARARGS, NULL},
+	 { "phylib_stats_segments_set", _wrap_phylib_stats_segments_set, METH_VARARGS, NULL},
+	 { "phylib_stats_segments_get", _wrap_phylib_stats_segments_get, METH_O, NULL},
+	 { "phylib_stats_steps_set", _wrap_phylib_stats_steps_set, METH_VARARGS, NULL},
+	 { "phylib_stats_steps_get", _wrap_phylib_stats_steps_get, METH_O, NULL},
+	 { "phylib_stats_narrow_set", _wrap_phylib_stats_narrow_set, METH_VARARGS, NULL},
+	 { "phylib_stats_narrow_get", _wrap_phylib_stats_narrow_get, METH_O, NULL},
+	 { "phylib_stats_stops_set", _wrap_phylib_stats_stops_set, METH_VARARGS, NULL},
+	 { "phylib_stats_stops_get", _wrap_phylib_stats_stops_get, METH_O, NULL},
+	 { "phylib_stats_still_bounces_set", _wrap_phylib_stats_still_bounces_set, METH_VARARGS, NULL},
+	 { "phylib_stats_still_bounces_get", _wrap_phylib_stats_still_bounces_get, METH_O, NULL},
+	 { "phylib_stats_rolling_bounces_set", _wrap_phylib_stats_rolling_bounces_set, METH_VARARGS, NULL},
+	 { "phylib_stats_rolling_bounces_get", _wrap_phylib_stats_rolling_bounces_get, METH_O, NULL},
+	 { "phylib_stats_hole_bounces_set", _wrap_phylib_stats_hole_bounces_set, METH_VARARGS, NULL},
+	 { "phylib_stats_hole_bounces_get", _wrap_phylib_stats_hole_bounces_get, METH_O, NULL},
+	 { "phylib_stats_hcushion_bounces_set", _wrap_phylib_stats_hcushion_bounces_set, METH_VARARGS, NULL},
+	 { "phylib_stats_hcushion_bounces_get", _wrap_phylib_stats_hcushion_bounces_get, METH_O, NULL},
+	 { "phylib_stats_vcushion_bounces_set", _wrap_phylib_stats_vcushion_bounces_set, METH_VARARGS, NULL},
+	 { "phylib_stats_vcushion_bounces_get", _wrap_phylib_stats_vcushion_bounces_get, METH_O, NULL},
+	 { "phylib_stats_allocations_set", _wrap_phylib_stats_allocations_set, METH_VARARGS, NULL},
+	 { "phylib_stats_allocations_get", _wrap_phylib_stats_allocations_get, METH_O, NULL},
+	 { "phylib_stats_seconds_set", _wrap_phylib_stats_seconds_set, METH_VARARGS, NULL},
+	 { "phylib_stats_seconds_get", _wrap_phylib_stats_seconds_get, METH_O, NULL},
+	 { "new_phylib_stats", _wrap_new_phylib_stats, METH_NOARGS, NULL},
+	 { "delete_phylib_stats", _wrap_delete_phylib_stats, METH_O, NULL},
+	 { "phylib_stats_swigregister", phylib_stats_swigregister, METH_O, NULL},
+	 { "phylib_stats_swiginit", phylib_stats_swiginit, METH_VARARGS, NULL},
 	 { "phylib_table_time_set", _wrap_phylib_table_time_set, METH_VARARGS, NULL},
 	 { "phylib_table_time_get", _wrap_phylib_table_time_get, METH_O, NULL},
-	 { "phylib_table_object_set", _wrap_phylib_table_object_set, METH_VARARGS, NULL},
 	 { "phylib_table_object_get", _wrap_phylib_table_object_get, METH_O, NULL},
-	 { "new_phylib_table", _wrap_new_phylib_table, METH_NOARGS, NULL},
+	 { "phylib_table_capacity_get", _wrap_phylib_table_capacity_get, METH_O, NULL},
+	 { "phylib_table_count_get", _wrap_phylib_table_count_get, METH_O, NULL},
+	 { "phylib_table_slots_get", _wrap_phylib_table_slots_get, METH_O, NULL},
+	 { "phylib_table_chunks_get", _wrap_phylib_table_chunks_get, METH_O, NULL},
+	 { "phylib_table_ball_slot_set", _wrap_phylib_table_ball_slot_set, METH_VARARGS, NULL},
+	 { "phylib_table_ball_slot_get", _wrap_phylib_table_ball_slot_get, METH_O, NULL},
+	 { "new_phylib_table", _wrap_new_phylib_table, METH_VARARGS, NULL},
 	 { "phylib_table_copy", _wrap_phylib_table_copy, METH_O, NULL},
-	 { "phylib_table_segment", _wrap_phylib_table_segment, METH_O, NULL},
+	 { "phylib_table_segment", _wrap_phylib_table_segment, METH_VARARGS, NULL},
+	 { "phylib_table_simulate_batch", _wrap_phylib_table_simulate_batch, METH_VARARGS, NULL},
+	 { "phylib_table_roll_table", _wrap_phylib_table_roll_table, METH_VARARGS, NULL},
+	 { "phylib_table_frames", _wrap_phylib_table_frames, METH_VARARGS, NULL},
+	 { "phylib_table_fixture_count", _wrap_phylib_table_fixture_count, METH_O, NULL},
+	 { "phylib_table_balls", _wrap_phylib_table_balls, METH_O, NULL},
+	 { "phylib_table_ball", _wrap_phylib_table_ball, METH_VARARGS, NULL},
+	 { "phylib_table_pocketed", _wrap_phylib_table_pocketed, METH_O, NULL},
+	 { "phylib_table_stats", _wrap_phylib_table_stats, METH_O, NULL},
 	 { "phylib_table_get_object", _wrap_phylib_table_get_object, METH_VARARGS, NULL},
 	 { "phylib_table_add_object", _wrap_phylib_table_add_object, METH_VARARGS, NULL},
 	 { "delete_phylib_table", _wrap_delete_phylib_table, METH_O, NULL},
 	 { "phylib_table_swigregister", phylib_table_swigregister, METH_O, NULL},
 	 { "phylib_table_swiginit", phylib_table_swiginit, METH_VARARGS, NULL},
+	 { "phylib_soa_n_set", _wrap_phylib_soa_n_set, METH_VARARGS, NULL},
+	 { "phylib_soa_n_get", _wrap_phylib_soa_n_get, METH_O, NULL},
+	 { "phylib_soa_slot_set", _wrap_phylib_soa_slot_set, METH_VARARGS, NULL},
+	 { "phylib_soa_slot_get", _wrap_phylib_soa_slot_get, METH_O, NULL},
+	 { "phylib_soa_type_set", _wrap_phylib_soa_type_set, METH_VARARGS, NULL},
+	 { "phylib_soa_type_get", _wrap_phylib_soa_type_get, METH_O, NULL},
+	 { "phylib_soa_px_set", _wrap_phylib_soa_px_set, METH_VARARGS, NULL},
+	 { "phylib_soa_px_get", _wrap_phylib_soa_px_get, METH_O, NULL},
+	 { "phylib_soa_py_set", _wrap_phylib_soa_py_set, METH_VARARGS, NULL},
+	 { "phylib_soa_py_get", _wrap_phylib_soa_py_get, METH_O, NULL},
+	 { "phylib_soa_vx_set", _wrap_phylib_soa_vx_set, METH_VARARGS, NULL},
+	 { "phylib_soa_vx_get", _wrap_phylib_soa_vx_get, METH_O, NULL},
+	 { "phylib_soa_vy_set", _wrap_phylib_soa_vy_set, METH_VARARGS, NULL},
+	 { "phylib_soa_vy_get", _wrap_phylib_soa_vy_get, METH_O, NULL},
+	 { "phylib_soa_ax_set", _wrap_phylib_soa_ax_set, METH_VARARGS, NULL},
+	 { "phylib_soa_ax_get", _wrap_phylib_soa_ax_get, METH_O, NULL},
+	 { "phylib_soa_ay_set", _wrap_phylib_soa_ay_set, METH_VARARGS, NULL},
+	 { "phylib_soa_ay_get", _wrap_phylib_soa_ay_get, METH_O, NULL},
+	 { "new_phylib_soa", _wrap_new_phylib_soa, METH_NOARGS, NULL},
+	 { "delete_phylib_soa", _wrap_delete_phylib_soa, METH_O, NULL},
+	 { "phylib_soa_swigregister", phylib_soa_swigregister, METH_O, NULL},
+	 { "phylib_soa_swiginit", phylib_soa_swiginit, METH_VARARGS, NULL},
+	 { "phylib_broadphase_nballs_set", _wrap_phylib_broadphase_nballs_set, METH_VARARGS, NULL},
+	 { "phylib_broadphase_nballs_get", _wrap_phylib_broadphase_nballs_get, METH_O, NULL},
+	 { "phylib_broadphase_nfixed_set", _wrap_phylib_broadphase_nfixed_set, METH_VARARGS, NULL},
+	 { "phylib_broadphase_nfixed_get", _wrap_phylib_broadphase_nfixed_get, METH_O, NULL},
+	 { "phylib_broadphase_ball_set", _wrap_phylib_broadphase_ball_set, METH_VARARGS, NULL},
+	 { "phylib_broadphase_ball_get", _wrap_phylib_broadphase_ball_get, METH_O, NULL},
+	 { "phylib_broadphase_fixed_set", _wrap_phylib_broadphase_fixed_set, METH_VARARGS, NULL},
+	 { "phylib_broadphase_fixed_get", _wrap_phylib_broadphase_fixed_get, METH_O, NULL},
+	 { "phylib_broadphase_rank_set", _wrap_phylib_broadphase_rank_set, METH_VARARGS, NULL},
+	 { "phylib_broadphase_rank_get", _wrap_phylib_broadphase_rank_get, METH_O, NULL},
+	 { "new_phylib_broadphase", _wrap_new_phylib_broadphase, METH_NOARGS, NULL},
+	 { "delete_phylib_broadphase", _wrap_delete_phylib_broadphase, METH_O, NULL},
+	 { "phylib_broadphase_swigregister", phylib_broadphase_swigregister, METH_O, NULL},
+	 { "phylib_broadphase_swiginit", phylib_broadphase_swiginit, METH_VARARGS, NULL},
 	 { "phylib_new_still_ball", _wrap_phylib_new_still_ball, METH_VARARGS, NULL},
 	 { "phylib_new_rolling_ball", _wrap_phylib_new_rolling_ball, METH_VARARGS, NULL},
 	 { "phylib_new_hole", _wrap_phylib_new_hole, METH_O, NULL},
 	 { "phylib_new_hcushion", _wrap_phylib_new_hcushion, METH_O, NULL},
 	 { "phylib_new_vcushion", _wrap_phylib_new_vcushion, METH_O, NULL},
 	 { "phylib_new_table", _wrap_phylib_new_table, METH_NOARGS, NULL},
+	 { "phylib_new_table_capacity", _wrap_phylib_new_table_capacity, METH_O, NULL},
 	 { "phylib_copy_object", _wrap_phylib_copy_object, METH_VARARGS, NULL},
 	 { "phylib_copy_table", _wrap_phylib_copy_table, METH_O, NULL},
 	 { "phylib_add_object", _wrap_phylib_add_object, METH_VARARGS, NULL},
+	 { "phylib_add_object_copy", _wrap_phylib_add_object_copy, METH_VARARGS, NULL},
 	 { "phylib_free_table", _wrap_phylib_free_table, METH_O, NULL},
 	 { "phylib_sub", _wrap_phylib_sub, METH_VARARGS, NULL},
 	 { "phylib_length", _wrap_phylib_length, METH_O, NULL},
@@ -5806,7 +8872,28 @@ static PyMethodDef SwigMethods[] = {
 	 { "update_rolling_balls", _wrap_update_rolling_balls, METH_VARARGS, NULL},
 	 { "check_stopped_condition", _wrap_check_stopped_condition, METH_O, NULL},
 	 { "check_collision_condition", _wrap_check_collision_condition, METH_O, NULL},
+	 { "phylib_soa_init", _wrap_phylib_soa_init, METH_VARARGS, NULL},
+	 { "phylib_soa_store", _wrap_phylib_soa_store, METH_VARARGS, NULL},
+	 { "phylib_soa_roll", _wrap_phylib_soa_roll, METH_VARARGS, NULL},
+	 { "phylib_soa_stopped", _wrap_phylib_soa_stopped, METH_O, NULL},
+	 { "phylib_soa_free", _wrap_phylib_soa_free, METH_O, NULL},
+	 { "phylib_broadphase_init", _wrap_phylib_broadphase_init, METH_VARARGS, NULL},
+	 { "phylib_broadphase_free", _wrap_phylib_broadphase_free, METH_O, NULL},
+	 { "phylib_broadphase_collision", _wrap_phylib_broadphase_collision, METH_VARARGS, NULL},
+	 { "phylib_segment_event", _wrap_phylib_segment_event, METH_O, NULL},
+	 { "phylib_segment_solver", _wrap_phylib_segment_solver, METH_VARARGS, NULL},
+	 { "phylib_segment_contact", _wrap_phylib_segment_contact, METH_VARARGS, NULL},
+	 { "phylib_profile", _wrap_phylib_profile, METH_O, NULL},
+	 { "phylib_simulate_batch", _wrap_phylib_simulate_batch, METH_VARARGS, NULL},
+	 { "phylib_simulate_batch_parallel", _wrap_phylib_simulate_batch_parallel, METH_VARARGS, NULL},
+	 { "phylib_workers", _wrap_phylib_workers, METH_NOARGS, NULL},
+	 { "phylib_find_ball", _wrap_phylib_find_ball, METH_VARARGS, NULL},
+	 { "phylib_pocketed", _wrap_phylib_pocketed, METH_VARARGS, NULL},
+	 { "phylib_ball_count", _wrap_phylib_ball_count, METH_O, NULL},
+	 { "phylib_roll_table", _wrap_phylib_roll_table, METH_VARARGS, NULL},
+	 { "phylib_frames", _wrap_phylib_frames, METH_VARARGS, NULL},
 	 { "phylib_object_string", _wrap_phylib_object_string, METH_O, NULL},
+	 { "phylib_object_string_r", _wrap_phylib_object_string_r, METH_VARARGS, NULL},
 	 { NULL, NULL, 0, NULL }
 };
 
@@ -5814,59 +8901,91 @@ static PyMethodDef SwigMethods[] = {
 /* -------- TYPE CONVERSION AND EQUIVALENCE RULES (BEGIN) -------- */
 
 static swig_type_info _swigt__p_char = {"_p_char", "char *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_double = {"_p_double", "double *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_int = {"_p_int", "int *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_p_phylib_object = {"_p_p_phylib_object", "phylib_object **", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_phylib_broadphase = {"_p_phylib_broadphase", "phylib_broadphase *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_phylib_chunk = {"_p_phylib_chunk", "struct phylib_chunk *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_coord = {"_p_phylib_coord", "phylib_coord *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_hcushion = {"_p_phylib_hcushion", "phylib_hcushion *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_hole = {"_p_phylib_hole", "phylib_hole *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_obj = {"_p_phylib_obj", "phylib_obj *|enum phylib_obj *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_object = {"_p_phylib_object", "phylib_object *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_rolling_ball = {"_p_phylib_rolling_ball", "phylib_rolling_ball *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_phylib_soa = {"_p_phylib_soa", "phylib_soa *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_phylib_solver = {"_p_phylib_solver", "phylib_solver *|enum phylib_solver *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_phylib_stats = {"_p_phylib_stats", "phylib_stats *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_still_ball = {"_p_phylib_still_ball", "phylib_still_ball *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_table = {"_p_phylib_table", "phylib_table *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_untyped = {"_p_phylib_untyped", "phylib_untyped *", 0, 0, (void*)0, 0};
 static swig_type_info _swigt__p_phylib_vcushion = {"_p_phylib_vcushion", "phylib_vcushion *", 0, 0, (void*)0, 0};
+static swig_type_info _swigt__p_unsigned_char = {"_p_unsigned_char", "unsigned char *", 0, 0, (void*)0, 0};
 
 static swig_type_info *swig_type_initial[] = {
   &_swigt__p_char,
+  &_swigt__p_double,
+  &_swigt__p_int,
   &_swigt__p_p_phylib_object,
+  &_swigt__p_phylib_broadphase,
+  &_swigt__p_phylib_chunk,
   &_swigt__p_phylib_coord,
   &_swigt__p_phylib_hcushion,
   &_swigt__p_phylib_hole,
   &_swigt__p_phylib_obj,
   &_swigt__p_phylib_object,
   &_swigt__p_phylib_rolling_ball,
+  &_swigt__p_phylib_soa,
+  &_swigt__p_phylib_solver,
+  &_swigt__p_phylib_stats,
   &_swigt__p_phylib_still_ball,
   &_swigt__p_phylib_table,
   &_swigt__p_phylib_untyped,
   &_swigt__p_phylib_vcushion,
+  &_swigt__p_unsigned_char,
 };
 
 static swig_cast_info _swigc__p_char[] = {  {&_swigt__p_char, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_double[] = {  {&_swigt__p_double, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_int[] = {  {&_swigt__p_int, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_p_phylib_object[] = {  {&_swigt__p_p_phylib_object, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_phylib_broadphase[] = {  {&_swigt__p_phylib_broadphase, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_phylib_chunk[] = {  {&_swigt__p_phylib_chunk, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_coord[] = {  {&_swigt__p_phylib_coord, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_hcushion[] = {  {&_swigt__p_phylib_hcushion, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_hole[] = {  {&_swigt__p_phylib_hole, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_obj[] = {  {&_swigt__p_phylib_obj, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_object[] = {  {&_swigt__p_phylib_object, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_rolling_ball[] = {  {&_swigt__p_phylib_rolling_ball, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_phylib_soa[] = {  {&_swigt__p_phylib_soa, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_phylib_solver[] = {  {&_swigt__p_phylib_solver, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_phylib_stats[] = {  {&_swigt__p_phylib_stats, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_still_ball[] = {  {&_swigt__p_phylib_still_ball, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_table[] = {  {&_swigt__p_phylib_table, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_untyped[] = {  {&_swigt__p_phylib_untyped, 0, 0, 0},{0, 0, 0, 0}};
 static swig_cast_info _swigc__p_phylib_vcushion[] = {  {&_swigt__p_phylib_vcushion, 0, 0, 0},{0, 0, 0, 0}};
+static swig_cast_info _swigc__p_unsigned_char[] = {  {&_swigt__p_unsigned_char, 0, 0, 0},{0, 0, 0, 0}};
 
 static swig_cast_info *swig_cast_initial[] = {
   _swigc__p_char,
+  _swigc__p_double,
+  _swigc__p_int,
   _swigc__p_p_phylib_object,
+  _swigc__p_phylib_broadphase,
+  _swigc__p_phylib_chunk,
   _swigc__p_phylib_coord,
   _swigc__p_phylib_hcushion,
   _swigc__p_phylib_hole,
   _swigc__p_phylib_obj,
   _swigc__p_phylib_object,
   _swigc__p_phylib_rolling_ball,
+  _swigc__p_phylib_soa,
+  _swigc__p_phylib_solver,
+  _swigc__p_phylib_stats,
   _swigc__p_phylib_still_ball,
   _swigc__p_phylib_table,
   _swigc__p_phylib_untyped,
   _swigc__p_phylib_vcushion,
+  _swigc__p_unsigned_char,
 };
 
 
@@ -6343,12 +9462,19 @@ SWIG_init(void) {
   SWIG_Python_SetConstant(d, "PHYLIB_DRAG",SWIG_From_double((double)((150.0))));
   SWIG_Python_SetConstant(d, "PHYLIB_MAX_TIME",SWIG_From_int((int)((600))));
   SWIG_Python_SetConstant(d, "PHYLIB_MAX_OBJECTS",SWIG_From_int((int)((26))));
+  SWIG_Python_SetConstant(d, "PHYLIB_INDEXED_BALLS",SWIG_From_int((int)((256))));
   SWIG_Python_SetConstant(d, "FRAME_RATE",SWIG_From_double((double)((0.01))));
+  SWIG_Python_SetConstant(d, "PHYLIB_FRAME_FIELDS",SWIG_From_int((int)((6))));
   SWIG_Python_SetConstant(d, "PHYLIB_STILL_BALL",SWIG_From_int((int)(PHYLIB_STILL_BALL)));
   SWIG_Python_SetConstant(d, "PHYLIB_ROLLING_BALL",SWIG_From_int((int)(PHYLIB_ROLLING_BALL)));
   SWIG_Python_SetConstant(d, "PHYLIB_HOLE",SWIG_From_int((int)(PHYLIB_HOLE)));
   SWIG_Python_SetConstant(d, "PHYLIB_HCUSHION",SWIG_From_int((int)(PHYLIB_HCUSHION)));
   SWIG_Python_SetConstant(d, "PHYLIB_VCUSHION",SWIG_From_int((int)(PHYLIB_VCUSHION)));
+  SWIG_Python_SetConstant(d, "PHYLIB_SOLVER_STEP",SWIG_From_int((int)(PHYLIB_SOLVER_STEP)));
+  SWIG_Python_SetConstant(d, "PHYLIB_SOLVER_EVENT",SWIG_From_int((int)(PHYLIB_SOLVER_EVENT)));
+  
+  /* Initialize threading */
+  SWIG_PYTHON_INITIALIZE_THREADS;
 #if PY_VERSION_HEX >= 0x03000000
   return m;
 #else
@@ -1,7 +1,13 @@
 import sys
 import math
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import queue
+import hashlib
 import json
+from collections import OrderedDict, deque
+from urllib.parse import parse_qs
 import xml.etree.ElementTree as ET
 import phylib
 import Physics
@@ -10,9 +16,301 @@ import os
 # Constants
 VEL_EPSILON = 0.0001
 DRAG = 0.01
+SIM_WORKERS = os.cpu_count() or 1  # shots simulated at once
+SIM_QUEUE = 16  # shots waiting for a worker before new ones are turned away
+STREAM_FRAMES = 64  # frames rendered ahead of a slow /shoot/stream client
+SHOT_CACHE_BYTES = 64 * 1024 * 1024  # rendered /svg_info payloads kept in memory
+SIM_CACHE_PATH = None  # a file such as "simulations.db" keeps simulated shots across restarts
 
-# Create an instance of the Game class with constructor arguments
-game_instance = Physics.Game(gameID=None, gameName="Example", player1Name="Player1", player2Name="Player2")
+# Create an instance of the Game class with constructor arguments; shots
+# played before from the same table are taken from simulation_cache
+simulation_cache = Physics.SimulationCache(path=SIM_CACHE_PATH)
+game_instance = Physics.Game(gameID=None, gameName="Example", player1Name="Player1", player2Name="Player2",
+                             cache=simulation_cache)
+
+class Simulations:
+    """
+    The bounded pool shots are played on, off the request threads, so
+    that a shot in flight never holds up pages or other clients.  At most
+    workers shots are simulated at once and at most queue more wait for a
+    worker; submit returns None instead of queueing any further.  Shots
+    of one game are played one at a time, in the order they arrive, and
+    shots of different games side by side (phylib drops the GIL while it
+    simulates).
+    """
+
+    def __init__(self, workers=SIM_WORKERS, queue=SIM_QUEUE):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shot")
+        self.slots = threading.Semaphore(workers + queue)
+        self.lock = threading.Lock()
+        # the shots waiting for the one being played of each game; a game
+        # is here only while one of its shots is with the executor, so a
+        # worker never waits for another shot of the same game
+        self.games = {}
+
+    def submit(self, gameName, fn, *args):
+        """
+        A Future for fn(*args), handed to the executor once the shots of
+        gameName before it are done, or None if the queue is full.
+        """
+        if not self.slots.acquire(blocking=False):
+            return None
+        shot = Future()
+        with self.lock:
+            if gameName in self.games:
+                self.games[gameName].append((shot, fn, args))
+                return shot
+            self.games[gameName] = deque()
+        self.start(gameName, shot, fn, args)
+        return shot
+
+    def start(self, gameName, shot, fn, args):
+        def run():
+            try:
+                if shot.set_running_or_notify_cancel():
+                    try:
+                        shot.set_result(fn(*args))
+                    except BaseException as error:
+                        shot.set_exception(error)
+            finally:
+                self.slots.release()
+                self.next(gameName)
+
+        try:
+            self.executor.submit(run)
+        except BaseException as error:  # the executor was shut down
+            shot.set_exception(error)
+            self.slots.release()
+            self.next(gameName)
+
+    def next(self, gameName):
+        # hands the next waiting shot of gameName to the executor
+        with self.lock:
+            waiting = self.games[gameName]
+            if not waiting:
+                del self.games[gameName]
+                return
+            shot, fn, args = waiting.popleft()
+        self.start(gameName, shot, fn, args)
+
+simulations = Simulations()
+
+class ShotCache:
+    """
+    The serialized /svg_info payload of each shot, by shot ID, so that
+    replaying a shot does not read and render every frame again.  The
+    least recently used payloads are dropped once they take more than
+    max_bytes, and a payload bigger than max_bytes, or one with no frames
+    (a shot ID with no shot), is not kept at all.  Each payload has an
+    ETag, a hash of its bytes, for If-None-Match.  shot_stored drops the
+    entry for a shot ID as it is (re)written and makes it the latest shot;
+    a payload that was being built at the time is not kept either.
+    """
+
+    def __init__(self, max_bytes=SHOT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # shot ID -> (etag, payload)
+        self.building = {}  # shot ID -> payloads being built for it
+        self.generations = {}  # shot ID -> times it was stored during those builds
+        self.bytes = 0
+        self.latest = None
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def get(self, shotID, build):
+        """
+        The (etag, payload) of shotID, calling build(shotID) for the
+        payload if it is not cached.
+        """
+        with self.lock:
+            entry = self.entries.get(shotID)
+            if entry is not None:
+                self.entries.move_to_end(shotID)
+                self.hits += 1
+                return entry
+            self.misses += 1
+            generation = self.generations.get(shotID, 0)
+            self.building[shotID] = self.building.get(shotID, 0) + 1
+
+        # rendered outside the lock, so other shots are served meanwhile
+        try:
+            payload = build(shotID)
+        finally:
+            with self.lock:
+                stale = self.generations.get(shotID, 0) != generation
+                self.building[shotID] -= 1
+                if self.building[shotID] == 0:
+                    del self.building[shotID]
+                    self.generations.pop(shotID, None)
+        entry = ('"%s"' % hashlib.blake2b(payload, digest_size=16).hexdigest(), payload)
+        if stale or payload == b'[]' or len(payload) > self.max_bytes:
+            return entry  # served, but never kept
+        with self.lock:
+            if shotID in self.entries:
+                self.bytes -= len(self.entries.pop(shotID)[1])
+            self.entries[shotID] = entry
+            self.bytes += len(payload)
+            while self.bytes > self.max_bytes:
+                self.bytes -= len(self.entries.popitem(last=False)[1][1])
+                self.evictions += 1
+        return entry
+
+    def shot_stored(self, shotID):
+        with self.lock:
+            if shotID in self.entries:
+                self.bytes -= len(self.entries.pop(shotID)[1])
+            if shotID in self.building:
+                self.generations[shotID] = self.generations.get(shotID, 0) + 1
+            self.latest = shotID
+
+    def not_modified_sent(self):
+        # counts a 304 sent for a cached payload
+        with self.lock:
+            self.not_modified += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+            }
+
+shot_cache = ShotCache()
+
+def shot_payload(shotID):
+    # the SVG of every frame of the shot as a JSON array
+    with Physics.Database() as db:  # a pooled connection
+        return json.dumps([table.svg() for table in db.readTables(shotID)]).encode('utf-8')
+
+def shot_stored(table_ids):
+    # called once a shot has been written, to keep shot_cache in step
+    if table_ids:
+        with Physics.Database() as db:
+            shotID = db.getShot(table_ids.start)
+        if shotID is not None:
+            shot_cache.shot_stored(shotID)
+
+def table_from_balls(balls):
+    """
+    A Table of still balls from a list of [number, x, y], checked as it is
+    built: numbers are whole and below len(Physics.BALL_COLOURS), each one
+    is used once, the cue ball (0) is there and every ball is on the table.
+    Raises ValueError otherwise.
+    """
+    if not isinstance(balls, list) or len(balls) > len(Physics.BALL_COLOURS):
+        raise ValueError("balls must be a list of at most %d [number, x, y]" % len(Physics.BALL_COLOURS))
+    table = Physics.Table()
+    seen = set()
+    for ball in balls:
+        if not isinstance(ball, list) or len(ball) != 3:
+            raise ValueError("each ball must be [number, x, y]")
+        number, x, y = ball
+        if type(number) is not int or not 0 <= number < len(Physics.BALL_COLOURS) or number in seen:
+            raise ValueError("bad or repeated ball number %r" % (number,))
+        if type(x) not in (int, float) or type(y) not in (int, float) or \
+           not (0.0 <= x <= Physics.TABLE_WIDTH and 0.0 <= y <= Physics.TABLE_LENGTH):
+            raise ValueError("ball %d is off the table" % number)
+        seen.add(number)
+        table += Physics.StillBall(number, Physics.Coordinate(x, y))
+    if 0 not in seen:
+        raise ValueError("no cue ball")
+    return table
+
+def stored_balls(tableID):
+    """
+    [number, x, y] of each ball on the stored table tableID (numbered like
+    Database.readTable), for table_from_balls.  Raises ValueError if there
+    is no such table.
+    """
+    if type(tableID) is not int or tableID < 0:
+        raise ValueError("bad table ID %r" % (tableID,))
+    with Physics.Database() as db:  # a pooled connection
+        table = db.readTable(tableID)
+    if table is None:
+        raise ValueError("no table %d" % tableID)
+    # both kinds of ball keep number and pos in the same place
+    return [[ball.obj.still_ball.number, ball.obj.still_ball.pos.x, ball.obj.still_ball.pos.y]
+            for ball in table.balls()]
+
+def log_profile(gameName, playerName, table_ids, played):
+    # A line per shot with the phylib profile counters of its simulation
+    # (see Table.stats), when phylib was built with them (make PROFILE=1).
+    # Shots replayed from simulation_cache were not simulated and have none
+    end = played[-1].end if played else None
+    stats = end.stats() if end is not None else None
+    if stats is not None and table_ids:
+        sys.stderr.write("profile %s %s tables %d-%d %s\n" %
+                         (gameName, playerName, table_ids.start, table_ids.stop, json.dumps(stats)))
+
+def play_shot(gameName, playerName, table, xvel, yvel):
+    """
+    Plays the shot and returns the SVG of each of its frames.
+    """
+    segments = game_instance.strike(table, xvel, yvel)
+    table_ids = None
+    if segments is not None:  # None if there is no cue ball
+        played = list(segments)
+        table_ids = game_instance.store(gameName, playerName, played)
+        log_profile(gameName, playerName, table_ids, played)
+    shot_stored(table_ids)
+    data_arr = []
+    if table_ids:  # None if the shot could not be played
+        with Physics.Database() as db:  # a pooled connection
+            # all the frames of the shot in one query
+            data_arr = [table.svg() for table in db.readTableRange(table_ids.start, table_ids.stop)]
+    return data_arr
+
+def stream_shot(gameName, playerName, table, xvel, yvel, events, cancelled, compact=False):
+    """
+    Plays the shot, putting ("frame", svg) on events for each frame as soon
+    as its segment has been simulated, then stores it and puts ("done",
+    table IDs).  events is bounded, so at most STREAM_FRAMES frames wait
+    for the client; once cancelled is set (the client went away) frames
+    are no longer rendered, but the shot is still played out and stored.
+    None is always put last.
+    With compact set, ("start", frame rate and ball colours) comes first
+    and each segment is put as one ("segment", Frames.compact()) instead
+    of an SVG per frame.
+    """
+    def put(event):
+        while not cancelled.is_set():
+            try:
+                events.put(event, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    try:
+        if compact:
+            put(("start", {"rate": Physics.FRAME_RATE, "colours": Physics.BALL_COLOURS}))
+        segments = game_instance.strike(table, xvel, yvel)
+        if segments is None:
+            put(("done", None))
+            return
+        played = []
+        for frames in segments:
+            played.append(frames)
+            if compact:
+                if len(frames) and not cancelled.is_set():
+                    put(("segment", frames.compact()))
+                continue
+            for i in range(len(frames)):
+                if cancelled.is_set():
+                    break
+                put(("frame", frames[i].svg()))
+        table_ids = game_instance.store(gameName, playerName, played)
+        log_profile(gameName, playerName, table_ids, played)
+        shot_stored(table_ids)
+        put(("done", {"start": table_ids.start, "stop": table_ids.stop}))
+    finally:
+        put(None)
 
 class MyHandler(BaseHTTPRequestHandler):
     def do_GET(self):
@@ -26,7 +324,11 @@ class MyHandler(BaseHTTPRequestHandler):
         elif parsed_path.startswith('/table-'):
             self.serve_svg(parsed_path)
         elif parsed_path == '/svg_info':
-            self.send_svg_info()
+            self.send_shot(self.path)
+        elif parsed_path == '/cache_stats':
+            self.send_json(shot_cache.stats())
+        elif parsed_path == '/simulation_stats':
+            self.send_json(simulation_cache.stats())
         else:
             self.handle_not_found(parsed_path)   
 
@@ -36,6 +338,10 @@ class MyHandler(BaseHTTPRequestHandler):
         
         if self.path == '/shoot':
             self.process_shoot_post(post_data)
+        elif self.path == '/shoot/stream':
+            self.process_shoot_stream(post_data)
+        elif self.path == '/shoot/frames':
+            self.process_shoot_stream(post_data, compact=True)
         else:
             self.handle_not_found(self.path)
 
@@ -63,55 +369,160 @@ class MyHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(bytes(f"404 Not Found: {parsed_path}", 'utf-8'))
 
-    def process_shoot_post(self, post_data):
+    def parse_shot(self, post_data):
+        # the game, player, table and cue ball velocity a shot request asks
+        # for; the table is "balls", a list of [number, x, y], or "table",
+        # the ID of a stored table (the last frame of the shot before), and
+        # only if neither is given the "svg" of the page, which is parsed as
+        # XML.  Raises ValueError for a request that does not make sense,
+        # such as a game or player the database does not have
         post_data = json.loads(post_data.decode('utf-8'))  # Parse JSON data
-        velocityX = -float(post_data.get('velocityX', 0))
-        velocityY = -float(post_data.get('velocityY', 0))
-        svg_data = post_data.get('svg', '')
-
-        # Calculate speed
-        speed = math.sqrt(velocityX ** 2 + velocityY ** 2)
+        if not isinstance(post_data, dict):
+            raise ValueError("expected a JSON object")
+        velocityX = post_data.get('velocityX', 0)
+        velocityY = post_data.get('velocityY', 0)
+        if type(velocityX) not in (int, float) or type(velocityY) not in (int, float):
+            raise ValueError("velocity must be a number")
+        try:
+            velocityX, velocityY = -float(velocityX), -float(velocityY)
+        except OverflowError:  # an int too big for a float
+            raise ValueError("velocity must be finite")
+        if not (math.isfinite(velocityX) and math.isfinite(velocityY)):
+            raise ValueError("velocity must be finite")
 
-        # Compute acceleration with drag
-        if speed > VEL_EPSILON:
-            acceleration_x = -velocityX / speed * DRAG
-            acceleration_y = -velocityY / speed * DRAG
+        if 'balls' in post_data:
+            tablee = table_from_balls(post_data['balls'])
+        elif 'table' in post_data:
+            tablee = table_from_balls(stored_balls(post_data['table']))
         else:
-            acceleration_x = 0.0
-            acceleration_y = 0.0
-
-        # Parse SVG data
-        tablee = self.parse_svg(svg_data)
-        print("hello")
-        print(tablee)
-        # Perform shoot action in the game instance
-        game_instance.shoot(gameName='Example' ,playerName='Player1', table=tablee, xvel=velocityX, yvel=velocityY)
-        self.send_svg_info()
-
-    def send_svg_info(self):
-        # Retrieve SVG information array
-        db = Physics.Database();
-        data_arr = []
-        table_id = 2;
-        table = db.readTable( table_id );
-
-        while table:
-            svgdat = table.svg()
-            data_arr.append(svgdat)
-            table_id += 1;
-            table = db.readTable( table_id );
-            if not table:
-                break;
+            tablee = self.parse_svg(post_data.get('svg', ''))
+        gameName = str(post_data.get('gameName', 'Example'))
+        playerName = str(post_data.get('playerName', 'Player1'))
+        # checked now, not once the shot has been played and is stored
+        with Physics.Database() as db:  # a pooled connection
+            db.findPlayer(gameName, playerName)
+        return gameName, playerName, tablee, velocityX, velocityY
 
+    def process_shoot_post(self, post_data):
+        try:
+            gameName, playerName, tablee, velocityX, velocityY = self.parse_shot(post_data)
+        except (ValueError, ET.ParseError) as error:
+            self.send_bad_request(error)
+            return
+        # Perform shoot action in the game instance, on the simulation pool
+        shot = simulations.submit(gameName, play_shot, gameName, playerName, tablee, velocityX, velocityY)
+        if shot is None:
+            self.send_busy()
+            return
+        try:
+            data_arr = shot.result()
+        except Exception as error:
+            self.send_server_error(error)
+            return
+        self.send_svg_info(data_arr)
+
+    def process_shoot_stream(self, post_data, compact=False):
+        # Sends the frames of the shot as Server-Sent Events while it is
+        # still being played: a "frame" event holding each frame's SVG as
+        # a JSON string, then a "done" event with the shot's table IDs.
+        # /shoot/frames (compact) sends a "start" event and then a
+        # "segment" event of ball positions per segment instead; see
+        # Frames.compact
+        try:
+            gameName, playerName, tablee, velocityX, velocityY = self.parse_shot(post_data)
+        except (ValueError, ET.ParseError) as error:
+            self.send_bad_request(error)
+            return
+        events = queue.Queue(STREAM_FRAMES)
+        cancelled = threading.Event()
+        shot = simulations.submit(gameName, stream_shot, gameName, playerName, tablee, velocityX, velocityY,
+                                  events, cancelled, compact)
+        if shot is None:
+            self.send_busy()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        try:
+            while True:
+                event = events.get()
+                if event is None:
+                    break
+                data = json.dumps(event[1], separators=(',', ':'))
+                self.wfile.write(f"event: {event[0]}\ndata: {data}\n\n".encode('utf-8'))
+            if shot.exception() is not None:
+                self.wfile.write(f"event: error\ndata: {json.dumps(str(shot.exception()))}\n\n".encode('utf-8'))
+        except (BrokenPipeError, ConnectionResetError):
+            cancelled.set()  # the shot is still stored
+
+    def send_bad_request(self, error):
+        self.send_response(400)
+        self.send_header('Content-type', 'text/plain')
+        self.end_headers()
+        self.wfile.write(bytes(f"400 Bad Request: {error}", 'utf-8'))
+
+    def send_server_error(self, error):
+        self.send_response(500)
+        self.send_header('Content-type', 'text/plain')
+        self.end_headers()
+        self.wfile.write(bytes(f"500 Internal Server Error: {error}", 'utf-8'))
+
+    def send_busy(self):
+        self.send_response(503)
+        self.send_header('Content-type', 'text/plain')
+        self.send_header('Retry-After', '1')
+        self.end_headers()
+        self.wfile.write(bytes("503 Service Unavailable: too many shots in flight", 'utf-8'))
+
+    def send_shot(self, path):
+        # The cached frames of ?shot=<id>, or of the latest shot; a 304
+        # if the client already has them
+        query = parse_qs(path.partition('?')[2])
+        try:
+            shotID = int(query['shot'][0]) if 'shot' in query else shot_cache.latest
+        except ValueError:
+            self.handle_not_found(path)
+            return
+        if shotID is None:  # no shot played yet
+            self.send_svg_info()
+            return
+
+        etag, payload = shot_cache.get(shotID, shot_payload)
+        if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+            shot_cache.not_modified_sent()
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')  # revalidate with the ETag
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_json(self, data):
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode('utf-8'))
+
+    def send_svg_info(self, data_arr=()):
         # Send SVG information array to the client
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
         self.end_headers()
-        response = json.dumps(data_arr)
+        response = json.dumps(list(data_arr))
 #        print(response)
         self.wfile.write(response.encode('utf-8'))
     
     def parse_svg(self, svg_data):
+        # the fallback for pages that send their SVG: balls are told apart
+        # from holes by their radius and numbered by their fill colour
         root = ET.fromstring(svg_data)
 
         table = Physics.Table()
@@ -145,8 +556,8 @@ class MyHandler(BaseHTTPRequestHandler):
         return table
    
 if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print("Usage: python server.py <port>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python server.py <port> [workers]")
         sys.exit(1)
 
     try:
@@ -155,6 +566,14 @@ if __name__ == '__main__':
         print("Invalid port number")
         sys.exit(1)
 
-    httpd = HTTPServer(('localhost', port), MyHandler)
+    if len(sys.argv) == 3:
+        try:
+            simulations = Simulations(workers=int(sys.argv[2]))
+        except ValueError:
+            print("Invalid worker count")
+            sys.exit(1)
+
+    # a thread per request; the shots themselves run on simulations
+    httpd = ThreadingHTTPServer(('localhost', port), MyHandler)
     print("Server listening on port:", port)
     httpd.serve_forever()